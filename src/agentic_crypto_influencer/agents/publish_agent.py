@@ -1,18 +1,22 @@
+from typing import TYPE_CHECKING
+
 from autogen_agentchat.agents import AssistantAgent  # type: ignore[import]
-from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from src.agentic_crypto_influencer.config.publish_agent_constants import (
     PUBLISH_AGENT_NAME,
     PUBLISH_AGENT_SYSTEM_MESSAGE,
 )
-from src.agentic_crypto_influencer.tools.x import X
+from src.agentic_crypto_influencer.tools.agent_tools import get_duplicate_check_tool, get_post_tool
+
+if TYPE_CHECKING:
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 
 class PublishAgent(AssistantAgent):  # type: ignore[misc]
-    def __init__(self, model_client: OpenAIChatCompletionClient):
+    def __init__(self, model_client: "OpenAIChatCompletionClient"):
         super().__init__(
             name=PUBLISH_AGENT_NAME,
             model_client=model_client,
             system_message=PUBLISH_AGENT_SYSTEM_MESSAGE,
-            tools=[X().post],
+            tools=[get_duplicate_check_tool(), get_post_tool()],
         )
@@ -1,19 +1,25 @@
+from typing import TYPE_CHECKING
+
 from autogen_agentchat.agents import AssistantAgent  # type: ignore[import]
-from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from src.agentic_crypto_influencer.config.summary_agent_constants import (
     SUMMARY_AGENT_NAME,
     SUMMARY_AGENT_SYSTEM_MESSAGE,
 )
-from src.agentic_crypto_influencer.tools.bitvavo_handler import BitvavoHandler
-from src.agentic_crypto_influencer.tools.validator import LengthValidator
+from src.agentic_crypto_influencer.tools.agent_tools import (
+    get_length_validation_tool,
+    get_market_data_tool,
+)
+
+if TYPE_CHECKING:
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 
 class SummaryAgent(AssistantAgent):  # type: ignore[misc]
-    def __init__(self, model_client: OpenAIChatCompletionClient):
+    def __init__(self, model_client: "OpenAIChatCompletionClient"):
         super().__init__(
             name=SUMMARY_AGENT_NAME,
             model_client=model_client,
             system_message=SUMMARY_AGENT_SYSTEM_MESSAGE,
-            tools=[LengthValidator.validate_length, BitvavoHandler().get_market_data],
+            tools=[get_length_validation_tool(), get_market_data_tool()],
         )
@@ -5,12 +5,15 @@ Contains numeric constants, limits, and other application settings.
 
 # Character Limits
 MAX_TWEET_LENGTH = 280
+# X counts code points in these ranges (Latin, common punctuation) as 1 and all others as 2
+TWEET_LIGHT_CODEPOINT_RANGES = ((0, 4351), (8192, 8205), (8208, 8223), (8242, 8247))
 MIN_STRING_LENGTH_DEFAULT = 1
 
 # Time Constants (in seconds)
 TIMEOUT_DEFAULT = 30
 RETRY_DELAY_DEFAULT = 1
 RETRY_MAX_ATTEMPTS_DEFAULT = 3
+RETRY_MAX_DELAY = 30.0  # cap on computed exponential backoff
 
 # Cache and Storage Limits
 MAX_ACTIVITIES_CACHE = 50
@@ -29,11 +32,27 @@ CIRCUIT_BREAKER_HALF_OPEN_TIMEOUT = 30  # seconds
 LOG_LEVEL_DEFAULT = "INFO"
 LOG_FORMAT_JSON = "json"
 LOG_FORMAT_CONSOLE = "console"
+LOG_QUEUE_MAX_SIZE = 10_000  # records buffered for the background file writer
 
 # Validation Patterns
 PATTERN_EMAIL = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
 PATTERN_URL_SCHEME = r"^https?://"
 PATTERN_API_KEY_MIN_LENGTH = 10
+PATTERN_USER_ID = r"^[a-zA-Z0-9_-]+$"
+
+# HTTP Connection Pooling
+HTTP_POOL_CONNECTIONS = 10  # distinct hosts kept in the pool
+HTTP_POOL_MAXSIZE = 20  # keep-alive connections per host
+
+# Tool Execution
+TOOL_EXECUTOR_MAX_WORKERS = 16  # threads shared by all blocking agent tools
+TOOL_EXECUTOR_THREAD_PREFIX = "tool"
+
+# Frontend Broadcasting
+BROADCAST_QUEUE_MAX_SIZE = 1_000  # workflow activities buffered for the Redis writer
+BROADCAST_BATCH_SIZE = 64  # activities written per pipelined Redis round trip
+BROADCAST_BACKLOG_MAX_SIZE = 200  # newest activities kept in Redis for the dashboard
+BROADCAST_FLUSH_TIMEOUT = 5.0  # seconds to drain pending activities on shutdown
 
 # HTTP Status Codes
 HTTP_STATUS_OK = 200
@@ -52,6 +71,14 @@ ENV_VAR_FLASK_SECRET = "FLASK_SECRET_KEY"  # nosec B105
 # Market Data
 DEFAULT_MARKET_SYMBOL = "BTC-EUR"
 MARKET_DATA_CACHE_DURATION = 60  # 1 minute
+MARKET_TICKER_CACHE_TTL = 2.0  # seconds a fetched ticker price is reused
+MARKET_TICKER_CACHE_MAX_SIZE = 64  # markets kept in the ticker cache
+
+# Duplicate Detection
+SIMHASH_NGRAM_SIZE = 3  # character shingle length
+SIMHASH_MAX_DISTANCE = 6  # max differing bits for a near-duplicate tweet
+SIMHASH_WINDOW = 30 * 24 * 60 * 60  # seconds a published tweet blocks near-duplicates
+SIMHASH_MAX_STORED = 1_000  # newest published hashes kept for the duplicate scan
 
 # Agent Names (moved from individual files for consistency)
 AGENT_NAME_SEARCH = "SearchAgent"
@@ -46,6 +46,17 @@ ERROR_BITVAVO_CONNECTION = "Failed to connect to Bitvavo API"
 ERROR_BITVAVO_MARKET_DATA = "Failed to fetch market data"
 ERROR_BITVAVO_INVALID_MARKET = "Invalid market symbol"
 
+# User-facing Error Message Templates (%-style fields filled from the error context)
+USER_MESSAGE_DEFAULT = "An unexpected error occurred. Please try again later."
+USER_MESSAGE_API = "Service temporarily unavailable (%(service)s). Please try again later."
+USER_MESSAGE_CONNECTION = "Unable to connect to %(service)s. Please check your connection."
+USER_MESSAGE_VALIDATION = "Invalid %(field)s. Please check your input and try again."
+USER_MESSAGE_CONFIGURATION = "Configuration error: %(config_name)s. Please check your settings."
+USER_MESSAGE_WORKFLOW = "Workflow failed at step: %(workflow_step)s. Please try again."
+USER_MESSAGE_DATA_PROCESSING = (
+    "Failed to process %(data_type)s. Please try again with different data."
+)
+
 # Generic Success Messages
 SUCCESS_OPERATION_COMPLETED = "Operation completed successfully"
 SUCCESS_CONNECTION_ESTABLISHED = "Connection established"
@@ -5,56 +5,144 @@ Provides centralized access to all environment variables used throughout the app
 All variables use standardized naming conventions for consistency.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
 import os
+from typing import Final
 
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Default OAuth scopes requested from X
+DEFAULT_X_SCOPES: Final[str] = (
+    "tweet.read tweet.write tweet.moderate.write users.email users.read follows.read "
+    "follows.write offline.access space.read mute.read mute.write like.read like.write "
+    "list.read list.write block.read block.write bookmark.read bookmark.write media.write"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class KeyConfig:
+    """Immutable snapshot of the environment variables read at startup."""
+
+    # Google API Keys
+    google_genai_api_key: str | None
+    google_api_key: str | None
+
+    # X (Twitter) API Configuration
+    x_client_id: str | None
+    x_client_secret: str | None
+    x_api_key: str | None
+    x_api_secret: str | None
+    x_access_token: str | None
+    x_access_token_secret: str | None
+    x_user_id: str | None
+
+    # X API Endpoints
+    x_url: str
+    x_authorize_endpoint: str
+    x_token_endpoint: str
+    x_tweets_endpoint: str
+    x_personalized_trends_endpoint: str
+
+    # OAuth Configuration
+    x_redirect_uri: str
+    x_scopes: str
+
+    # Callback Server Configuration
+    callback_server_host: str
+    callback_server_port: int
+
+    # Database Configuration
+    redis_url: str | None
+
+    # Bitvavo API Configuration
+    bitvavo_api_key: str | None
+    bitvavo_api_secret: str | None
+
+
+def _load_key_config() -> KeyConfig:
+    """Read every environment variable used by the application in one pass."""
+    env = os.environ
+    return KeyConfig(
+        google_genai_api_key=env.get("GOOGLE_GENAI_API_KEY"),
+        google_api_key=env.get("GOOGLE_API_KEY"),
+        x_client_id=env.get("X_CLIENT_ID"),
+        x_client_secret=env.get("X_CLIENT_SECRET"),
+        x_api_key=env.get("X_API_KEY"),
+        x_api_secret=env.get("X_API_SECRET"),
+        x_access_token=env.get("X_ACCESS_TOKEN"),
+        x_access_token_secret=env.get("X_ACCESS_TOKEN_SECRET"),
+        x_user_id=env.get("X_USER_ID"),
+        x_url=env.get("X_URL", "https://api.twitter.com"),
+        x_authorize_endpoint=env.get(
+            "X_AUTHORIZE_ENDPOINT", "https://twitter.com/i/oauth2/authorize"
+        ),
+        x_token_endpoint=env.get("X_TOKEN_ENDPOINT", "https://api.twitter.com/2/oauth2/token"),
+        x_tweets_endpoint=env.get("X_TWEETS_ENDPOINT", "https://api.twitter.com/2/tweets"),
+        x_personalized_trends_endpoint=env.get(
+            "X_PERSONALIZED_TRENDS_ENDPOINT", "https://api.twitter.com/1.1/trends/place.json"
+        ),
+        x_redirect_uri=env.get("X_REDIRECT_URI", "http://localhost:5000/callback"),
+        x_scopes=env.get("X_SCOPES", DEFAULT_X_SCOPES),
+        callback_server_host=env.get("CALLBACK_SERVER_HOST", "127.0.0.1"),
+        callback_server_port=int(env.get("CALLBACK_SERVER_PORT", "5000")),
+        redis_url=env.get("REDIS_URL"),
+        bitvavo_api_key=env.get("BITVAVO_API_KEY"),
+        bitvavo_api_secret=env.get("BITVAVO_API_SECRET"),
+    )
+
+
+KEYS = _load_key_config()
+
 # Environment variable constants with standardized naming
 
 # Google API Keys
-GOOGLE_GENAI_API_KEY = os.getenv("GOOGLE_GENAI_API_KEY")
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+GOOGLE_GENAI_API_KEY = KEYS.google_genai_api_key
+GOOGLE_API_KEY = KEYS.google_api_key
 
 # X (Twitter) API Configuration - Standardized naming
-X_CLIENT_ID = os.getenv("X_CLIENT_ID")
-X_CLIENT_SECRET = os.getenv("X_CLIENT_SECRET")
-X_API_KEY = os.getenv("X_API_KEY")
-X_API_SECRET = os.getenv("X_API_SECRET")
-X_ACCESS_TOKEN = os.getenv("X_ACCESS_TOKEN")
-X_ACCESS_TOKEN_SECRET = os.getenv("X_ACCESS_TOKEN_SECRET")
-X_USER_ID = os.getenv("X_USER_ID")
+X_CLIENT_ID = KEYS.x_client_id
+X_CLIENT_SECRET = KEYS.x_client_secret
+X_API_KEY = KEYS.x_api_key
+X_API_SECRET = KEYS.x_api_secret
+X_ACCESS_TOKEN = KEYS.x_access_token
+X_ACCESS_TOKEN_SECRET = KEYS.x_access_token_secret
+X_USER_ID = KEYS.x_user_id
 
 # X API Endpoints (these remain as constants since they're not configurable)
-X_URL = os.getenv("X_URL", "https://api.twitter.com")
-X_AUTHORIZE_ENDPOINT = os.getenv("X_AUTHORIZE_ENDPOINT", "https://twitter.com/i/oauth2/authorize")
-X_TOKEN_ENDPOINT = os.getenv("X_TOKEN_ENDPOINT", "https://api.twitter.com/2/oauth2/token")
-X_TWEETS_ENDPOINT = os.environ.get("X_TWEETS_ENDPOINT", "https://api.twitter.com/2/tweets")
-X_PERSONALIZED_TRENDS_ENDPOINT = os.getenv(
-    "X_PERSONALIZED_TRENDS_ENDPOINT", "https://api.twitter.com/1.1/trends/place.json"
-)
+X_URL = KEYS.x_url
+X_AUTHORIZE_ENDPOINT = KEYS.x_authorize_endpoint
+X_TOKEN_ENDPOINT = KEYS.x_token_endpoint
+X_TWEETS_ENDPOINT = KEYS.x_tweets_endpoint
+X_PERSONALIZED_TRENDS_ENDPOINT = KEYS.x_personalized_trends_endpoint
 
 # OAuth Configuration
-X_REDIRECT_URI = os.getenv("X_REDIRECT_URI", "http://localhost:5000/callback")
-X_SCOPES = os.getenv(
-    "X_SCOPES",
-    "tweet.read tweet.write tweet.moderate.write users.email users.read follows.read "
-    "follows.write offline.access space.read mute.read mute.write like.read like.write "
-    "list.read list.write block.read block.write bookmark.read bookmark.write media.write",
-)
+X_REDIRECT_URI = KEYS.x_redirect_uri
+X_SCOPES = KEYS.x_scopes
 
 # Callback Server Configuration
-CALLBACK_SERVER_HOST = os.getenv("CALLBACK_SERVER_HOST", "127.0.0.1")
-CALLBACK_SERVER_PORT = int(os.getenv("CALLBACK_SERVER_PORT", "5000"))
+CALLBACK_SERVER_HOST = KEYS.callback_server_host
+CALLBACK_SERVER_PORT = KEYS.callback_server_port
 
 # Database Configuration
-REDIS_URL = os.getenv("REDIS_URL")
+REDIS_URL = KEYS.redis_url
 
 # Bitvavo API Configuration
-BITVAVO_API_KEY = os.getenv("BITVAVO_API_KEY")
-BITVAVO_API_SECRET = os.getenv("BITVAVO_API_SECRET")
+BITVAVO_API_KEY = KEYS.bitvavo_api_key
+BITVAVO_API_SECRET = KEYS.bitvavo_api_secret
+
+# API keys reported by get_api_key_status(); each matches a lowercased KeyConfig field
+API_KEY_NAMES: Final[tuple[str, ...]] = (
+    "GOOGLE_GENAI_API_KEY",
+    "GOOGLE_API_KEY",
+    "X_CLIENT_ID",
+    "X_CLIENT_SECRET",
+    "BITVAVO_API_KEY",
+    "BITVAVO_API_SECRET",
+)
 
 
 def get_configuration_value(
@@ -86,27 +174,24 @@ def validate_required_keys(required_keys: list[str]) -> dict[str, bool]:
     Returns:
         Dictionary mapping key names to their presence status
     """
-    status = {}
-    for key in required_keys:
-        value = os.getenv(key)
-        status[key] = bool(value and value.strip())
-    return status
+    env = os.environ
+    return {key: bool((value := env.get(key)) and value.strip()) for key in required_keys}
+
+
+@lru_cache(maxsize=1)
+def _api_key_status() -> tuple[tuple[str, bool], ...]:
+    """Return the API key status pairs, computed once from the frozen KEYS snapshot."""
+    return tuple((key, bool(getattr(KEYS, key.lower()))) for key in API_KEY_NAMES)
 
 
 def get_api_key_status() -> dict[str, bool]:
     """
     Get status of all API keys.
 
+    Reports the keys the process loaded at import time (KEYS), not the live
+    environment, so the status matches what the application actually uses.
+
     Returns:
         Dictionary showing which API keys are configured
     """
-    api_keys = {
-        "GOOGLE_GENAI_API_KEY": GOOGLE_GENAI_API_KEY,
-        "GOOGLE_API_KEY": GOOGLE_API_KEY,
-        "X_CLIENT_ID": X_CLIENT_ID,
-        "X_CLIENT_SECRET": X_CLIENT_SECRET,
-        "BITVAVO_API_KEY": BITVAVO_API_KEY,
-        "BITVAVO_API_SECRET": BITVAVO_API_SECRET,
-    }
-
-    return {key: bool(value) for key, value in api_keys.items()}
+    return dict(_api_key_status())
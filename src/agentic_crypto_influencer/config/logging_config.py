@@ -9,12 +9,16 @@ This module provides a structured logging system with:
 - Performance monitoring capabilities
 """
 
+import atexit
+import copy
 import logging
 import logging.config
+from logging.handlers import QueueHandler, QueueListener
 import os
 from pathlib import Path
-import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar, Final
+
+import orjson
 
 if TYPE_CHECKING:
     from typing import override
@@ -24,12 +28,27 @@ else:
     except ImportError:
         from typing import override
 
+from src.agentic_crypto_influencer.config.app_constants import (
+    LOG_FORMAT_CONSOLE,
+    LOG_FORMAT_JSON,
+    LOG_QUEUE_MAX_SIZE,
+)
 from src.agentic_crypto_influencer.config.key_constants import REDIS_URL
 
+# Listener draining the file-handler queue; started by setup_logging()
+_queue_listener: QueueListener | None = None
+
+# Set once setup_logging() has run; repeat calls are no-ops
+_logging_configured = False
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that adds structured context to log records."""
 
+    def __init__(self, *args: Any, output: str = LOG_FORMAT_CONSOLE, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.json_output = output == LOG_FORMAT_JSON
+
     @override
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with Redis connection status."""
@@ -40,7 +59,49 @@ class StructuredFormatter(logging.Formatter):
         else:
             record.redis_status = "unknown"
 
-        return super().format(record)
+        if not self.json_output:
+            return super().format(record)
+
+        # Serialize with orjson so quotes/newlines in messages stay valid JSON
+        payload: dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "service": getattr(record, "service", None),
+            "version": getattr(record, "version", None),
+            "logger": record.name,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Queued records carry the traceback pre-rendered by StructuredQueueHandler
+            payload["exception"] = record.exc_text
+        return orjson.dumps(payload, default=str).decode()
+
+
+class StructuredQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback separate from the message."""
+
+    # Renders tracebacks for records the console formatter has not already rendered
+    _exception_formatter: ClassVar[logging.Formatter] = logging.Formatter()
+
+    @override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments and render the traceback into exc_text.
+
+        The base implementation folds the traceback into msg and clears exc_text,
+        so the file formatter could no longer report it as a separate field.
+        """
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
 
 
 def get_log_level() -> str:
@@ -50,113 +111,149 @@ def get_log_level() -> str:
     return env_level if env_level in valid_levels else "INFO"
 
 
-def get_log_format() -> str:
-    """Get log format based on environment (structured for production)."""
+def get_log_output() -> str:
+    """Get log output type based on environment (structured JSON for production)."""
     is_development = os.getenv("ENVIRONMENT", "development").lower() == "development"
+    return LOG_FORMAT_CONSOLE if is_development else LOG_FORMAT_JSON
+
+
+def get_log_format() -> str:
+    """Get the text log format (JSON records are built by StructuredFormatter)."""
+    return (
+        "%(asctime)s | %(levelname)-8s | %(name)-20s | %(funcName)-15s:%(lineno)-3d | %(message)s"
+    )
+
+
+# Static part of the dictConfig schema; setup_logging() merges in the console
+# handler, formatters and application logger for the configured level/format
+_LOGGING_CONFIG_TEMPLATE: Final[dict[str, Any]] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "error_file": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "level": "ERROR",
+            "formatter": "error",
+            "filename": "logs/error.log",
+            "maxBytes": 10485760,  # 10MB
+            "backupCount": 5,
+        },
+        "app_file": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "level": "INFO",
+            "formatter": "standard",
+            "filename": "logs/app.log",
+            "maxBytes": 10485760,  # 10MB
+            "backupCount": 5,
+        },
+        # File writes and rotation run on the QueueListener thread, so callers
+        # only pay for an enqueue
+        "file_queue": {
+            "class": StructuredQueueHandler,
+            "handlers": ["app_file", "error_file"],
+            "respect_handler_level": True,
+            "queue": {"()": "queue.Queue", "maxsize": LOG_QUEUE_MAX_SIZE},
+        },
+    },
+    "loggers": {
+        # Third-party library loggers
+        "autogen": {
+            "level": "WARNING",
+            "handlers": ["console"],
+            "propagate": False,
+        },
+        "openai": {
+            "level": "WARNING",
+            "handlers": ["console"],
+            "propagate": False,
+        },
+        "redis": {
+            "level": "WARNING",
+            "handlers": ["console"],
+            "propagate": False,
+        },
+        "requests": {
+            "level": "WARNING",
+            "handlers": ["console"],
+            "propagate": False,
+        },
+    },
+    "root": {
+        "level": "WARNING",
+        "handlers": ["console"],
+    },
+}
+
 
-    if is_development:
-        return (
-            "%(asctime)s | %(levelname)-8s | %(name)-20s | "
-            "%(funcName)-15s:%(lineno)-3d | %(message)s"
-        )
-    else:
-        # Structured format for production/JSON logging
-        return (
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"service": "%(service)s", "version": "%(version)s", '
-            '"logger": "%(name)s", "function": "%(funcName)s", '
-            '"line": %(lineno)d, "message": "%(message)s"}'
-        )
+def _stop_queue_listener() -> None:
+    """Flush queued records to the file handlers and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging() -> None:
     """
     Configure centralized logging for the entire application.
 
-    This function should be called once at application startup.
+    This function should be called once at application startup; repeat calls
+    (module imports, Flask reloader, tests) return immediately instead of
+    re-running dictConfig and reopening the log files.
     """
+    global _queue_listener, _logging_configured
+    if _logging_configured:
+        return
+
     log_level = get_log_level()
     log_format = get_log_format()
+    log_output = get_log_output()
 
     # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    logging_config: dict[str, Any] = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "standard": {
-                "()": StructuredFormatter,
-                "format": log_format,
-                "datefmt": "%Y-%m-%d %H:%M:%S",
-            },
-            "error": {
-                "()": StructuredFormatter,
-                "format": log_format,
-                "datefmt": "%Y-%m-%d %H:%M:%S",
-            },
-        },
-        "handlers": {
+    Path("logs").mkdir(exist_ok=True)
+
+    formatter_config = {
+        "()": StructuredFormatter,
+        "format": log_format,
+        "datefmt": "%Y-%m-%d %H:%M:%S",
+        "output": log_output,
+    }
+    # Only the level- and format-dependent entries are built per call; the rest is
+    # shared from the module-level template
+    logging_config: dict[str, Any] = _LOGGING_CONFIG_TEMPLATE | {
+        "formatters": {"standard": formatter_config, "error": formatter_config},
+        "handlers": _LOGGING_CONFIG_TEMPLATE["handlers"]
+        | {
             "console": {
                 "class": "logging.StreamHandler",
                 "level": log_level,
                 "formatter": "standard",
-                "stream": sys.stdout,
-            },
-            "error_file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "ERROR",
-                "formatter": "error",
-                "filename": "logs/error.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
-            },
-            "app_file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "INFO",
-                "formatter": "standard",
-                "filename": "logs/app.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
+                "stream": "ext://sys.stdout",
             },
         },
-        "loggers": {
+        "loggers": _LOGGING_CONFIG_TEMPLATE["loggers"]
+        | {
             "agentic_crypto_influencer": {
                 "level": log_level,
-                "handlers": ["console", "app_file", "error_file"],
-                "propagate": False,
-            },
-            # Third-party library loggers
-            "autogen": {
-                "level": "WARNING",
-                "handlers": ["console"],
-                "propagate": False,
-            },
-            "openai": {
-                "level": "WARNING",
-                "handlers": ["console"],
-                "propagate": False,
-            },
-            "redis": {
-                "level": "WARNING",
-                "handlers": ["console"],
+                "handlers": ["console", "file_queue"],
                 "propagate": False,
             },
-            "requests": {
-                "level": "WARNING",
-                "handlers": ["console"],
-                "propagate": False,
-            },
-        },
-        "root": {
-            "level": "WARNING",
-            "handlers": ["console"],
         },
     }
 
+    # Stop the previous listener before dictConfig closes the handlers it writes to
+    _stop_queue_listener()
     logging.config.dictConfig(logging_config)
 
+    queue_handler = logging.getHandlerByName("file_queue")
+    _queue_listener = getattr(queue_handler, "listener", None)
+    if _queue_listener is not None:
+        _queue_listener.start()
+    _logging_configured = True
+
     # Log the initialization
     logger = get_logger("config.logging")
     logger.info(
@@ -190,6 +287,11 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Loggers used by the metric helpers, resolved once instead of per call
+_performance_logger = get_logger("performance")
+_api_calls_logger = get_logger("api_calls")
+
+
 def log_function_call(func_name: str, **kwargs: Any) -> None:
     """
     Log function calls with parameters for debugging.
@@ -198,9 +300,14 @@ def log_function_call(func_name: str, **kwargs: Any) -> None:
         func_name: Name of the function being called
         **kwargs: Function parameters to log
     """
-    logger = get_logger("performance")
+    logger = _performance_logger
+    # Skip building the truncated parameter dict when DEBUG is filtered out
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     logger.debug(
-        f"Function call: {func_name}",
+        "Function call: %s",
+        func_name,
         extra={
             "function": func_name,
             "parameters": {k: str(v)[:100] for k, v in kwargs.items()},  # Truncate long values
@@ -218,18 +325,22 @@ def log_api_call(service: str, endpoint: str, status_code: int, duration_ms: flo
         status_code: HTTP status code
         duration_ms: Request duration in milliseconds
     """
-    logger = get_logger("api_calls")
-    level = logging.INFO if 200 <= status_code < 400 else logging.ERROR
+    logger = _api_calls_logger
+    success = 200 <= status_code < 400
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
 
     logger.log(
         level,
-        f"API call to {service}",
+        "API call to %s",
+        service,
         extra={
             "service": service,
             "endpoint": endpoint,
             "status_code": status_code,
             "duration_ms": round(duration_ms, 2),
-            "success": 200 <= status_code < 400,
+            "success": success,
         },
     )
 
@@ -244,9 +355,13 @@ class LoggerMixin:
                 self.logger.info("Something happened")
     """
 
-    @property
-    def logger(self) -> logging.Logger:
-        """Get logger for this class."""
-        class_name = self.__class__.__module__.replace("src.agentic_crypto_influencer.", "")
-        class_name += f".{self.__class__.__name__}"
-        return get_logger(class_name)
+    # Empty so slotted subclasses stay dict-free; other subclasses are unaffected
+    __slots__ = ()
+
+    # Bound once per subclass, so instance access is a plain class attribute read
+    logger: ClassVar[logging.Logger]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        class_name = cls.__module__.replace("src.agentic_crypto_influencer.", "")
+        cls.logger = get_logger(f"{class_name}.{cls.__name__}")
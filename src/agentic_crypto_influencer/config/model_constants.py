@@ -9,6 +9,8 @@ MODEL_ID = "gemini-2.5-flash"
 MODEL_TEMPERATURE = 0.7
 MODEL_MAX_TOKENS = 1024
 MODEL_TOP_P = 0.9
+# Let the model request several tool calls in one turn instead of one per round-trip
+MODEL_PARALLEL_TOOL_CALLS = True
 
 # Model Providers
 PROVIDER_GOOGLE = "google"
@@ -9,6 +9,13 @@ REDIS_KEY_OAUTH_CODE_VERIFIER = "oauth_code_verifier"
 REDIS_KEY_OAUTH_STATE = "oauth_state"
 REDIS_KEY_TOKEN = "token"  # nosec B105
 
+# Publishing Related Keys
+# Sorted set of SimHashes scored by publish time (epoch seconds)
+REDIS_KEY_PUBLISHED_SIMHASHES = "published_tweet_simhashes_by_time"
+
+# Workflow Related Keys
+REDIS_KEY_GRAPHFLOW_ACTIVITIES = "graphflow_activities"  # list drained by the dashboard
+
 # Token Expiration Times (in seconds)
 OAUTH_CODE_VERIFIER_EXPIRY = 600  # 10 minutes
 OAUTH_STATE_EXPIRY = 600  # 10 minutes
@@ -3,6 +3,8 @@ Scheduler constants for job management and GraphFlow control.
 Contains all configuration for the web-based scheduling system.
 """
 
+from types import MappingProxyType
+
 # Job Types
 JOB_TYPE_GRAPHFLOW = "graphflow"
 JOB_TYPE_SINGLE_POST = "single_post"
@@ -55,25 +57,55 @@ ERROR_GRAPHFLOW_START_FAILED = "Failed to start GraphFlow"
 ERROR_GRAPHFLOW_STOP_FAILED = "Failed to stop GraphFlow"
 ERROR_SCHEDULER_NOT_AVAILABLE = "Scheduler service not available"
 
-# Cron Presets for Quick Selection
-CRON_PRESETS = {
-    "every_hour": "0 * * * *",
-    "every_2_hours": "0 */2 * * *",
-    "every_4_hours": "0 */4 * * *",
-    "every_6_hours": "0 */6 * * *",
-    "daily_9am": "0 9 * * *",
-    "daily_12pm": "0 12 * * *",
-    "daily_6pm": "0 18 * * *",
-    "weekdays_9am": "0 9 * * 1-5",
-    "weekends_10am": "0 10 * * 6,0",
-}
+# Cron Presets for Quick Selection (read-only)
+CRON_PRESETS = MappingProxyType(
+    {
+        "every_hour": "0 * * * *",
+        "every_2_hours": "0 */2 * * *",
+        "every_4_hours": "0 */4 * * *",
+        "every_6_hours": "0 */6 * * *",
+        "daily_9am": "0 9 * * *",
+        "daily_12pm": "0 12 * * *",
+        "daily_6pm": "0 18 * * *",
+        "weekdays_9am": "0 9 * * 1-5",
+        "weekends_10am": "0 10 * * 6,0",
+    }
+)
 
 # Time Zone Options for UI
-TIMEZONE_OPTIONS = [
+TIMEZONE_OPTIONS = (
     ("Europe/Amsterdam", "Amsterdam (CET/CEST)"),
     ("Europe/London", "London (GMT/BST)"),
     ("America/New_York", "New York (EST/EDT)"),
     ("America/Los_Angeles", "Los Angeles (PST/PDT)"),
     ("Asia/Tokyo", "Tokyo (JST)"),
     ("UTC", "UTC"),
-]
+)
+
+# Timezone codes from TIMEZONE_OPTIONS for O(1) validation
+TIMEZONE_CODES = frozenset(code for code, _ in TIMEZONE_OPTIONS)
+
+# Code <-> display label lookups for TIMEZONE_OPTIONS (read-only)
+_TZ_LABEL_BY_CODE = MappingProxyType(dict(TIMEZONE_OPTIONS))
+_TZ_CODE_BY_LABEL = MappingProxyType({label: code for code, label in TIMEZONE_OPTIONS})
+
+
+def resolve_timezone(code_or_label: str) -> str:
+    """
+    Resolve a timezone code or its UI display label to the timezone code.
+
+    Args:
+        code_or_label: Code (e.g. "Europe/London") or label (e.g. "London (GMT/BST)")
+
+    Returns:
+        The timezone code
+
+    Raises:
+        ValueError: If the value is neither a known code nor a known label
+    """
+    if code_or_label in _TZ_LABEL_BY_CODE:
+        return code_or_label
+    try:
+        return _TZ_CODE_BY_LABEL[code_or_label]
+    except KeyError:
+        raise ValueError(f"Unknown timezone: {code_or_label}") from None
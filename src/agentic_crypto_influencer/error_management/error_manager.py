@@ -2,8 +2,20 @@
 Enhanced error management with centralized logging and structured error handling.
 """
 
+from collections.abc import Callable
+import logging
+import reprlib
 from typing import Any
 
+from src.agentic_crypto_influencer.config.error_constants import (
+    USER_MESSAGE_API,
+    USER_MESSAGE_CONFIGURATION,
+    USER_MESSAGE_CONNECTION,
+    USER_MESSAGE_DATA_PROCESSING,
+    USER_MESSAGE_DEFAULT,
+    USER_MESSAGE_VALIDATION,
+    USER_MESSAGE_WORKFLOW,
+)
 from src.agentic_crypto_influencer.config.logging_config import LoggerMixin
 from src.agentic_crypto_influencer.error_management.exceptions import (
     AgenticCryptoError,
@@ -14,15 +26,110 @@ from src.agentic_crypto_influencer.error_management.exceptions import (
 )
 from src.agentic_crypto_influencer.error_management.retry import retry_manager
 
+# Error category -> (user message template, error_category added to the log context)
+_CATEGORY_TABLE: dict[str, tuple[str, str | None]] = {
+    "api": (USER_MESSAGE_API, None),
+    "connection": (USER_MESSAGE_CONNECTION, "connection"),
+    "validation": (USER_MESSAGE_VALIDATION, "validation"),
+    "configuration": (USER_MESSAGE_CONFIGURATION, "configuration"),
+    "workflow": (USER_MESSAGE_WORKFLOW, "workflow"),
+    "data_processing": (USER_MESSAGE_DATA_PROCESSING, "data_processing"),
+}
+
+# Bounded repr for logged values; never renders more than ~100 characters
+_TRUNC_REPR = reprlib.Repr(maxstring=100, maxother=100)
+
+
+def _truncate_value(value: Any) -> str:
+    """Render a value for logging without materializing its full string form."""
+    if isinstance(value, str):
+        return value[:100]
+    if isinstance(value, bytes):
+        return value[:100].decode("utf-8", "replace")
+    return _TRUNC_REPR.repr(value)
+
+
+class _LazyServiceStatus:
+    """Circuit breaker status for a service, snapshotted only when rendered."""
+
+    __slots__ = ("service",)
+
+    def __init__(self, service: str) -> None:
+        self.service = service
+
+    def __repr__(self) -> str:
+        return repr(retry_manager.get_service_status().get(self.service, {}))
+
+
+# Factories used by ErrorManager.create_specific_error. Each receives the error
+# message, its lowercased form and the caller's context, and returns None to
+# fall through to the generic error.
+_SpecificErrorFactory = Callable[[str, str, dict[str, Any]], AgenticCryptoError | None]
+
+
+def _make_connection_error(
+    message: str, message_lower: str, context: dict[str, Any]
+) -> AgenticCryptoError | None:
+    return APIConnectionError(
+        message=message,
+        service=context.get("service", "unknown"),
+        endpoint=context.get("endpoint", "unknown"),
+        context=context,
+    )
+
+
+def _make_timeout_error(
+    message: str, message_lower: str, context: dict[str, Any]
+) -> AgenticCryptoError | None:
+    return APITimeoutError(
+        message=message,
+        service=context.get("service", "unknown"),
+        endpoint=context.get("endpoint", "unknown"),
+        timeout=context.get("timeout", 30.0),
+        context=context,
+    )
+
+
+def _make_validation_error(
+    message: str, message_lower: str, context: dict[str, Any]
+) -> AgenticCryptoError | None:
+    if "validation" not in message_lower:
+        return None
+    return ValidationError(
+        message=message,
+        field=context.get("field", "unknown"),
+        value=context.get("value", ""),
+        context=context,
+    )
+
+
+def _make_configuration_error(
+    message: str, message_lower: str, context: dict[str, Any]
+) -> AgenticCryptoError | None:
+    if "config" not in message_lower:
+        return None
+    return ConfigurationError(
+        message=message,
+        missing_config=context.get("config_name"),
+        context=context,
+    )
+
 
 class ErrorManager(LoggerMixin):
     """
     Centralized error management with structured logging and context preservation.
     """
 
-    def __init__(self) -> None:
-        """Initialize the error manager."""
-        self.logger.info("ErrorManager initialized")
+    # Stateless: no per-instance __dict__
+    __slots__ = ()
+
+    # Checked in order by create_specific_error; first non-None result wins
+    _ERROR_FACTORIES: tuple[tuple[type[Exception], _SpecificErrorFactory], ...] = (
+        (ConnectionError, _make_connection_error),
+        (TimeoutError, _make_timeout_error),
+        (ValueError, _make_validation_error),
+        (KeyError, _make_configuration_error),
+    )
 
     def handle_error(
         self,
@@ -43,25 +150,48 @@ class ErrorManager(LoggerMixin):
         """
         # Default user message
         if user_message is None:
-            user_message = "An unexpected error occurred. Please try again later."
-
-        # Prepare context for logging
-        error_context: dict[str, Any] = {
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-        }
-        if context:
-            error_context.update(context)
-
-        # Log with full context and traceback
-        self.logger.error(
-            f"Error handled: {type(error).__name__}: {error!s}",
-            exc_info=True,
-            extra=error_context,
-        )
+            user_message = USER_MESSAGE_DEFAULT
+
+        # Skip building the log context entirely when ERROR records are filtered out
+        if self.logger.isEnabledFor(logging.ERROR):
+            # Computed once and shared by the log message and its structured context
+            error_type = type(error).__name__
+            error_message = str(error)
+            error_context: dict[str, Any] = {
+                "error_type": error_type,
+                "error_message": error_message,
+            }
+            if context:
+                error_context.update(context)
+
+            # Log with full context and traceback
+            self.logger.error(
+                "Error handled: %s: %s",
+                error_type,
+                error_message,
+                exc_info=True,
+                extra=error_context,
+            )
 
         return user_message
 
+    def handle(self, category: str, error: Exception, **context: Any) -> str:
+        """
+        Handle an error of a known category using its message template.
+
+        Args:
+            category: Key in _CATEGORY_TABLE (e.g. "api", "validation")
+            error: The exception that occurred
+            **context: Context for logging; must include the template's fields
+
+        Returns:
+            User-friendly error message
+        """
+        template, error_category = _CATEGORY_TABLE[category]
+        if error_category is not None:
+            context["error_category"] = error_category
+        return self.handle_error(error, context, template % context)
+
     def handle_api_error(
         self,
         error: Exception,
@@ -81,14 +211,9 @@ class ErrorManager(LoggerMixin):
         Returns:
             User-friendly error message
         """
-        context: dict[str, Any] = {
-            "service": service,
-            "endpoint": endpoint,
-            "status_code": status_code,
-        }
-
-        user_message = f"Service temporarily unavailable ({service}). Please try again later."
-        return self.handle_error(error, context, user_message)
+        return self.handle(
+            "api", error, service=service, endpoint=endpoint, status_code=status_code
+        )
 
     def handle_connection_error(
         self,
@@ -107,14 +232,7 @@ class ErrorManager(LoggerMixin):
         Returns:
             User-friendly error message
         """
-        context: dict[str, Any] = {
-            "service": service,
-            "retry_count": retry_count,
-            "error_category": "connection",
-        }
-
-        user_message = f"Unable to connect to {service}. Please check your connection."
-        return self.handle_error(error, context, user_message)
+        return self.handle("connection", error, service=service, retry_count=retry_count)
 
     def handle_validation_error(
         self,
@@ -133,14 +251,7 @@ class ErrorManager(LoggerMixin):
         Returns:
             User-friendly error message
         """
-        context: dict[str, Any] = {
-            "field": field,
-            "value": str(value)[:100],  # Truncate long values
-            "error_category": "validation",
-        }
-
-        user_message = f"Invalid {field}. Please check your input and try again."
-        return self.handle_error(error, context, user_message)
+        return self.handle("validation", error, field=field, value=_truncate_value(value))
 
     def handle_configuration_error(
         self,
@@ -159,14 +270,9 @@ class ErrorManager(LoggerMixin):
         Returns:
             User-friendly error message
         """
-        context: dict[str, Any] = {
-            "config_name": config_name,
-            "expected_type": expected_type,
-            "error_category": "configuration",
-        }
-
-        user_message = f"Configuration error: {config_name}. Please check your settings."
-        return self.handle_error(error, context, user_message)
+        return self.handle(
+            "configuration", error, config_name=config_name, expected_type=expected_type
+        )
 
     def handle_workflow_error(
         self,
@@ -185,15 +291,9 @@ class ErrorManager(LoggerMixin):
         Returns:
             User-friendly error message
         """
-        context: dict[str, Any] = {
-            "workflow_step": workflow_step,
-            "error_category": "workflow",
-        }
         if step_data:
-            context["step_data"] = step_data
-
-        user_message = f"Workflow failed at step: {workflow_step}. Please try again."
-        return self.handle_error(error, context, user_message)
+            return self.handle("workflow", error, workflow_step=workflow_step, step_data=step_data)
+        return self.handle("workflow", error, workflow_step=workflow_step)
 
     def handle_data_processing_error(
         self,
@@ -214,16 +314,15 @@ class ErrorManager(LoggerMixin):
         Returns:
             User-friendly error message
         """
-        context: dict[str, Any] = {
-            "data_type": data_type,
-            "operation": operation,
-            "error_category": "data_processing",
-        }
         if data_size is not None:
-            context["data_size"] = data_size
-
-        user_message = f"Failed to process {data_type}. Please try again with different data."
-        return self.handle_error(error, context, user_message)
+            return self.handle(
+                "data_processing",
+                error,
+                data_type=data_type,
+                operation=operation,
+                data_size=data_size,
+            )
+        return self.handle("data_processing", error, data_type=data_type, operation=operation)
 
     def create_specific_error(self, error: Exception, **kwargs: Any) -> AgenticCryptoError:
         """
@@ -236,42 +335,20 @@ class ErrorManager(LoggerMixin):
         Returns:
             Specific application exception
         """
-        # Map common exceptions to specific types
-        if isinstance(error, ConnectionError):
-            return APIConnectionError(
-                message=str(error),
-                service=kwargs.get("service", "unknown"),
-                endpoint=kwargs.get("endpoint", "unknown"),
-                context=kwargs,
-            )
-        elif isinstance(error, TimeoutError):
-            return APITimeoutError(
-                message=str(error),
-                service=kwargs.get("service", "unknown"),
-                endpoint=kwargs.get("endpoint", "unknown"),
-                timeout=kwargs.get("timeout", 30.0),
-                context=kwargs,
-            )
-        elif isinstance(error, ValueError) and "validation" in str(error).lower():
-            return ValidationError(
-                message=str(error),
-                field=kwargs.get("field", "unknown"),
-                value=kwargs.get("value", ""),
-                context=kwargs,
-            )
-        elif isinstance(error, KeyError) and "config" in str(error).lower():
-            return ConfigurationError(
-                message=str(error),
-                missing_config=kwargs.get("config_name"),
-                context=kwargs,
-            )
-        else:
-            # Return as generic AgenticCryptoError for unknown types
-            return AgenticCryptoError(
-                message=str(error),
-                error_code="UNKNOWN_ERROR",
-                context=kwargs,
-            )
+        message = str(error)
+        message_lower = message.lower()
+        for error_type, factory in self._ERROR_FACTORIES:
+            if isinstance(error, error_type):
+                specific = factory(message, message_lower, kwargs)
+                if specific is not None:
+                    return specific
+
+        # Return as generic AgenticCryptoError for unknown types
+        return AgenticCryptoError(
+            message=message,
+            error_code="UNKNOWN_ERROR",
+            context=kwargs,
+        )
 
     def get_circuit_breaker_status(self) -> dict[str, dict[str, Any]]:
         """Get status of all circuit breakers."""
@@ -306,34 +383,14 @@ class ErrorManager(LoggerMixin):
             # Log circuit breaker failures
             context: dict[str, Any] = {
                 "service": service,
-                "function": func.__name__ if hasattr(func, "__name__") else str(func),
-                "circuit_breaker_status": retry_manager.get_service_status().get(service, {}),
+                "function": getattr(func, "__name__", None) or str(func),
+                "circuit_breaker_status": _LazyServiceStatus(service),
             }
             self.handle_error(e, context)
             # Re-raise the original exception for proper error propagation
             raise
 
 
-def main() -> None:
-    """Main function that demonstrates error handling."""
-    # Initialize logging first
-    from src.agentic_crypto_influencer.config.logging_config import setup_logging
-
-    setup_logging()
-
-    error_manager = ErrorManager()
-
-    try:
-        raise ValueError("Sample error message")
-    except Exception as e:
-        user_message = error_manager.handle_error(
-            e,
-            context={"demo": True, "function": "main"},
-            user_message="This is a demo error for testing.",
-        )
-        # In a real application, this would be returned to the user, not printed
-        error_manager.logger.info(f"User received message: {user_message}")
-
-
-if __name__ == "__main__":
-    main()
+# Global error manager instance; import this rather than constructing ErrorManager
+# ad hoc, the class holds no per-instance state
+error_manager = ErrorManager()
@@ -0,0 +1,31 @@
+"""
+Command-line demo of ErrorManager error handling.
+
+Kept out of error_manager.py so importing the error manager does not carry
+the demo. Run with:
+    python -m src.agentic_crypto_influencer.error_management.error_manager_demo
+"""
+
+from src.agentic_crypto_influencer.config.logging_config import setup_logging
+from src.agentic_crypto_influencer.error_management.error_manager import error_manager
+
+
+def main() -> None:
+    """Main function that demonstrates error handling."""
+    # Initialize logging first
+    setup_logging()
+
+    try:
+        raise ValueError("Sample error message")
+    except Exception as e:
+        user_message = error_manager.handle_error(
+            e,
+            context={"demo": True, "function": "main"},
+            user_message="This is a demo error for testing.",
+        )
+        # In a real application, this would be returned to the user, not printed
+        error_manager.logger.info(f"User received message: {user_message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ during the execution of crypto trading agents and associated workflows.
 """
 
 import random
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from typing import override
@@ -16,10 +16,19 @@ else:
     except ImportError:
         from typing import override
 
+from src.agentic_crypto_influencer.config.app_constants import RETRY_MAX_DELAY
+
 
 class AgenticCryptoError(Exception):
     """Base exception for all agentic crypto influencer related errors."""
 
+    # Every subclass declares __slots__ so attributes live in slots and the
+    # BaseException instance __dict__ is never materialized
+    __slots__ = ("context", "error_code", "message")
+
+    # Read by is_retryable_error(); subclasses that may succeed on retry set True
+    retryable: ClassVar[bool] = False
+
     def __init__(
         self, message: str, error_code: str = "UNKNOWN", context: dict[str, Any] | None = None
     ):
@@ -33,10 +42,30 @@ class AgenticCryptoError(Exception):
         """Return string representation."""
         return f"{self.__class__.__name__}: {self.message}"
 
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Carry slotted attributes through copy and pickle.
+
+        BaseException.__reduce__ only preserves args and __dict__, which would drop
+        every slot. The instance is recreated without re-running __init__ (whose
+        signature differs per subclass) and BaseException.__setstate__ restores
+        the slot values.
+        """
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return (type(self).__new__, (type(self), *self.args), state)
+
 
 class ConfigurationError(AgenticCryptoError):
     """Raised when configuration is invalid or missing."""
 
+    __slots__ = ("missing_config",)
+
     def __init__(
         self,
         message: str,
@@ -50,6 +79,8 @@ class ConfigurationError(AgenticCryptoError):
 class ValidationError(AgenticCryptoError):
     """Raised when input validation fails."""
 
+    __slots__ = ("field", "value")
+
     def __init__(
         self, message: str, field: str, value: Any, context: dict[str, Any] | None = None
     ):
@@ -61,6 +92,8 @@ class ValidationError(AgenticCryptoError):
 class APIError(AgenticCryptoError):
     """Base class for API-related errors."""
 
+    __slots__ = ("endpoint", "service", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -79,6 +112,9 @@ class APIError(AgenticCryptoError):
 class APIConnectionError(APIError):
     """Raised when unable to connect to an API service."""
 
+    __slots__ = ()
+    retryable = True
+
     def __init__(
         self, message: str, service: str, endpoint: str, context: dict[str, Any] | None = None
     ):
@@ -88,6 +124,9 @@ class APIConnectionError(APIError):
 class APITimeoutError(APIError):
     """Raised when an API request times out."""
 
+    __slots__ = ("timeout",)
+    retryable = True
+
     def __init__(
         self,
         message: str,
@@ -103,6 +142,9 @@ class APITimeoutError(APIError):
 class APIRateLimitError(APIError):
     """Raised when API rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+    retryable = True
+
     def __init__(
         self,
         message: str,
@@ -118,6 +160,8 @@ class APIRateLimitError(APIError):
 class APIAuthenticationError(APIError):
     """Raised when API authentication fails."""
 
+    __slots__ = ()
+
     def __init__(
         self, message: str, service: str, endpoint: str, context: dict[str, Any] | None = None
     ):
@@ -127,6 +171,8 @@ class APIAuthenticationError(APIError):
 class DataProcessingError(AgenticCryptoError):
     """Raised when data processing fails."""
 
+    __slots__ = ("data_type", "operation")
+
     def __init__(
         self, message: str, data_type: str, operation: str, context: dict[str, Any] | None = None
     ):
@@ -138,6 +184,9 @@ class DataProcessingError(AgenticCryptoError):
 class RedisConnectionError(AgenticCryptoError):
     """Raised when Redis connection fails."""
 
+    __slots__ = ("operation",)
+    retryable = True
+
     def __init__(self, message: str, operation: str, context: dict[str, Any] | None = None):
         super().__init__(message, "REDIS_CONNECTION_ERROR", context)
         self.operation = operation
@@ -146,6 +195,8 @@ class RedisConnectionError(AgenticCryptoError):
 class WorkflowError(AgenticCryptoError):
     """Raised when workflow execution fails."""
 
+    __slots__ = ("workflow_step",)
+
     def __init__(self, message: str, workflow_step: str, context: dict[str, Any] | None = None):
         super().__init__(message, "WORKFLOW_ERROR", context)
         self.workflow_step = workflow_step
@@ -154,6 +205,8 @@ class WorkflowError(AgenticCryptoError):
 class ExternalServiceError(AgenticCryptoError):
     """Raised when external service interaction fails."""
 
+    __slots__ = ("operation", "service")
+
     def __init__(
         self, message: str, service: str, operation: str, context: dict[str, Any] | None = None
     ):
@@ -165,6 +218,9 @@ class ExternalServiceError(AgenticCryptoError):
 class RetryableError(AgenticCryptoError):
     """Base class for errors that can be retried."""
 
+    __slots__ = ("max_retries", "retry_after")
+    retryable = True
+
     def __init__(
         self,
         message: str,
@@ -181,6 +237,8 @@ class RetryableError(AgenticCryptoError):
 class NonRetryableError(AgenticCryptoError):
     """Base class for errors that should not be retried."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -190,6 +248,10 @@ class NonRetryableError(AgenticCryptoError):
         super().__init__(message, error_code, context)
 
 
+# Exponential backoff base delays (2**attempt), built once at import
+_BACKOFF_BASE: tuple[float, ...] = tuple(float(2**i) for i in range(16))
+
+
 # Convenience function to determine if an error is retryable
 def is_retryable_error(error: Exception) -> bool:
     """
@@ -201,28 +263,8 @@ def is_retryable_error(error: Exception) -> bool:
     Returns:
         True if the error is retryable, False otherwise
     """
-    # Direct retryable errors
-    if isinstance(error, RetryableError):
-        return True
-
-    # Non-retryable errors
-    if isinstance(error, NonRetryableError):
-        return False
-
-    # Specific API errors that are retryable
-    if isinstance(error, APIConnectionError | APITimeoutError | APIRateLimitError):
-        return True
-
-    # Authentication errors are not retryable
-    if isinstance(error, APIAuthenticationError):
-        return False
-
-    # Configuration and validation errors are not retryable
-    if isinstance(error, ConfigurationError | ValidationError):
-        return False
-
-    # Redis connection errors are retryable
-    return isinstance(error, RedisConnectionError)
+    # Exceptions outside the AgenticCryptoError hierarchy are never retried
+    return bool(getattr(type(error), "retryable", False))
 
 
 def get_retry_delay(error: Exception, attempt: int) -> float:
@@ -236,17 +278,16 @@ def get_retry_delay(error: Exception, attempt: int) -> float:
     Returns:
         Delay in seconds before retry
     """
-    # Check if error has retry_after attribute
-    if hasattr(error, "retry_after") and error.retry_after is not None:
-        retry_after = error.retry_after
-        return float(retry_after) if retry_after is not None else 0.0
-
-    # Check if error has retry_delay attribute
-    if hasattr(error, "retry_delay") and error.retry_delay is not None:
-        retry_delay = error.retry_delay
-        return float(retry_delay) if retry_delay is not None else 0.0
-
-    # Default exponential backoff with jitter
-    base_delay = 2**attempt
-    jitter = random.uniform(0.1, 0.5)  # Add 10-50% jitter  # nosec B311
-    return float(base_delay + jitter)
+    # Prefer an explicit delay carried by the error (retry_after, then retry_delay)
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+
+    retry_delay = getattr(error, "retry_delay", None)
+    if retry_delay is not None:
+        return float(retry_delay)
+
+    # Default exponential backoff with jitter, capped at RETRY_MAX_DELAY
+    base_delay = _BACKOFF_BASE[attempt] if attempt < len(_BACKOFF_BASE) else RETRY_MAX_DELAY
+    jitter = 0.1 + random.random() * 0.4  # Add 0.1-0.5s jitter  # nosec B311
+    return min(base_delay + jitter, RETRY_MAX_DELAY)
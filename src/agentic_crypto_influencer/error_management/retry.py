@@ -7,16 +7,27 @@ and circuit breaker patterns to handle transient failures gracefully.
 
 import asyncio
 from collections.abc import Callable
-from datetime import UTC, datetime
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
+import logging
+import threading
 import time
-from typing import Any, TypeVar
+from typing import Any
 
 from src.agentic_crypto_influencer.config.app_constants import (
     COMPONENT_CIRCUIT_BREAKER,
     COMPONENT_RETRY,
 )
+from src.agentic_crypto_influencer.config.error_constants import (
+    CIRCUIT_BREAKER_CLOSED_RECOVERY,
+    CIRCUIT_BREAKER_HALF_OPEN,
+    CIRCUIT_BREAKER_IS_OPEN,
+    CIRCUIT_BREAKER_OPENED_FAILURES,
+    CIRCUIT_BREAKER_REOPENED_FAILURE,
+    RETRY_ATTEMPT_MESSAGE,
+    RETRY_ATTEMPTS_EXHAUSTED,
+    RETRY_NON_RETRYABLE,
+)
 from src.agentic_crypto_influencer.config.logging_config import get_logger
 from src.agentic_crypto_influencer.error_management.exceptions import (
     APIConnectionError,
@@ -26,12 +37,19 @@ from src.agentic_crypto_influencer.error_management.exceptions import (
 
 logger = get_logger(f"{COMPONENT_RETRY}.{COMPONENT_RETRY}")
 
-F = TypeVar("F", bound=Callable[..., Any])
+
+@lru_cache(maxsize=128)
+def _get_breaker_logger(service_name: str) -> logging.Logger:
+    """Return the circuit breaker logger for a service, resolved once per name."""
+    return get_logger(f"{COMPONENT_CIRCUIT_BREAKER}.{service_name}")
 
 
 class CircuitState(Enum):
     """Circuit breaker states."""
 
+    # Members are singletons and compared with `is`; the string values are what
+    # get_service_status() reports, so this stays a plain Enum rather than IntEnum
+
     CLOSED = "closed"  # Normal operation
     OPEN = "open"  # Circuit is open, rejecting requests
     HALF_OPEN = "half_open"  # Testing if service is back
@@ -68,53 +86,59 @@ class CircuitBreaker:
 
         self.failure_count = 0
         self.success_count = 0
+        # time.monotonic() reading, immune to wall-clock adjustments
         self.last_failure_time: float | None = None
         self.state = CircuitState.CLOSED
 
-        self.logger = get_logger(f"{COMPONENT_CIRCUIT_BREAKER}.{service_name}")
+        # Guards the read-modify-write of the counters and state transitions. A
+        # closed-state success with no failures to clear takes no lock.
+        self._lock = threading.Lock()
+
+        self.logger = _get_breaker_logger(service_name)
 
     def _should_attempt_reset(self) -> bool:
         """Check if circuit should attempt to reset."""
         return (
-            self.state == CircuitState.OPEN
+            self.state is CircuitState.OPEN
             and self.last_failure_time is not None
-            and datetime.now(UTC).timestamp() - self.last_failure_time >= self.reset_timeout
+            and time.monotonic() - self.last_failure_time >= self.reset_timeout
         )
 
     def _record_success(self) -> None:
         """Record a successful operation."""
-        self.failure_count = 0
-        self.last_failure_time = None
-
-        if self.state == CircuitState.HALF_OPEN:
-            self.success_count += 1
-            if self.success_count >= self.success_threshold:
-                self.state = CircuitState.CLOSED
+        with self._lock:
+            # A concurrent failure may have opened the circuit while this call ran;
+            # keep its failure time so the reset timeout can still elapse
+            if self.state is CircuitState.OPEN:
+                return
+
+            self.failure_count = 0
+            self.last_failure_time = None
+
+            if self.state is CircuitState.HALF_OPEN:
+                self.success_count += 1
+                if self.success_count >= self.success_threshold:
+                    self.state = CircuitState.CLOSED
+                    self.success_count = 0
+                    self.logger.info(CIRCUIT_BREAKER_CLOSED_RECOVERY, self.service_name)
+            elif self.state is CircuitState.CLOSED:
                 self.success_count = 0
-                self.logger.info(
-                    f"Circuit breaker for {self.service_name} closed after successful recovery"
-                )
-        elif self.state == CircuitState.CLOSED:
-            self.success_count = 0
 
     def _record_failure(self) -> None:
         """Record a failed operation."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now(UTC).timestamp()
-        self.success_count = 0
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            self.success_count = 0
 
-        if self.state == CircuitState.CLOSED and self.failure_count >= self.failure_threshold:
-            self.state = CircuitState.OPEN
-            self.logger.warning(
-                f"Circuit breaker for {self.service_name} "
-                f"opened after {self.failure_count} failures"
-            )
-        elif self.state == CircuitState.HALF_OPEN:
-            self.state = CircuitState.OPEN
-            self.logger.warning(
-                f"Circuit breaker for {self.service_name} "
-                f"re-opened due to failure in half-open state"
-            )
+            if self.state is CircuitState.CLOSED and self.failure_count >= self.failure_threshold:
+                self.state = CircuitState.OPEN
+                self.logger.warning(
+                    CIRCUIT_BREAKER_OPENED_FAILURES, self.service_name, self.failure_count
+                )
+            elif self.state is CircuitState.HALF_OPEN:
+                self.state = CircuitState.OPEN
+                self.logger.warning(CIRCUIT_BREAKER_REOPENED_FAILURE, self.service_name)
 
     def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """
@@ -131,19 +155,56 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or function fails
         """
-        if self.state == CircuitState.OPEN:
-            if self._should_attempt_reset():
+        if self.state is not CircuitState.CLOSED:
+            return self._call_non_closed(func, *args, **kwargs)
+        return self._call_closed(func, args, kwargs)
+
+    def call_positional(self, func: Callable[..., Any], args: tuple[Any, ...] = ()) -> Any:
+        """
+        Execute function through circuit breaker with positional arguments only.
+
+        Same as call(), but takes the argument tuple as-is so callers that never
+        pass keyword arguments skip re-packing *args/**kwargs.
+
+        Args:
+            func: Function to execute
+            args: Positional arguments for function
+
+        Returns:
+            Function result
+        """
+        if self.state is not CircuitState.CLOSED:
+            return self._call_non_closed(func, *args)
+        return self._call_closed(func, args, {})
+
+    def _call_closed(
+        self, func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Any:
+        """Execute function while the circuit is closed."""
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+        # Steady state has nothing to clear, so only a success after failures takes
+        # the lock (where _record_success() rechecks the state)
+        if self.failure_count or self.last_failure_time is not None:
+            self._record_success()
+        return result
+
+    def _call_non_closed(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Execute function while the circuit is open or half-open."""
+        with self._lock:
+            if self.state is CircuitState.OPEN:
+                if not self._should_attempt_reset():
+                    raise APIConnectionError(
+                        CIRCUIT_BREAKER_IS_OPEN % self.service_name,
+                        service=self.service_name,
+                        endpoint="circuit_breaker",
+                        context={"state": self.state.value, "failure_count": self.failure_count},
+                    )
                 self.state = CircuitState.HALF_OPEN
-                self.logger.info(
-                    f"Circuit breaker for {self.service_name} entering half-open state"
-                )
-            else:
-                raise APIConnectionError(
-                    f"Circuit breaker is open for {self.service_name}",
-                    service=self.service_name,
-                    endpoint="circuit_breaker",
-                    context={"state": self.state.value, "failure_count": self.failure_count},
-                )
+                self.logger.info(CIRCUIT_BREAKER_HALF_OPEN, self.service_name)
 
         try:
             result = func(*args, **kwargs)
@@ -154,7 +215,75 @@ class CircuitBreaker:
             raise
 
 
-def retry(
+def _prepare_retry(
+    func_name: str,
+    error: Exception,
+    attempt: int,
+    max_attempts: int,
+    current_delay: float,
+    on_retry: Callable[[Exception, int], None] | None,
+) -> float | None:
+    """
+    Decide whether a failed attempt is retried, shared by retry and async_retry.
+
+    Args:
+        func_name: Name of the decorated function, for logging
+        error: The exception raised by the attempt
+        attempt: Current attempt number (1-indexed)
+        max_attempts: Maximum number of attempts
+        current_delay: Backoff delay to use when the error carries none
+        on_retry: Optional callback invoked before the retry
+
+    Returns:
+        Seconds to wait before the next attempt, or None if the caller should re-raise
+    """
+    # Check if this error should be retried
+    if not is_retryable_error(error):
+        logger.warning(
+            RETRY_NON_RETRYABLE,
+            func_name,
+            type(error).__name__,
+            error,
+            extra={"attempt": attempt, "max_attempts": max_attempts},
+        )
+        return None
+
+    if attempt == max_attempts:
+        logger.error(
+            RETRY_ATTEMPTS_EXHAUSTED,
+            func_name,
+            extra={"attempt": attempt, "max_attempts": max_attempts, "final_error": str(error)},
+        )
+        return None
+
+    # Calculate delay (use error-specific delay if available)
+    retry_delay = get_retry_delay(error, attempt)
+    if retry_delay is None:
+        retry_delay = current_delay
+
+    # Skip building the extra dict and str(error) when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            RETRY_ATTEMPT_MESSAGE,
+            func_name,
+            attempt,
+            max_attempts,
+            round(retry_delay, 1),
+            extra={
+                "attempt": attempt,
+                "max_attempts": max_attempts,
+                "delay": retry_delay,
+                "error": str(error),
+            },
+        )
+
+    if on_retry:
+        on_retry(error, attempt)
+
+    return retry_delay
+
+
+def retry[F: Callable[..., Any]](
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff_factor: float = 2.0,
@@ -174,13 +303,16 @@ def retry(
     Returns:
         Decorated function
     """
+    # Keep a single class bare so the except clause matches it directly
+    # instead of iterating a one-element tuple
     if exceptions is None:
-        exceptions = (Exception,)
-    elif not isinstance(exceptions, tuple):
-        exceptions = (exceptions,)
+        exceptions = Exception
+    elif isinstance(exceptions, tuple) and len(exceptions) == 1:
+        exceptions = exceptions[0]
 
     def decorator(func: F) -> F:
-        @wraps(func)
+        # Decorated functions are plain functions/methods; skip copying their __dict__
+        @wraps(func, updated=())
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
             current_delay = delay
@@ -190,51 +322,11 @@ def retry(
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-
-                    # Check if this error should be retried
-                    if not is_retryable_error(e):
-                        non_retryable_msg = (
-                            f"Non-retryable error in {func.__name__}: {type(e).__name__}: {e}"
-                        )
-                        logger.warning(
-                            non_retryable_msg,
-                            extra={"attempt": attempt, "max_attempts": max_attempts},
-                        )
-                        raise
-
-                    if attempt == max_attempts:
-                        logger.error(
-                            f"All retry attempts exhausted for {func.__name__}",
-                            extra={
-                                "attempt": attempt,
-                                "max_attempts": max_attempts,
-                                "final_error": str(e),
-                            },
-                        )
-                        raise
-
-                    # Calculate delay (use error-specific delay if available)
-                    retry_delay = get_retry_delay(e, attempt)
-                    if retry_delay is None:
-                        retry_delay = current_delay
-
-                    retry_msg = (
-                        f"Retrying {func.__name__} (attempt {attempt}/{max_attempts}) "
-                        f"after {retry_delay:.1f}s"
+                    retry_delay = _prepare_retry(
+                        func.__name__, e, attempt, max_attempts, current_delay, on_retry
                     )
-                    logger.info(
-                        retry_msg,
-                        extra={
-                            "attempt": attempt,
-                            "max_attempts": max_attempts,
-                            "delay": retry_delay,
-                            "error": str(e),
-                        },
-                    )
-
-                    if on_retry:
-                        on_retry(e, attempt)
-
+                    if retry_delay is None:
+                        raise
                     time.sleep(retry_delay)
                     current_delay *= backoff_factor
 
@@ -247,7 +339,7 @@ def retry(
     return decorator
 
 
-def async_retry(
+def async_retry[F: Callable[..., Any]](
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff_factor: float = 2.0,
@@ -267,13 +359,16 @@ def async_retry(
     Returns:
         Decorated async function
     """
+    # Keep a single class bare so the except clause matches it directly
+    # instead of iterating a one-element tuple
     if exceptions is None:
-        exceptions = (Exception,)
-    elif not isinstance(exceptions, tuple):
-        exceptions = (exceptions,)
+        exceptions = Exception
+    elif isinstance(exceptions, tuple) and len(exceptions) == 1:
+        exceptions = exceptions[0]
 
     def decorator(func: F) -> F:
-        @wraps(func)
+        # Decorated functions are plain functions/methods; skip copying their __dict__
+        @wraps(func, updated=())
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
             current_delay = delay
@@ -283,48 +378,11 @@ def async_retry(
                     return await func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-
-                    # Check if this error should be retried
-                    if not is_retryable_error(e):
-                        logger.warning(
-                            f"Non-retryable error in {func.__name__}: {type(e).__name__}: {e}",
-                            extra={"attempt": attempt, "max_attempts": max_attempts},
-                        )
-                        raise
-
-                    if attempt == max_attempts:
-                        logger.error(
-                            f"All retry attempts exhausted for {func.__name__}",
-                            extra={
-                                "attempt": attempt,
-                                "max_attempts": max_attempts,
-                                "final_error": str(e),
-                            },
-                        )
-                        raise
-
-                    # Calculate delay (use error-specific delay if available)
-                    retry_delay = get_retry_delay(e, attempt)
-                    if retry_delay is None:
-                        retry_delay = current_delay
-
-                    retry_msg = (
-                        f"Retrying {func.__name__} (attempt {attempt}/{max_attempts}) "
-                        f"after {retry_delay:.1f}s"
-                    )
-                    logger.info(
-                        retry_msg,
-                        extra={
-                            "attempt": attempt,
-                            "max_attempts": max_attempts,
-                            "delay": retry_delay,
-                            "error": str(e),
-                        },
+                    retry_delay = _prepare_retry(
+                        func.__name__, e, attempt, max_attempts, current_delay, on_retry
                     )
-
-                    if on_retry:
-                        on_retry(e, attempt)
-
+                    if retry_delay is None:
+                        raise
                     await asyncio.sleep(retry_delay)
                     current_delay *= backoff_factor
 
@@ -348,17 +406,21 @@ class RetryManager:
 
     def get_circuit_breaker(self, service: str) -> CircuitBreaker:
         """Get or create circuit breaker for service."""
-        if service not in self.circuit_breakers:
-            self.circuit_breakers[service] = CircuitBreaker(service_name=service)
-            self.logger.info(f"Created circuit breaker for service: {service}")
+        circuit_breaker = self.circuit_breakers.get(service)
+        if circuit_breaker is None:
+            circuit_breaker = self.circuit_breakers[service] = CircuitBreaker(service_name=service)
+            self.logger.info("Created circuit breaker for service: %s", service)
 
-        return self.circuit_breakers[service]
+        return circuit_breaker
 
     def call_with_circuit_breaker(
         self, service: str, func: Callable[..., Any], *args: Any, **kwargs: Any
     ) -> Any:
         """Execute function with circuit breaker protection."""
-        circuit_breaker = self.get_circuit_breaker(service)
+        # Steady state is a single dict probe; creation goes through get_circuit_breaker()
+        circuit_breaker = self.circuit_breakers.get(service) or self.get_circuit_breaker(service)
+        if not kwargs:
+            return circuit_breaker.call_positional(func, args)
         return circuit_breaker.call(func, *args, **kwargs)
 
     def get_service_status(self) -> dict[str, dict[str, Any]]:
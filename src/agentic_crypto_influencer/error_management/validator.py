@@ -5,446 +5,547 @@ This module provides robust validation functions with detailed error messages
 and context for better user experience and debugging.
 """
 
+from functools import lru_cache
 import re
+import string
 from typing import Any
-from urllib.parse import urlparse
-
+import unicodedata
+from urllib.parse import urlsplit
+
+from src.agentic_crypto_influencer.config.app_constants import (
+    MAX_TWEET_LENGTH,
+    PATTERN_USER_ID,
+    TWEET_LIGHT_CODEPOINT_RANGES,
+)
 from src.agentic_crypto_influencer.config.logging_config import get_logger
 from src.agentic_crypto_influencer.error_management.exceptions import ValidationError
 
 logger = get_logger("error_management.validation")
 
 
-class Validator:
-    """Comprehensive validation utility with detailed error reporting."""
-
-    @staticmethod
-    def validate_string(
-        value: Any,
-        field_name: str,
-        min_length: int = 0,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        required: bool = True,
-        strip_whitespace: bool = True,
-    ) -> str:
-        """
-        Validate string input with comprehensive checks.
-
-        Args:
-            value: Value to validate
-            field_name: Name of the field being validated
-            min_length: Minimum required length
-            max_length: Maximum allowed length
-            pattern: Regex pattern to match
-            required: Whether the field is required
-            strip_whitespace: Whether to strip leading/trailing whitespace
-
-        Returns:
-            Validated and optionally stripped string
-
-        Raises:
-            ValidationError: If validation fails
-        """
-        # Handle None/empty values
-        if value is None or (isinstance(value, str) and not value.strip()):
-            if required:
-                raise ValidationError(
-                    f"{field_name} is required",
-                    field=field_name,
-                    value=value,
-                    context={"validation_type": "required"},
-                )
-            return ""
-
-        # Convert to string if not already
-        if not isinstance(value, str):
-            try:
-                value = str(value)
-            except Exception as e:
-                raise ValidationError(
-                    f"{field_name} must be convertible to string",
-                    field=field_name,
-                    value=value,
-                    context={"validation_type": "type_conversion", "original_error": str(e)},
-                ) from e
-
-        # Strip whitespace if requested
-        if strip_whitespace:
-            value = value.strip()
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a validation pattern once; invalid patterns raise re.error uncached."""
+    return re.compile(pattern)
 
-        # Check length constraints
-        if len(value) < min_length:
-            raise ValidationError(
-                f"{field_name} must be at least {min_length} characters long",
-                field=field_name,
-                value=value,
-                context={
-                    "validation_type": "min_length",
-                    "min_length": min_length,
-                    "actual_length": len(value),
-                },
-            )
 
-        if max_length is not None and len(value) > max_length:
+@lru_cache(maxsize=64)
+def _lower_frozenset(items: tuple[str, ...]) -> frozenset[str]:
+    """Lowercase a static option list (e.g. URL schemes) once for O(1) membership tests."""
+    return frozenset(item.lower() for item in items)
+
+
+@lru_cache(maxsize=64)
+def _choices_by_lower(choices: tuple[str, ...]) -> dict[str, str]:
+    """Map each lowercased string choice to its first original-case spelling."""
+    by_lower: dict[str, str] = {}
+    for choice in choices:
+        by_lower.setdefault(choice.lower(), choice)
+    return by_lower
+
+
+# Character classes of PATTERN_EMAIL, checked by _is_valid_email without the regex engine
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+
+# Character class of PATTERN_USER_ID, checked by validate_user_id without the regex engine
+_USER_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+def _is_valid_email(email: str) -> bool:
+    """Match PATTERN_EMAIL: local@host.tld with a 2+ letter TLD after the last dot."""
+    local, at, domain = email.partition("@")
+    if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    host, dot, tld = domain.rpartition(".")
+    return bool(
+        dot
+        and host
+        and len(tld) >= 2
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+        and _EMAIL_DOMAIN_CHARS.issuperset(host)
+    )
+
+
+# Matches the code points X weighs as 1; stripping them leaves only the double-weight ones
+_TWEET_LIGHT_RE = re.compile(
+    "["
+    + "".join(f"\\U{low:08x}-\\U{high:08x}" for low, high in TWEET_LIGHT_CODEPOINT_RANGES)
+    + "]+"
+)
+
+# One emoji sequence (keycap, flag, or pictograph with variation selectors, skin tone
+# modifiers, tags and ZWJ joins) weighs 2 as a whole, like twitter-text's emoji parsing.
+# Pictographs outside these blocks fall back to the per-code-point weights.
+_TWEET_EMOJI_CHARS = (
+    "[\u00a9\u00ae\u203c\u2049\u2122\u2139\u2194-\u2199\u21a9\u21aa\u231a-\u23ff"
+    "\u24c2\u25aa-\u27bf\u2934\u2935\u2b05-\u2b55\u3030\u303d\u3297\u3299"
+    "\U0001f000-\U0001faff]"
+)
+_TWEET_EMOJI_MODIFIERS = "[\ufe0f\U0001f3fb-\U0001f3ff\U000e0020-\U000e007f]*"
+_TWEET_EMOJI_RE = re.compile(
+    "[\U0001f1e6-\U0001f1ff]{2}"
+    "|[#*0-9]\ufe0f?\u20e3"
+    f"|{_TWEET_EMOJI_CHARS}{_TWEET_EMOJI_MODIFIERS}"
+    f"(?:\u200d{_TWEET_EMOJI_CHARS}{_TWEET_EMOJI_MODIFIERS})*"
+)
+
+
+def _tweet_weighted_length(content: str) -> int:
+    """
+    Count content the way twitter-text does.
+
+    The text is NFC-normalized first, each emoji sequence weighs 2, and the remaining
+    code points weigh 1 inside TWEET_LIGHT_CODEPOINT_RANGES and 2 otherwise.
+    """
+    if content.isascii():
+        return len(content)
+    remaining, emoji_count = _TWEET_EMOJI_RE.subn("", unicodedata.normalize("NFC", content))
+    # One C-level regex pass instead of a per-character Python loop
+    return 2 * emoji_count + len(remaining) + len(_TWEET_LIGHT_RE.sub("", remaining))
+
+
+def validate_string(
+    value: Any,
+    field_name: str,
+    min_length: int = 0,
+    max_length: int | None = None,
+    pattern: str | re.Pattern[str] | None = None,
+    required: bool = True,
+    strip_whitespace: bool = True,
+) -> str:
+    """
+    Validate string input with comprehensive checks.
+
+    Args:
+        value: Value to validate
+        field_name: Name of the field being validated
+        min_length: Minimum required length
+        max_length: Maximum allowed length
+        pattern: Regex pattern (string or precompiled) to match
+        required: Whether the field is required
+        strip_whitespace: Whether to strip leading/trailing whitespace
+
+    Returns:
+        Validated and optionally stripped string
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    # Handle None/empty values
+    if value is None or (isinstance(value, str) and not value.strip()):
+        if required:
             raise ValidationError(
-                f"{field_name} must not exceed {max_length} characters",
+                f"{field_name} is required",
                 field=field_name,
-                value=value[:100],  # Truncate for logging
-                context={
-                    "validation_type": "max_length",
-                    "max_length": max_length,
-                    "actual_length": len(value),
-                },
+                value=value,
+                context={"validation_type": "required"},
             )
+        return ""
 
-        # Check pattern if provided
-        if pattern is not None:
-            try:
-                if not re.match(pattern, value):
-                    raise ValidationError(
-                        f"{field_name} does not match required format",
-                        field=field_name,
-                        value=value[:100],  # Truncate for logging
-                        context={"validation_type": "pattern", "pattern": pattern},
-                    )
-            except re.error as e:
-                logger.error(
-                    f"Invalid regex pattern for {field_name}: {pattern}", extra={"error": str(e)}
-                )
-                raise ValidationError(
-                    f"Internal validation error for {field_name}",
-                    field=field_name,
-                    value=value[:100],
-                    context={"validation_type": "regex_error", "regex_error": str(e)},
-                ) from e
-
-        return str(value)
-
-    @staticmethod
-    def validate_integer(
-        value: Any,
-        field_name: str,
-        min_value: int | None = None,
-        max_value: int | None = None,
-        required: bool = True,
-    ) -> int | None:
-        """
-        Validate integer input.
-
-        Args:
-            value: Value to validate
-            field_name: Name of the field being validated
-            min_value: Minimum allowed value
-            max_value: Maximum allowed value
-            required: Whether the field is required
-
-        Returns:
-            Validated integer or None if not required and empty
-
-        Raises:
-            ValidationError: If validation fails
-        """
-        if value is None or value == "":
-            if required:
-                raise ValidationError(
-                    f"{field_name} is required",
-                    field=field_name,
-                    value=value,
-                    context={"validation_type": "required"},
-                )
-            return None
-
-        # Try to convert to integer
+    # Convert to string if not already
+    if not isinstance(value, str):
         try:
-            if isinstance(value, str):
-                value = value.strip()
-            int_value = int(value)
-        except (ValueError, TypeError) as e:
+            value = str(value)
+        except Exception as e:
             raise ValidationError(
-                f"{field_name} must be a valid integer",
+                f"{field_name} must be convertible to string",
                 field=field_name,
                 value=value,
                 context={"validation_type": "type_conversion", "original_error": str(e)},
             ) from e
 
-        # Check range constraints
-        if min_value is not None and int_value < min_value:
-            raise ValidationError(
-                f"{field_name} must be at least {min_value}",
-                field=field_name,
-                value=int_value,
-                context={"validation_type": "min_value", "min_value": min_value},
-            )
+    # Strip whitespace if requested
+    if strip_whitespace:
+        value = value.strip()
 
-        if max_value is not None and int_value > max_value:
+    # Check length constraints; in-range values pass a single combined test
+    length = len(value)
+    if length < min_length or (max_length is not None and length > max_length):
+        if length < min_length:
             raise ValidationError(
-                f"{field_name} must not exceed {max_value}",
+                f"{field_name} must be at least {min_length} characters long",
                 field=field_name,
-                value=int_value,
-                context={"validation_type": "max_value", "max_value": max_value},
+                value=value,
+                context={
+                    "validation_type": "min_length",
+                    "min_length": min_length,
+                    "actual_length": length,
+                },
             )
+        raise ValidationError(
+            f"{field_name} must not exceed {max_length} characters",
+            field=field_name,
+            value=value[:100],  # Truncate for logging
+            context={
+                "validation_type": "max_length",
+                "max_length": max_length,
+                "actual_length": length,
+            },
+        )
 
-        return int_value
-
-    @staticmethod
-    def validate_url(
-        value: Any,
-        field_name: str,
-        required: bool = True,
-        allowed_schemes: list[str] | None = None,
-    ) -> str | None:
-        """
-        Validate URL format.
-
-        Args:
-            value: Value to validate
-            field_name: Name of the field being validated
-            required: Whether the field is required
-            allowed_schemes: List of allowed URL schemes (default: ['http', 'https'])
-
-        Returns:
-            Validated URL or None if not required and empty
-
-        Raises:
-            ValidationError: If validation fails
-        """
-        if allowed_schemes is None:
-            allowed_schemes = ["http", "https"]
-
-        if value is None or (isinstance(value, str) and not value.strip()):
-            if required:
-                raise ValidationError(
-                    f"{field_name} is required",
-                    field=field_name,
-                    value=value,
-                    context={"validation_type": "required"},
-                )
-            return None
-
-        url_str = str(value).strip()
-
+    # Check pattern if provided, after the cheaper length checks
+    if pattern is not None:
         try:
-            parsed = urlparse(url_str)
-        except Exception as e:
+            regex = pattern if isinstance(pattern, re.Pattern) else _compile(pattern)
+        except re.error as e:
+            logger.error(
+                f"Invalid regex pattern for {field_name}: {pattern}", extra={"error": str(e)}
+            )
             raise ValidationError(
-                f"{field_name} must be a valid URL",
+                f"Internal validation error for {field_name}",
                 field=field_name,
-                value=url_str,
-                context={"validation_type": "url_parse", "original_error": str(e)},
+                value=value[:100],
+                context={"validation_type": "regex_error", "regex_error": str(e)},
             ) from e
-
-        # Check scheme
-        if not parsed.scheme:
+        if regex.match(value) is None:
             raise ValidationError(
-                f"{field_name} must include a scheme (e.g., https://)",
+                f"{field_name} does not match required format",
                 field=field_name,
-                value=url_str,
-                context={"validation_type": "missing_scheme", "allowed_schemes": allowed_schemes},
+                value=value[:100],  # Truncate for logging
+                context={"validation_type": "pattern", "pattern": regex.pattern},
             )
 
-        if parsed.scheme.lower() not in [s.lower() for s in allowed_schemes]:
+    return value
+
+
+def validate_integer(
+    value: Any,
+    field_name: str,
+    min_value: int | None = None,
+    max_value: int | None = None,
+    required: bool = True,
+) -> int | None:
+    """
+    Validate integer input.
+
+    Args:
+        value: Value to validate
+        field_name: Name of the field being validated
+        min_value: Minimum allowed value
+        max_value: Maximum allowed value
+        required: Whether the field is required
+
+    Returns:
+        Validated integer or None if not required and empty
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    if value is None or value == "":
+        if required:
             raise ValidationError(
-                f"{field_name} must use one of these schemes: {', '.join(allowed_schemes)}",
+                f"{field_name} is required",
                 field=field_name,
-                value=url_str,
-                context={
-                    "validation_type": "invalid_scheme",
-                    "scheme": parsed.scheme,
-                    "allowed_schemes": allowed_schemes,
-                },
+                value=value,
+                context={"validation_type": "required"},
             )
+        return None
 
-        # Check netloc (domain)
-        if not parsed.netloc:
-            raise ValidationError(
-                f"{field_name} must include a valid domain",
-                field=field_name,
-                value=url_str,
-                context={"validation_type": "missing_domain"},
-            )
+    # Try to convert to integer
+    try:
+        if isinstance(value, str):
+            value = value.strip()
+        int_value = int(value)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(
+            f"{field_name} must be a valid integer",
+            field=field_name,
+            value=value,
+            context={"validation_type": "type_conversion", "original_error": str(e)},
+        ) from e
+
+    # Check range constraints
+    if min_value is not None and int_value < min_value:
+        raise ValidationError(
+            f"{field_name} must be at least {min_value}",
+            field=field_name,
+            value=int_value,
+            context={"validation_type": "min_value", "min_value": min_value},
+        )
 
-        return url_str
+    if max_value is not None and int_value > max_value:
+        raise ValidationError(
+            f"{field_name} must not exceed {max_value}",
+            field=field_name,
+            value=int_value,
+            context={"validation_type": "max_value", "max_value": max_value},
+        )
 
-    @staticmethod
-    def validate_email(value: Any, field_name: str, required: bool = True) -> str | None:
-        """
-        Validate email format.
+    return int_value
 
-        Args:
-            value: Value to validate
-            field_name: Name of the field being validated
-            required: Whether the field is required
 
-        Returns:
-            Validated email or None if not required and empty
+def validate_url(
+    value: Any,
+    field_name: str,
+    required: bool = True,
+    allowed_schemes: list[str] | None = None,
+) -> str | None:
+    """
+    Validate URL format.
 
-        Raises:
-            ValidationError: If validation fails
-        """
-        if value is None or (isinstance(value, str) and not value.strip()):
-            if required:
-                raise ValidationError(
-                    f"{field_name} is required",
-                    field=field_name,
-                    value=value,
-                    context={"validation_type": "required"},
-                )
-            return None
+    Args:
+        value: Value to validate
+        field_name: Name of the field being validated
+        required: Whether the field is required
+        allowed_schemes: List of allowed URL schemes (default: ['http', 'https'])
 
-        email_str = str(value).strip().lower()
+    Returns:
+        Validated URL or None if not required and empty
 
-        # Basic email pattern (more comprehensive than simple regex)
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    Raises:
+        ValidationError: If validation fails
+    """
+    if allowed_schemes is None:
+        allowed_schemes = ["http", "https"]
 
-        if not re.match(email_pattern, email_str):
+    if value is None or (isinstance(value, str) and not value.strip()):
+        if required:
             raise ValidationError(
-                f"{field_name} must be a valid email address",
+                f"{field_name} is required",
                 field=field_name,
-                value=email_str,
-                context={"validation_type": "email_format"},
+                value=value,
+                context={"validation_type": "required"},
             )
+        return None
 
-        # Additional checks
-        if ".." in email_str:
-            raise ValidationError(
-                f"{field_name} cannot contain consecutive dots",
-                field=field_name,
-                value=email_str,
-                context={"validation_type": "consecutive_dots"},
-            )
+    url_str = str(value).strip()
+
+    try:
+        # urlsplit also rejects malformed IPv6 hosts and NFKC-unsafe netlocs and
+        # strips embedded tabs/newlines, so keep it rather than a hand-rolled split
+        parsed = urlsplit(url_str)
+    except ValueError as e:
+        raise ValidationError(
+            f"{field_name} must be a valid URL",
+            field=field_name,
+            value=url_str,
+            context={"validation_type": "url_parse", "original_error": str(e)},
+        ) from e
+
+    scheme = parsed.scheme
+
+    # Check scheme
+    if not scheme:
+        raise ValidationError(
+            f"{field_name} must include a scheme (e.g., https://)",
+            field=field_name,
+            value=url_str,
+            context={"validation_type": "missing_scheme", "allowed_schemes": allowed_schemes},
+        )
 
-        if len(email_str) > 254:  # RFC 5321 limit
+    if scheme not in _lower_frozenset(tuple(allowed_schemes)):
+        raise ValidationError(
+            f"{field_name} must use one of these schemes: {', '.join(allowed_schemes)}",
+            field=field_name,
+            value=url_str,
+            context={
+                "validation_type": "invalid_scheme",
+                "scheme": scheme,
+                "allowed_schemes": allowed_schemes,
+            },
+        )
+
+    # Check netloc (domain)
+    if not parsed.netloc:
+        raise ValidationError(
+            f"{field_name} must include a valid domain",
+            field=field_name,
+            value=url_str,
+            context={"validation_type": "missing_domain"},
+        )
+
+    return url_str
+
+
+def validate_email(value: Any, field_name: str, required: bool = True) -> str | None:
+    """
+    Validate email format.
+
+    Args:
+        value: Value to validate
+        field_name: Name of the field being validated
+        required: Whether the field is required
+
+    Returns:
+        Validated email or None if not required and empty
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        if required:
             raise ValidationError(
-                f"{field_name} is too long (maximum 254 characters)",
+                f"{field_name} is required",
                 field=field_name,
-                value=email_str[:100],
-                context={"validation_type": "email_too_long", "length": len(email_str)},
+                value=value,
+                context={"validation_type": "required"},
             )
+        return None
+
+    email_str = str(value).strip().lower()
+
+    if not _is_valid_email(email_str):
+        raise ValidationError(
+            f"{field_name} must be a valid email address",
+            field=field_name,
+            value=email_str,
+            context={"validation_type": "email_format"},
+        )
+
+    # Additional checks
+    if ".." in email_str:
+        raise ValidationError(
+            f"{field_name} cannot contain consecutive dots",
+            field=field_name,
+            value=email_str,
+            context={"validation_type": "consecutive_dots"},
+        )
 
-        return email_str
-
-    @staticmethod
-    def validate_choice(
-        value: Any,
-        field_name: str,
-        choices: list[Any],
-        required: bool = True,
-        case_sensitive: bool = True,
-    ) -> Any | None:
-        """
-        Validate that value is one of the allowed choices.
-
-        Args:
-            value: Value to validate
-            field_name: Name of the field being validated
-            choices: List of allowed values
-            required: Whether the field is required
-            case_sensitive: Whether string comparison should be case sensitive
-
-        Returns:
-            Validated choice or None if not required and empty
-
-        Raises:
-            ValidationError: If validation fails
-        """
-        if value is None or (isinstance(value, str) and not value.strip()):
-            if required:
-                raise ValidationError(
-                    f"{field_name} is required",
-                    field=field_name,
-                    value=value,
-                    context={"validation_type": "required", "choices": choices},
-                )
-            return None
-
-        # For string comparisons, handle case sensitivity
-        if isinstance(value, str) and not case_sensitive:
-            value_to_check = value.lower()
-            choices_to_check = [str(c).lower() if isinstance(c, str) else c for c in choices]
-        else:
-            value_to_check = value
-            choices_to_check = choices
-
-        if value_to_check not in choices_to_check:
+    if len(email_str) > 254:  # RFC 5321 limit
+        raise ValidationError(
+            f"{field_name} is too long (maximum 254 characters)",
+            field=field_name,
+            value=email_str[:100],
+            context={"validation_type": "email_too_long", "length": len(email_str)},
+        )
+
+    return email_str
+
+
+def validate_choice(
+    value: Any,
+    field_name: str,
+    choices: list[Any],
+    required: bool = True,
+    case_sensitive: bool = True,
+) -> Any | None:
+    """
+    Validate that value is one of the allowed choices.
+
+    Args:
+        value: Value to validate
+        field_name: Name of the field being validated
+        choices: List of allowed values
+        required: Whether the field is required
+        case_sensitive: Whether string comparison should be case sensitive
+
+    Returns:
+        Validated choice or None if not required and empty
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        if required:
             raise ValidationError(
-                f"{field_name} must be one of: {', '.join(map(str, choices))}",
+                f"{field_name} is required",
                 field=field_name,
                 value=value,
-                context={
-                    "validation_type": "invalid_choice",
-                    "choices": choices,
-                    "case_sensitive": case_sensitive,
-                },
+                context={"validation_type": "required", "choices": choices},
             )
+        return None
+
+    # For string comparisons, handle case sensitivity; the lookup table also gives
+    # back the original case of the matching choice
+    original_choice: Any = value
+    if isinstance(value, str) and not case_sensitive:
+        by_lower = _choices_by_lower(tuple(c for c in choices if isinstance(c, str)))
+        original_choice = by_lower.get(value.lower())
+        is_valid = original_choice is not None
+    else:
+        is_valid = value in choices
+
+    if not is_valid:
+        raise ValidationError(
+            f"{field_name} must be one of: {', '.join(map(str, choices))}",
+            field=field_name,
+            value=value,
+            context={
+                "validation_type": "invalid_choice",
+                "choices": choices,
+                "case_sensitive": case_sensitive,
+            },
+        )
+
+    return original_choice
+
+
+def validate_dict(
+    value: Any, field_name: str, required_keys: list[str] | None = None, required: bool = True
+) -> dict[str, Any] | None:
+    """
+    Validate dictionary input.
 
-        # Return original case if case insensitive match
-        if isinstance(value, str) and not case_sensitive:
-            for original_choice in choices:
-                if isinstance(original_choice, str) and original_choice.lower() == value.lower():
-                    return original_choice
-
-        return value
-
-    @staticmethod
-    def validate_dict(
-        value: Any, field_name: str, required_keys: list[str] | None = None, required: bool = True
-    ) -> dict[str, Any] | None:
-        """
-        Validate dictionary input.
-
-        Args:
-            value: Value to validate
-            field_name: Name of the field being validated
-            required_keys: List of keys that must be present
-            required: Whether the field is required
-
-        Returns:
-            Validated dictionary or None if not required and empty
-
-        Raises:
-            ValidationError: If validation fails
-        """
-        if value is None:
-            if required:
-                raise ValidationError(
-                    f"{field_name} is required",
-                    field=field_name,
-                    value=value,
-                    context={"validation_type": "required"},
-                )
-            return None
-
-        if not isinstance(value, dict):
+    Args:
+        value: Value to validate
+        field_name: Name of the field being validated
+        required_keys: List of keys that must be present
+        required: Whether the field is required
+
+    Returns:
+        Validated dictionary or None if not required and empty
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    if value is None:
+        if required:
             raise ValidationError(
-                f"{field_name} must be a dictionary",
+                f"{field_name} is required",
                 field=field_name,
-                value=type(value).__name__,
-                context={"validation_type": "type_mismatch", "expected_type": "dict"},
+                value=value,
+                context={"validation_type": "required"},
             )
+        return None
 
-        # Check required keys
-        if required_keys:
-            missing_keys = [key for key in required_keys if key not in value]
-            if missing_keys:
-                raise ValidationError(
-                    f"{field_name} is missing required keys: {', '.join(missing_keys)}",
-                    field=field_name,
-                    value=list(value.keys()),
-                    context={
-                        "validation_type": "missing_keys",
-                        "missing_keys": missing_keys,
-                        "required_keys": required_keys,
-                    },
-                )
+    if not isinstance(value, dict):
+        raise ValidationError(
+            f"{field_name} must be a dictionary",
+            field=field_name,
+            value=type(value).__name__,
+            context={"validation_type": "type_mismatch", "expected_type": "dict"},
+        )
+
+    # Check required keys; the set difference runs in C and the ordered list of
+    # missing keys is only built on failure
+    if required_keys and (missing_set := set(required_keys).difference(value)):
+        missing_keys = [key for key in required_keys if key in missing_set]
+        raise ValidationError(
+            f"{field_name} is missing required keys: {', '.join(missing_keys)}",
+            field=field_name,
+            value=list(value.keys()),
+            context={
+                "validation_type": "missing_keys",
+                "missing_keys": missing_keys,
+                "required_keys": required_keys,
+            },
+        )
 
-        return value
+    return value
+
+
+class Validator:
+    """
+    Comprehensive validation utility with detailed error reporting.
+
+    A namespace over the module-level validators, kept for existing callers; code in
+    this module calls the functions directly.
+    """
+
+    validate_string = staticmethod(validate_string)
+    validate_integer = staticmethod(validate_integer)
+    validate_url = staticmethod(validate_url)
+    validate_email = staticmethod(validate_email)
+    validate_choice = staticmethod(validate_choice)
+    validate_dict = staticmethod(validate_dict)
 
 
 # Convenience function for validating API keys
 def validate_api_key(key: Any, service_name: str) -> str:
     """Validate API key format and presence."""
-    return Validator.validate_string(
+    return validate_string(
         key,
         f"{service_name} API key",
         min_length=10,
@@ -457,24 +558,26 @@ def validate_api_key(key: Any, service_name: str) -> str:
 # Convenience function for validating tweet content
 def validate_tweet_content(content: Any) -> str:
     """Validate tweet content according to X/Twitter requirements."""
-    validated_content = Validator.validate_string(
+    # No code point max_length here: emoji sequences and decomposed characters span
+    # several code points but count less toward X's limit
+    validated_content = validate_string(
         content,
         "tweet content",
         min_length=1,
-        max_length=280,
         required=True,
         strip_whitespace=True,
     )
 
-    # Additional checks for tweet content
-    if len(validated_content.encode("utf-8")) > 280 * 4:  # Unicode characters can be up to 4 bytes
+    weighted_length = _tweet_weighted_length(validated_content)
+    if weighted_length > MAX_TWEET_LENGTH:
         raise ValidationError(
-            "Tweet content contains too many multi-byte characters",
+            "Tweet content exceeds the X weighted character limit",
             field="tweet_content",
             value=validated_content[:100],
             context={
-                "validation_type": "encoding_length",
-                "byte_length": len(validated_content.encode("utf-8")),
+                "validation_type": "weighted_length",
+                "weighted_length": weighted_length,
+                "max_length": MAX_TWEET_LENGTH,
             },
         )
 
@@ -484,12 +587,20 @@ def validate_tweet_content(content: Any) -> str:
 # Convenience function for validating user IDs
 def validate_user_id(user_id: Any, service_name: str = "user") -> str:
     """Validate user ID format."""
-    return Validator.validate_string(
+    field_name = f"{service_name} ID"
+    value = validate_string(
         user_id,
-        f"{service_name} ID",
+        field_name,
         min_length=1,
         max_length=100,
-        pattern=r"^[a-zA-Z0-9_-]+$",
         required=True,
         strip_whitespace=True,
     )
+    if not _USER_ID_CHARS.issuperset(value):
+        raise ValidationError(
+            f"{field_name} does not match required format",
+            field=field_name,
+            value=value[:100],  # Truncate for logging
+            context={"validation_type": "pattern", "pattern": PATTERN_USER_ID},
+        )
+    return value
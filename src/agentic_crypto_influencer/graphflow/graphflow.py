@@ -1,8 +1,11 @@
 import asyncio
 from collections.abc import Mapping
+from contextlib import suppress
 from datetime import datetime
-import json
+from functools import lru_cache
+import logging
 from pathlib import Path
+import re
 import sys
 from typing import Any
 
@@ -13,45 +16,145 @@ if str(project_root) not in sys.path:
 
 from autogen_agentchat.conditions import TextMentionTermination  # noqa: E402
 from autogen_agentchat.teams import DiGraphBuilder, GraphFlow  # noqa: E402
-from autogen_ext.models.openai import OpenAIChatCompletionClient  # noqa: E402
+import orjson  # noqa: E402
 
 from src.agentic_crypto_influencer.agents.publish_agent import PublishAgent  # noqa: E402
 from src.agentic_crypto_influencer.agents.search_agent import SearchAgent  # noqa: E402
 from src.agentic_crypto_influencer.agents.summary_agent import SummaryAgent  # noqa: E402
+from src.agentic_crypto_influencer.config.app_constants import (  # noqa: E402
+    BROADCAST_BACKLOG_MAX_SIZE,
+    BROADCAST_BATCH_SIZE,
+    BROADCAST_FLUSH_TIMEOUT,
+    BROADCAST_QUEUE_MAX_SIZE,
+)
 from src.agentic_crypto_influencer.config.key_constants import GOOGLE_GENAI_API_KEY  # noqa: E402
 from src.agentic_crypto_influencer.config.logging_config import (  # noqa: E402
     get_logger,
     setup_logging,
 )
-from src.agentic_crypto_influencer.config.model_constants import MODEL_ID  # noqa: E402
-from src.agentic_crypto_influencer.error_management.error_manager import ErrorManager  # noqa: E402
+from src.agentic_crypto_influencer.config.model_constants import (  # noqa: E402
+    MODEL_ID,
+    MODEL_PARALLEL_TOOL_CALLS,
+)
+from src.agentic_crypto_influencer.config.redis_constants import (  # noqa: E402
+    REDIS_KEY_GRAPHFLOW_ACTIVITIES,
+)
+from src.agentic_crypto_influencer.error_management.error_manager import error_manager  # noqa: E402
 from src.agentic_crypto_influencer.tools.redis_handler import RedisHandler  # noqa: E402
 
 # Initialize logging
 setup_logging()
 logger = get_logger("graphflow.main")
-error_manager = ErrorManager()
 
+# Substrings marking an agent message as publishing-related
+_PUBLISH_KEYWORDS = ("tweet", "post", "publish", "twitter", "x.com")
+
+# Case-insensitive message-type patterns, checked in priority order by format_agent_message
+_ERROR_RE = re.compile("error", re.IGNORECASE)
+_PUBLISH_RE = re.compile("|".join(map(re.escape, _PUBLISH_KEYWORDS)), re.IGNORECASE)
+_TOOL_RE = re.compile("function|tool", re.IGNORECASE)
+
+# Substrings in an event (or its data) that indicate a tweet was posted
+_TWITTER_SUCCESS_INDICATORS = (
+    "successfully posted",
+    "tweet posted",
+    "published to twitter",
+    "posted to x",
+    "tweet id:",
+    "status_code: 201",
+    "tweet created",
+    "post successful",
+)
+# One case-insensitive alternation scans for every indicator without lowercasing the text
+_TWITTER_SUCCESS_RE = re.compile(
+    "|".join(map(re.escape, _TWITTER_SUCCESS_INDICATORS)), re.IGNORECASE
+)
 
-def broadcast_to_frontend(agent: str, message: str, activity_type: str = "info") -> None:
-    """Broadcast activity to frontend via Redis for live monitoring."""
-    try:
-        from src.agentic_crypto_influencer.tools.redis_handler import RedisHandler
-
-        redis_handler = RedisHandler(lazy_connect=True)
-        activity = {
-            "agent": agent,
-            "message": message,
-            "type": activity_type,
-            "timestamp": datetime.now().isoformat(),
-        }
+# Agent name embedded in a message repr, e.g. name='SearchAgent'
+_MESSAGE_NAME_RE = re.compile(r"name='([^']+)'")
 
-        # Store in Redis with expiry for frontend to pick up
-        redis_handler.set("graphflow_activity", json.dumps(activity))
-        logger.debug(f"Broadcasted to frontend: [{agent}] {message}")
+# Activities waiting for _broadcast_worker; only set while main() is running
+_broadcast_queue: asyncio.Queue[dict[str, Any]] | None = None
 
+# (agent, message, type) of the latest broadcast; an identical follow-up is dropped
+_last_broadcast: tuple[str, str, str] | None = None
+
+
+@lru_cache(maxsize=1)
+def _get_fallback_redis_handler() -> RedisHandler:
+    """Return the handler for broadcasts made while no worker is running, built once."""
+    return RedisHandler(lazy_connect=True)
+
+
+def _publish_activities(redis_handler: RedisHandler, activities: list[dict[str, Any]]) -> None:
+    """Append activities to the Redis list the frontend drains, in one pipelined write."""
+    try:
+        # Redis stores the orjson bytes as-is
+        redis_handler.push_capped(
+            REDIS_KEY_GRAPHFLOW_ACTIVITIES,
+            [orjson.dumps(activity) for activity in activities],
+            BROADCAST_BACKLOG_MAX_SIZE,
+        )
+        logger.debug("Broadcasted %d activities to frontend", len(activities))
     except Exception as e:
-        logger.warning(f"Failed to broadcast to frontend: {e}")
+        logger.warning("Failed to broadcast to frontend: %s", e)
+
+
+async def _broadcast_worker(
+    queue: asyncio.Queue[dict[str, Any]], redis_handler: RedisHandler
+) -> None:
+    """Drain queued activities into Redis, batching whatever queued up during the last write."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < BROADCAST_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            await asyncio.to_thread(_publish_activities, redis_handler, batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def _stop_broadcast_worker(worker: asyncio.Task[None]) -> None:
+    """Flush pending activities (up to BROADCAST_FLUSH_TIMEOUT) and cancel the worker."""
+    global _broadcast_queue
+    queue, _broadcast_queue = _broadcast_queue, None
+    if queue is not None:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(queue.join(), BROADCAST_FLUSH_TIMEOUT)
+    worker.cancel()
+    with suppress(asyncio.CancelledError):
+        await worker
+
+
+def broadcast_to_frontend(agent: str, message: str, activity_type: str = "info") -> None:
+    """
+    Broadcast activity to frontend via Redis for live monitoring.
+
+    While main() runs this only enqueues the activity for the background worker, so
+    workflow events never wait on Redis; outside of it the activity is written directly.
+    A repeat of the immediately preceding activity is skipped.
+    """
+    global _last_broadcast
+    broadcast_key = (agent, message, activity_type)
+    if broadcast_key == _last_broadcast:
+        return
+    _last_broadcast = broadcast_key
+
+    activity = {
+        "agent": agent,
+        "message": message,
+        "type": activity_type,
+        "timestamp": datetime.now().isoformat(),
+    }
+    queue = _broadcast_queue
+    if queue is None:
+        _publish_activities(_get_fallback_redis_handler(), [activity])
+        return
+    try:
+        queue.put_nowait(activity)
+    except asyncio.QueueFull:
+        logger.warning("Frontend broadcast queue full, dropping activity from %s", agent)
 
 
 async def process_agent_conversations(event: Any, event_count: int) -> None:
@@ -60,7 +163,10 @@ async def process_agent_conversations(event: Any, event_count: int) -> None:
         # Check for messages in the event
         event_messages = getattr(event, "messages", None)
         if event_messages:
-            for msg_idx, message in enumerate(event_messages[-3:]):  # Last 3 messages
+            # Last 3 messages, indexed in place instead of copying a slice
+            first_idx = max(len(event_messages) - 3, 0)
+            for msg_idx in range(len(event_messages) - first_idx):
+                message = event_messages[first_idx + msg_idx]
                 formatted_message = format_agent_message(message, event_count, msg_idx)
                 if formatted_message:
                     broadcast_to_frontend(
@@ -97,7 +203,7 @@ async def process_agent_conversations(event: Any, event_count: int) -> None:
                 broadcast_to_frontend("System", f"📊 Data: {data_str[:300]}", "info")
 
     except Exception as e:
-        logger.debug(f"Could not process agent conversations: {e}")
+        logger.debug("Could not process agent conversations: %s", e)
 
 
 def format_agent_message(message: Any, event_count: int, msg_idx: int) -> dict[str, str] | None:
@@ -116,9 +222,7 @@ def format_agent_message(message: Any, event_count: int, msg_idx: int) -> dict[s
             agent_name = f"Agent ({message_role})"
         elif "name=" in message_str:
             # Try to extract name from string representation
-            import re
-
-            name_match = re.search(r"name='([^']+)'", message_str)
+            name_match = _MESSAGE_NAME_RE.search(message_str)
             if name_match:
                 agent_name = name_match.group(1)
 
@@ -139,17 +243,14 @@ def format_agent_message(message: Any, event_count: int, msg_idx: int) -> dict[s
             return None
 
         # Determine message type
-        msg_type = "chat"
-        content_lower = content.lower()
-        if "error" in content_lower:
+        if _ERROR_RE.search(content):
             msg_type = "error"
-        elif any(
-            keyword in content_lower
-            for keyword in ["tweet", "post", "publish", "twitter", "x.com"]
-        ):
+        elif _PUBLISH_RE.search(content):
             msg_type = "success"
-        elif "function" in message_str.lower() or "tool" in message_str.lower():
+        elif _TOOL_RE.search(message_str):
             msg_type = "info"
+        else:
+            msg_type = "chat"
 
         return {
             "agent": agent_name,
@@ -161,70 +262,84 @@ def format_agent_message(message: Any, event_count: int, msg_idx: int) -> dict[s
         }
 
     except Exception as e:
-        logger.debug(f"Could not format message: {e}")
+        logger.debug("Could not format message: %s", e)
         return None
 
 
 async def check_for_twitter_success(event: Any, event_str: str) -> bool:
     """Check if the event indicates successful Twitter posting."""
     try:
-        success_indicators = [
-            "successfully posted",
-            "tweet posted",
-            "published to twitter",
-            "posted to x",
-            "tweet id:",
-            "status_code: 201",
-            "tweet created",
-            "post successful",
-        ]
-
-        event_lower = event_str.lower()
-        for indicator in success_indicators:
-            if indicator in event_lower:
-                logger.info(f"Twitter success detected: {indicator}")
-                return True
+        indicator_match = _TWITTER_SUCCESS_RE.search(event_str)
+        if indicator_match:
+            logger.info("Twitter success detected: %s", indicator_match.group(0).lower())
+            return True
 
         # Check if we have a successful response structure
         event_data = getattr(event, "data", None)
-        if event_data:
-            data_str = str(event_data).lower()
-            if any(indicator in data_str for indicator in success_indicators):
-                logger.info("Twitter success detected in event data")
-                return True
+        if event_data and _TWITTER_SUCCESS_RE.search(str(event_data)):
+            logger.info("Twitter success detected in event data")
+            return True
 
         return False
 
     except Exception as e:
-        logger.debug(f"Error checking Twitter success: {e}")
+        logger.debug("Error checking Twitter success: %s", e)
         return False
 
 
 async def main() -> None:
     """Main function to run the crypto influencer agent workflow."""
+    global _broadcast_queue, _last_broadcast
     if not GOOGLE_GENAI_API_KEY:
         error_msg = "GOOGLE_GENAI_API_KEY environment variable is required"
         logger.error(error_msg)
         broadcast_to_frontend("GraphFlow", f"❌ {error_msg}", "error")
         raise ValueError(error_msg)
 
+    # One lazily connected handler serves both the team state and the broadcast worker
+    redis_handler = RedisHandler(lazy_connect=True)
+    _last_broadcast = None
+    _broadcast_queue = asyncio.Queue(maxsize=BROADCAST_QUEUE_MAX_SIZE)
+    broadcast_worker = asyncio.create_task(_broadcast_worker(_broadcast_queue, redis_handler))
+    try:
+        await _run_workflow(redis_handler)
+    finally:
+        await _stop_broadcast_worker(broadcast_worker)
+
+
+async def _run_workflow(redis_handler: RedisHandler) -> None:
+    """Build the agent graph and stream the workflow, persisting team state in Redis."""
     logger.info("Starting crypto influencer workflow", extra={"model_id": MODEL_ID})
     broadcast_to_frontend("GraphFlow", "🚀 Crypto influencer workflow wordt gestart...", "info")
 
     try:
-        # Initialize model client
+        # Initialize model client (imported here: the OpenAI/tiktoken stack is only
+        # needed once the workflow actually runs)
+        from autogen_ext.models.openai import OpenAIChatCompletionClient
+
         logger.debug("Initializing OpenAI model client")
         broadcast_to_frontend(
             "GraphFlow", "🔧 OpenAI model client wordt geïnitialiseerd...", "info"
         )
-        model_client = OpenAIChatCompletionClient(model=MODEL_ID, api_key=GOOGLE_GENAI_API_KEY)
+        model_client = OpenAIChatCompletionClient(
+            model=MODEL_ID,
+            api_key=GOOGLE_GENAI_API_KEY,
+            parallel_tool_calls=MODEL_PARALLEL_TOOL_CALLS,
+        )
 
-        # Initialize agents
-        logger.debug("Initializing agents")
+        # Initialize agents concurrently: each constructor builds its tool clients
+        # (Google GenAI, Bitvavo, Redis/OAuth) with blocking I/O, so fan them out
+        # to worker threads and fan back in before building the graph. The stored
+        # team_state is fetched alongside them so its round trip overlaps startup.
+        logger.debug("Initializing agents and loading team state from Redis")
         broadcast_to_frontend("GraphFlow", "🤖 Agents worden geïnitialiseerd...", "info")
-        search_agent = SearchAgent(model_client=model_client)
-        summary_agent = SummaryAgent(model_client=model_client)
-        publish_agent = PublishAgent(model_client=model_client)
+        broadcast_to_frontend("GraphFlow", "📥 Team state wordt geladen vanuit Redis...", "info")
+        search_agent, summary_agent, publish_agent, redis_team_state_bytes = await asyncio.gather(
+            asyncio.to_thread(SearchAgent, model_client=model_client),
+            asyncio.to_thread(SummaryAgent, model_client=model_client),
+            asyncio.to_thread(PublishAgent, model_client=model_client),
+            asyncio.to_thread(redis_handler.get, "team_state"),
+        )
 
         # Build graph
         logger.debug("Building agent graph")
@@ -246,19 +361,10 @@ async def main() -> None:
             termination_condition=termination_condition,
         )
 
-        # Initialize Redis handler
-        logger.debug("Initializing Redis handler")
-        broadcast_to_frontend("GraphFlow", "💾 Redis verbinding wordt geïnitialiseerd...", "info")
-        redis_handler = RedisHandler(lazy_connect=True)
-
-        # Load team_state from Redis if available
-        logger.debug("Loading team state from Redis")
-        broadcast_to_frontend("GraphFlow", "📥 Team state wordt geladen vanuit Redis...", "info")
-        redis_team_state_bytes = redis_handler.get("team_state")
-        redis_team_state: str = (
-            redis_team_state_bytes.decode("utf-8") if redis_team_state_bytes else "{}"
+        # Restore the team_state fetched during agent initialization, if any
+        team_state: Mapping[str, Any] = (
+            orjson.loads(redis_team_state_bytes) if redis_team_state_bytes else {}
         )
-        team_state: Mapping[str, Any] = json.loads(redis_team_state)
         await flow.load_state(team_state)
 
         if team_state:
@@ -282,7 +388,7 @@ async def main() -> None:
 
             # Log detailed event information
             event_type = type(event).__name__
-            logger.info(f"Workflow event {event_count} - Type: {event_type}")
+            logger.info("Workflow event %d - Type: %s", event_count, event_type)
 
             # Broadcast event progress to frontend
             if event_count % 5 == 0 or event_count < 10:  # Every 5th event or first 10
@@ -296,9 +402,9 @@ async def main() -> None:
             event_target = getattr(event, "target", None)
 
             if event_source:
-                logger.info(f"  Source: {event_source}")
+                logger.info("  Source: %s", event_source)
                 if event_target:
-                    logger.info(f"  Target: {event_target}")
+                    logger.info("  Target: %s", event_target)
                     # Broadcast agent communication
                     broadcast_to_frontend(
                         "Communication", f"🔄 {event_source} → {event_target}", "info"
@@ -311,13 +417,18 @@ async def main() -> None:
                     "Twitter", "🎉 Tweet succesvol geplaatst op X/Twitter!", "success"
                 )
 
-            logger.debug(f"  Full event preview: {full_event_str[:300]}")
+            # Guarded so the preview slice is only taken when DEBUG is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Full event preview: %s", full_event_str[:300])
 
         # Save state back to Redis
         logger.debug("Saving team state to Redis")
         broadcast_to_frontend("GraphFlow", "💾 Team state wordt opgeslagen in Redis...", "info")
         team_state = await flow.save_state()
-        redis_handler.set("team_state", json.dumps(team_state))
+        team_state_bytes = orjson.dumps(team_state, option=orjson.OPT_NON_STR_KEYS)
+        # Skip the write when the workflow left the stored state untouched
+        if team_state_bytes != redis_team_state_bytes:
+            await asyncio.to_thread(redis_handler.set, "team_state", team_state_bytes)
 
         logger.info(
             "Workflow completed successfully",
@@ -344,7 +455,6 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    setup_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -3,7 +3,7 @@ Main entry point for the frontend server module.
 Allows running: python -m src.agentic_crypto_influencer.tools.frontend_server
 """
 
-from .frontend_server import run_server
+from src.agentic_crypto_influencer.tools.frontend_server import run_server
 
 if __name__ == "__main__":
     run_server()
@@ -0,0 +1,69 @@
+"""
+Prebuilt FunctionTool wrappers for the agent tools.
+
+Wrapping a callable in a FunctionTool reflects its signature into a pydantic
+args model and JSON schema. Building each tool once per process lets every
+agent construction reuse the same schema instead of re-deriving it. Blocking
+client calls are dispatched to the shared tool executor.
+"""
+
+from functools import lru_cache
+
+from autogen_core.tools import FunctionTool
+
+from src.agentic_crypto_influencer.tools.bitvavo_handler import get_bitvavo_handler
+from src.agentic_crypto_influencer.tools.dup_check import get_duplicate_checker
+from src.agentic_crypto_influencer.tools.google_grounding_tool import get_google_grounding_tool
+from src.agentic_crypto_influencer.tools.tool_executor import run_in_tool_executor
+from src.agentic_crypto_influencer.tools.validator import LengthValidator
+from src.agentic_crypto_influencer.tools.x import get_x
+
+
+@lru_cache(maxsize=1)
+def get_post_tool() -> FunctionTool:
+    """Return the tool that publishes a tweet through the shared X client."""
+    return FunctionTool(
+        run_in_tool_executor(get_x().post),
+        name="post",
+        description="Post a message (1-280 characters) to X/Twitter and return the API response.",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_duplicate_check_tool() -> FunctionTool:
+    """Return the tool that checks a tweet against previously published ones."""
+    return FunctionTool(
+        run_in_tool_executor(get_duplicate_checker().is_duplicate),
+        name="is_duplicate",
+        description="Return true if the text is a near-duplicate of a previously published tweet.",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_crypto_search_tool() -> FunctionTool:
+    """Return the Google-grounded crypto news search tool."""
+    return FunctionTool(
+        run_in_tool_executor(get_google_grounding_tool().run_crypto_search),
+        name="run_crypto_search",
+        description="Search recent crypto news with Google Search grounding.",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_market_data_tool() -> FunctionTool:
+    """Return the Bitvavo ticker price tool."""
+    return FunctionTool(
+        run_in_tool_executor(get_bitvavo_handler().get_market_data),
+        name="get_market_data",
+        description="Fetch the current ticker price for a Bitvavo market, e.g. BTC-EUR.",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_length_validation_tool() -> FunctionTool:
+    """Return the batch tweet length validation tool."""
+    return FunctionTool(
+        LengthValidator.validate_length_batch,
+        name="validate_length_batch",
+        description="Check whether each text is within the tweet length bounds.",
+    )
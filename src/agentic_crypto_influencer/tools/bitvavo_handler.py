@@ -1,14 +1,21 @@
+from functools import lru_cache
+import threading
+import time
 from typing import Any
 
 from python_bitvavo_api.bitvavo import Bitvavo
 
-from src.agentic_crypto_influencer.config.app_constants import TOOL_NAME_BITVAVO
+from src.agentic_crypto_influencer.config.app_constants import (
+    MARKET_TICKER_CACHE_MAX_SIZE,
+    MARKET_TICKER_CACHE_TTL,
+    TOOL_NAME_BITVAVO,
+)
 from src.agentic_crypto_influencer.config.error_constants import (
     ERROR_CONFIG_MISSING_API_CREDENTIALS,
 )
 from src.agentic_crypto_influencer.config.key_constants import BITVAVO_API_KEY, BITVAVO_API_SECRET
 from src.agentic_crypto_influencer.config.logging_config import LoggerMixin, get_logger
-from src.agentic_crypto_influencer.error_management.error_manager import ErrorManager
+from src.agentic_crypto_influencer.error_management.error_manager import error_manager
 from src.agentic_crypto_influencer.error_management.exceptions import (
     APIConnectionError,
     ConfigurationError,
@@ -21,8 +28,12 @@ from src.agentic_crypto_influencer.error_management.validator import Validator
 class BitvavoHandler(LoggerMixin):
     def __init__(self) -> None:
         super().__init__()
-        self.error_manager = ErrorManager()
+        self.error_manager = error_manager
         self.validator = Validator()
+        # market -> (monotonic expiry, ticker response); agents often ask for the same market
+        self._ticker_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Tool calls run on a shared thread pool, so cache reads and evictions are locked
+        self._ticker_cache_lock = threading.Lock()
 
         # Validate API credentials
         try:
@@ -45,10 +56,21 @@ class BitvavoHandler(LoggerMixin):
         # Validate input
         self.validator.validate_string(market, "market", min_length=1)
 
+        now = time.monotonic()
+        with self._ticker_cache_lock:
+            cached = self._ticker_cache.get(market)
+        if cached is not None and cached[0] > now:
+            self.logger.debug(f"Using cached market data for {market}")
+            # Each caller gets its own copy, so mutations never leak into the cache
+            return dict(cached[1])
+
         self.logger.debug(f"Fetching market data for {market}")
         try:
             response: dict[str, Any] | None = self.client.tickerPrice({"market": market})
             self.logger.info(f"Successfully fetched market data for {market}")
+            # Bitvavo reports API errors in the body; only cache actual prices
+            if response and "errorCode" not in response:
+                self._cache_ticker(market, response, now + MARKET_TICKER_CACHE_TTL)
             return response
         except Exception as e:
             context = {"market": market, "operation": "get_market_data"}
@@ -61,6 +83,21 @@ class BitvavoHandler(LoggerMixin):
             self.error_manager.handle_error(e, context=context)
             return None
 
+    def _cache_ticker(self, market: str, response: dict[str, Any], expires_at: float) -> None:
+        """Store a copy of a ticker response, evicting the oldest entry when the cache is full."""
+        with self._ticker_cache_lock:
+            cache = self._ticker_cache
+            cache.pop(market, None)
+            if len(cache) >= MARKET_TICKER_CACHE_MAX_SIZE:
+                del cache[next(iter(cache))]
+            cache[market] = (expires_at, dict(response))
+
+
+@lru_cache(maxsize=1)
+def get_bitvavo_handler() -> BitvavoHandler:
+    """Return the process-wide BitvavoHandler so the API client is built once."""
+    return BitvavoHandler()
+
 
 def main() -> None:
     """Main function for command-line usage."""
@@ -0,0 +1,101 @@
+"""
+Near-duplicate detection for published tweets.
+
+Each published tweet is reduced to a 64-bit SimHash over character 3-grams of
+its normalized tokens and stored in a Redis sorted set scored by publish time.
+A candidate tweet is a duplicate when its SimHash is within SIMHASH_MAX_DISTANCE
+bits of a hash published in the last SIMHASH_WINDOW seconds; older hashes and all
+but the newest SIMHASH_MAX_STORED are trimmed whenever a tweet is recorded.
+"""
+
+from functools import lru_cache
+import hashlib
+import re
+import time
+
+from src.agentic_crypto_influencer.config.app_constants import (
+    SIMHASH_MAX_DISTANCE,
+    SIMHASH_MAX_STORED,
+    SIMHASH_NGRAM_SIZE,
+    SIMHASH_WINDOW,
+)
+from src.agentic_crypto_influencer.config.logging_config import LoggerMixin
+from src.agentic_crypto_influencer.config.redis_constants import REDIS_KEY_PUBLISHED_SIMHASHES
+from src.agentic_crypto_influencer.tools.redis_handler import RedisHandler
+
+SIMHASH_BITS = 64
+
+# Words, numbers and hashtags; punctuation and spacing differences are ignored
+TOKEN_RE = re.compile(r"[#$]?\w+")
+
+
+def simhash(text: str, ngram_size: int = SIMHASH_NGRAM_SIZE) -> int:
+    """Compute the 64-bit SimHash of a text over its character n-grams."""
+    normalized = " ".join(TOKEN_RE.findall(text.lower()))
+    if len(normalized) <= ngram_size:
+        grams = [normalized]
+    else:
+        grams = [normalized[i : i + ngram_size] for i in range(len(normalized) - ngram_size + 1)]
+
+    weights = [0] * SIMHASH_BITS
+    for gram in grams:
+        digest = int.from_bytes(hashlib.blake2b(gram.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Return the number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+class DuplicateChecker(LoggerMixin):
+    """Check candidate tweets against the SimHashes of published tweets."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.redis_handler = RedisHandler(lazy_connect=True)
+
+    def is_duplicate(self, text: str) -> bool:
+        """
+        Check whether a tweet is a near-duplicate of a previously published one.
+
+        Args:
+            text (str): The candidate tweet text.
+
+        Returns:
+            bool: True if a recently published tweet has a SimHash within the distance
+                threshold.
+        """
+        candidate = simhash(text)
+        try:
+            published = self.redis_handler.members_since(
+                REDIS_KEY_PUBLISHED_SIMHASHES, time.time() - SIMHASH_WINDOW
+            )
+        except Exception as e:
+            # Fail open: a cache outage should not block publishing
+            self.logger.warning("Duplicate check unavailable: %s", e)
+            return False
+
+        return any(
+            hamming_distance(candidate, int(value)) <= SIMHASH_MAX_DISTANCE for value in published
+        )
+
+    def record(self, text: str) -> None:
+        """Store the SimHash of a published tweet and trim hashes outside the window."""
+        now = time.time()
+        self.redis_handler.add_scored_capped(
+            REDIS_KEY_PUBLISHED_SIMHASHES,
+            simhash(text),
+            now,
+            now - SIMHASH_WINDOW,
+            SIMHASH_MAX_STORED,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_duplicate_checker() -> DuplicateChecker:
+    """Return the process-wide duplicate checker (created on first use)."""
+    return DuplicateChecker()
@@ -70,6 +70,7 @@ from src.agentic_crypto_influencer.config.oauth_constants import (  # noqa: E402
 )
 from src.agentic_crypto_influencer.config.redis_constants import (  # noqa: E402
     REDIS_KEY_ACCESS_TOKEN,
+    REDIS_KEY_GRAPHFLOW_ACTIVITIES,
     REDIS_KEY_OAUTH_CODE_VERIFIER,
 )
 from src.agentic_crypto_influencer.tools.redis_handler import RedisHandler  # noqa: E402
@@ -403,29 +404,26 @@ def broadcast_activity(agent: str, message: str, activity_type: str = "info") ->
 
 
 def check_graphflow_activity() -> None:
-    """Check Redis for GraphFlow activities and broadcast them."""
+    """Drain queued GraphFlow activities from Redis and broadcast them."""
+    if not socketio_available:
+        return
     try:
-        graphflow_activity_data = redis_handler.get("graphflow_activity")
-        if graphflow_activity_data:
-            activity = json.loads(graphflow_activity_data)
-
-            # Broadcast the activity to connected clients
-            if socketio_available:
-                try:
-                    socketio.emit("agent_activity", activity, namespace="/stream")
-                    logger.debug(f"GraphFlow activity forwarded: {activity['message']}")
-
-                    # Add to recent activities
-                    with stream_lock:
-                        recent_activities.append(activity)
-                        if len(recent_activities) > MAX_RECENT_ACTIVITIES:
-                            recent_activities.pop(0)
-
-                    # Clear the activity from Redis to prevent duplication
-                    redis_handler.delete("graphflow_activity")
-
-                except Exception as e:
-                    logger.warning(f"Failed to forward GraphFlow activity: {e}")
+        # Popping the whole list also clears it, so activities are forwarded once
+        for graphflow_activity_data in redis_handler.pop_all(REDIS_KEY_GRAPHFLOW_ACTIVITIES):
+            # Decode and broadcast per item, so one bad payload doesn't drop the rest
+            try:
+                activity = json.loads(graphflow_activity_data)
+                socketio.emit("agent_activity", activity, namespace="/stream")
+                logger.debug(f"GraphFlow activity forwarded: {activity['message']}")
+
+                # Add to recent activities
+                with stream_lock:
+                    recent_activities.append(activity)
+                    if len(recent_activities) > MAX_RECENT_ACTIVITIES:
+                        recent_activities.pop(0)
+
+            except Exception as e:
+                logger.warning(f"Failed to forward GraphFlow activity: {e}")
 
     except Exception as e:
         logger.debug(f"No GraphFlow activity to forward: {e}")
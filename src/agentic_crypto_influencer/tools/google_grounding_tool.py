@@ -1,9 +1,10 @@
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from src.agentic_crypto_influencer.config.key_constants import GOOGLE_API_KEY
 from src.agentic_crypto_influencer.config.logging_config import LoggerMixin, get_logger
 from src.agentic_crypto_influencer.config.model_constants import MODEL_ID
-from src.agentic_crypto_influencer.error_management.error_manager import ErrorManager
+from src.agentic_crypto_influencer.error_management.error_manager import error_manager
 from src.agentic_crypto_influencer.error_management.exceptions import (
     APIConnectionError,
     APITimeoutError,
@@ -30,7 +31,7 @@ if TYPE_CHECKING:
 class GoogleGroundingTool(LoggerMixin):
     def __init__(self) -> None:
         super().__init__()
-        self.error_manager = ErrorManager()
+        self.error_manager = error_manager
         self.validator = Validator()
 
         if not google_genai_available:
@@ -93,10 +94,15 @@ class GoogleGroundingTool(LoggerMixin):
         return str(response.text)
 
 
+@lru_cache(maxsize=1)
+def get_google_grounding_tool() -> GoogleGroundingTool:
+    """Return the process-wide GoogleGroundingTool so credentials are validated once."""
+    return GoogleGroundingTool()
+
+
 def main() -> None:
     """Main function for command-line usage."""
     logger = get_logger(__name__)
-    error_manager = ErrorManager()
 
     try:
         logger.info("Starting Google Grounding Tool search")
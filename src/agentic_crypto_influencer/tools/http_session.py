@@ -0,0 +1,26 @@
+"""
+Shared HTTP session for outbound REST calls.
+
+A single requests.Session keeps TCP/TLS connections alive between calls, so
+posting a tweet or fetching trends does not pay a fresh handshake each time.
+"""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.agentic_crypto_influencer.config.app_constants import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+)
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled HTTP session."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
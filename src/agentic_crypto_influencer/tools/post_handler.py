@@ -1,9 +1,8 @@
 import logging
 from typing import Any
 
-import requests
-
 from src.agentic_crypto_influencer.config.key_constants import X_TWEETS_ENDPOINT, X_URL
+from src.agentic_crypto_influencer.tools.http_session import get_http_session
 
 
 class PostHandler:
@@ -21,7 +20,9 @@ class PostHandler:
         }
         payload = {"text": post}
         try:
-            response = requests.post(self.endpoint, json=payload, headers=headers, timeout=30)
+            response = get_http_session().post(
+                self.endpoint, json=payload, headers=headers, timeout=30
+            )
             logging.info("Post response status: %d", response.status_code)
             if response.status_code != 201:
                 logging.error("Request error: %d %s", response.status_code, response.text)
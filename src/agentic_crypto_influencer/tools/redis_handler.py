@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 import logging
 from typing import Any
 
@@ -68,6 +69,55 @@ class RedisHandler:
             logging.error("Failed to delete key '%s' from Redis: %s", key, str(e))
             raise RuntimeError(f"Error deleting key '{key}' from Redis: {e!s}") from e
 
+    def add_scored_capped(
+        self, key: str, member: Any, score: float, min_score: float, max_length: int
+    ) -> None:
+        """Add a scored member to a sorted set, then trim it by min_score and max_length."""
+        self._ensure_connected()
+        try:
+            with self.redis_client.pipeline(transaction=False) as pipe:  # type: ignore[union-attr]
+                pipe.zadd(key, {member: score})
+                pipe.zremrangebyscore(key, "-inf", f"({min_score}")
+                pipe.zremrangebyrank(key, 0, -max_length - 1)
+                pipe.execute()
+        except Exception as e:
+            logging.error("Failed to add to sorted set '%s' in Redis: %s", key, str(e))
+            raise RuntimeError(f"Error adding to sorted set '{key}' in Redis: {e!s}") from e
+
+    def members_since(self, key: str, min_score: float) -> list[bytes]:
+        """Return the members of a sorted set scored at or above min_score."""
+        self._ensure_connected()
+        try:
+            return list(self.redis_client.zrangebyscore(key, min_score, "+inf"))  # type: ignore[union-attr]
+        except Exception as e:
+            logging.error("Failed to read sorted set '%s' from Redis: %s", key, str(e))
+            raise RuntimeError(f"Error reading sorted set '{key}' from Redis: {e!s}") from e
+
+    def push_capped(self, key: str, values: Sequence[Any], max_length: int) -> None:
+        """Append values to a Redis list and trim it to its newest max_length items."""
+        self._ensure_connected()
+        try:
+            with self.redis_client.pipeline(transaction=False) as pipe:  # type: ignore[union-attr]
+                pipe.rpush(key, *values)
+                pipe.ltrim(key, -max_length, -1)
+                pipe.execute()
+        except Exception as e:
+            logging.error("Failed to push to list '%s' in Redis: %s", key, str(e))
+            raise RuntimeError(f"Error pushing to list '{key}' in Redis: {e!s}") from e
+
+    def pop_all(self, key: str) -> list[bytes]:
+        """Atomically read and remove every item of a Redis list."""
+        self._ensure_connected()
+        try:
+            with self.redis_client.pipeline(transaction=True) as pipe:  # type: ignore[union-attr]
+                pipe.lrange(key, 0, -1)
+                pipe.delete(key)
+                items, _ = pipe.execute()
+            return list(items)
+        except Exception as e:
+            logging.error("Failed to pop list '%s' from Redis: %s", key, str(e))
+            raise RuntimeError(f"Error popping list '{key}' from Redis: {e!s}") from e
+
     def ping(self) -> bool:
         """Test Redis connection with ping."""
         self._ensure_connected()
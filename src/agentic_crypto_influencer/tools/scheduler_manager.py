@@ -4,6 +4,7 @@ Provides web-controlled scheduling that's as reliable as launchd but more flexib
 """
 
 from datetime import UTC, datetime
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
@@ -53,6 +54,17 @@ from src.agentic_crypto_influencer.tools.redis_handler import RedisHandler
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=128)
+def get_cron_trigger(preset_name: str, tz: str = SCHEDULER_TIMEZONE) -> CronTrigger:
+    """
+    Get the CronTrigger for a cron preset, parsing each (preset, timezone) once.
+
+    Raises:
+        KeyError: If the preset name is unknown.
+    """
+    return CronTrigger.from_crontab(CRON_PRESETS[preset_name], timezone=tz)
+
+
 class SchedulerManager:
     """
     Advanced job scheduler with GraphFlow process management.
@@ -204,14 +216,13 @@ class SchedulerManager:
         try:
             if schedule_type == "preset":
                 if schedule_value in CRON_PRESETS:
-                    cron_expr = CRON_PRESETS[schedule_value]
-                    return CronTrigger.from_crontab(cron_expr)
+                    return get_cron_trigger(schedule_value)
                 else:
                     logger.error(f"Unknown preset: {schedule_value}")
                     return None
 
             elif schedule_type == "cron":
-                return CronTrigger.from_crontab(schedule_value)
+                return CronTrigger.from_crontab(schedule_value, timezone=SCHEDULER_TIMEZONE)
 
             elif schedule_type == "date":
                 run_date = datetime.fromisoformat(schedule_value)
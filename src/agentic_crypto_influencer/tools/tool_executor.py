@@ -0,0 +1,38 @@
+"""
+Bounded thread pool for blocking agent tools.
+
+The X, Google GenAI and Bitvavo clients are synchronous. Running them on one
+sized executor keeps the event loop free while capping the number of worker
+threads when several agents call tools at the same time.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+import functools
+
+from src.agentic_crypto_influencer.config.app_constants import (
+    TOOL_EXECUTOR_MAX_WORKERS,
+    TOOL_EXECUTOR_THREAD_PREFIX,
+)
+
+TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=TOOL_EXECUTOR_MAX_WORKERS,
+    thread_name_prefix=TOOL_EXECUTOR_THREAD_PREFIX,
+)
+
+
+def run_in_tool_executor[**P, R](func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """
+    Wrap a blocking callable so it runs on the shared tool executor.
+
+    The wrapper keeps the wrapped signature and annotations, so FunctionTool
+    derives the same argument schema as for the original callable.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(TOOL_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+    return wrapper
@@ -1,12 +1,11 @@
 import logging
 from typing import Any
 
-import requests
-
 from src.agentic_crypto_influencer.config.key_constants import (
     X_PERSONALIZED_TRENDS_ENDPOINT,
     X_URL,
 )
+from src.agentic_crypto_influencer.tools.http_session import get_http_session
 
 
 class TrendsHandler:
@@ -20,7 +19,7 @@ class TrendsHandler:
         headers = {"Authorization": f"Bearer {self.access_token}"}
 
         try:
-            resp = requests.get(trends_url, headers=headers, timeout=15)
+            resp = get_http_session().get(trends_url, headers=headers, timeout=15)
             logging.info("Trends response status: %d", resp.status_code)
             if resp.status_code != 200:
                 logging.error("Trends request failed: %d %s", resp.status_code, resp.text)
@@ -1,3 +1,9 @@
+from src.agentic_crypto_influencer.config.app_constants import (
+    MAX_TWEET_LENGTH,
+    MIN_STRING_LENGTH_DEFAULT,
+)
+
+
 class LengthValidator:
     @staticmethod
     def validate_length(value: str, min_length: int = 1, max_length: int = 280) -> bool:
@@ -14,3 +20,25 @@ class LengthValidator:
         """
         length = len(value)
         return min_length <= length <= max_length
+
+    @staticmethod
+    def validate_length_batch(
+        values: list[str],
+        min_length: int = MIN_STRING_LENGTH_DEFAULT,
+        max_length: int = MAX_TWEET_LENGTH,
+    ) -> list[bool]:
+        """
+        Validates the length of several strings in a single call.
+
+        Lets an agent check all of its candidate tweets with one tool call
+        instead of one call per candidate.
+
+        Args:
+            values (list[str]): The strings to validate.
+            min_length (int): Minimum allowed length (inclusive).
+            max_length (int): Maximum allowed length (inclusive).
+
+        Returns:
+            list[bool]: One result per input string, in the same order.
+        """
+        return [min_length <= len(value) <= max_length for value in values]
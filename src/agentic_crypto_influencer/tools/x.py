@@ -3,11 +3,13 @@ Module for posting messages to X (Twitter) using OAuth2 authentication.
 Handles access token refresh and error management.
 """
 
+from functools import lru_cache
 import logging
 from typing import Any
 
 from src.agentic_crypto_influencer.config.logging_config import LoggerMixin, get_logger
-from src.agentic_crypto_influencer.error_management.error_manager import ErrorManager
+from src.agentic_crypto_influencer.error_management.error_manager import error_manager
+from src.agentic_crypto_influencer.tools.dup_check import get_duplicate_checker
 
 # Import tools with external dependencies conditionally
 try:
@@ -157,6 +159,10 @@ class X(LoggerMixin):
             self.logger.info("Post handler initialized successfully, calling post_message")
             result: dict[str, Any] = self.post_handler.post_message(post)
             self.logger.info(f"Successfully posted to X. Response: {result}")
+            try:
+                get_duplicate_checker().record(post)
+            except Exception as e:
+                self.logger.warning("Could not record published post for duplicate check: %s", e)
             return result
         except Exception as e:
             self.logger.error(f"Failed to post to X: {type(e).__name__}: {e}")
@@ -171,10 +177,10 @@ class X(LoggerMixin):
         Args:
             user_id (str): The X user id to fetch personalized trends for.
             max_results (int): Maximum number of trend results to return.
-            exclude (Optional[List[str]]): Optional list of trend types to exclude.
+            exclude (list[str] | None): Optional list of trend types to exclude.
 
         Returns:
-            Dict[str, Any]: Parsed JSON response from the trends endpoint.
+            dict[str, Any]: Parsed JSON response from the trends endpoint.
 
         Raises:
             RuntimeError: For network/refresh errors.
@@ -186,13 +192,23 @@ class X(LoggerMixin):
         return self.trends_handler.get_personalized_trends(user_id, max_results, exclude)  # type: ignore[no-any-return]
 
 
+@lru_cache(maxsize=1)
+def get_x() -> X:
+    """
+    Return the process-wide X client.
+
+    Agents share this instance so the Redis handler, OAuth handler and lazily
+    created post/trends handlers are built once instead of per agent.
+    """
+    return X()
+
+
 def main() -> None:
     """
     Main entry point for posting a message to X.
     Handles error management and logs results.
     """
     logger = get_logger(__name__)
-    error_manager = ErrorManager()
 
     try:
         logger.info("Starting X posting workflow")
@@ -0,0 +1,34 @@
+from unittest.mock import Mock, patch
+
+from src.agentic_crypto_influencer.tools.agent_tools import (
+    get_length_validation_tool,
+    get_post_tool,
+)
+
+
+def test_get_length_validation_tool_exposes_batch_schema() -> None:
+    """Test that the length validation tool takes a batch of values."""
+    tool = get_length_validation_tool()
+    assert tool.name == "validate_length_batch"
+    assert "values" in tool.schema["parameters"]["properties"]
+
+
+def test_get_post_tool_wraps_shared_x_client() -> None:
+    """Test that the post tool is bound to the shared X client's post method."""
+
+    def post(post: str) -> dict[str, str]:
+        return {"text": post}
+
+    get_post_tool.cache_clear()
+    try:
+        with patch(
+            "src.agentic_crypto_influencer.tools.agent_tools.get_x",
+            return_value=Mock(post=post),
+        ) as mock_get_x:
+            tool = get_post_tool()
+            assert tool is get_post_tool()
+            mock_get_x.assert_called_once_with()
+            assert tool.name == "post"
+            assert "post" in tool.schema["parameters"]["properties"]
+    finally:
+        get_post_tool.cache_clear()
@@ -65,6 +65,53 @@ def test_get_market_data_different_market(bitvavo_handler: BitvavoHandler) -> No
     assert result == expected_data
 
 
+@pytest.mark.unit
+def test_get_market_data_reuses_ticker_within_ttl() -> None:
+    """Test that repeated lookups of a market share one ticker call until the TTL expires."""
+    module = "src.agentic_crypto_influencer.tools.bitvavo_handler"
+    with (
+        patch(f"{module}.BITVAVO_API_KEY", "key"),
+        patch(f"{module}.BITVAVO_API_SECRET", "secret"),
+        patch(f"{module}.Bitvavo") as mock_bitvavo,
+        patch(f"{module}.time.monotonic") as mock_monotonic,
+    ):
+        ticker_price = mock_bitvavo.return_value.tickerPrice
+        ticker_price.return_value = {"market": "BTC-EUR", "price": "50000"}
+        handler = BitvavoHandler()
+
+        mock_monotonic.return_value = 100.0
+        assert handler.get_market_data("BTC-EUR") == {"market": "BTC-EUR", "price": "50000"}
+        mock_monotonic.return_value = 101.0
+        assert handler.get_market_data("BTC-EUR") == {"market": "BTC-EUR", "price": "50000"}
+        assert ticker_price.call_count == 1
+
+        mock_monotonic.return_value = 103.0
+        handler.get_market_data("BTC-EUR")
+        assert ticker_price.call_count == 2
+
+
+@pytest.mark.unit
+def test_get_market_data_returns_independent_copies() -> None:
+    """Test that mutating one caller's ticker result leaves the cached entry intact."""
+    module = "src.agentic_crypto_influencer.tools.bitvavo_handler"
+    with (
+        patch(f"{module}.BITVAVO_API_KEY", "key"),
+        patch(f"{module}.BITVAVO_API_SECRET", "secret"),
+        patch(f"{module}.Bitvavo") as mock_bitvavo,
+    ):
+        mock_bitvavo.return_value.tickerPrice.return_value = {"market": "BTC-EUR", "price": "1"}
+        handler = BitvavoHandler()
+
+        first = handler.get_market_data("BTC-EUR")
+        assert first is not None
+        first["price"] = "changed"
+        second = handler.get_market_data("BTC-EUR")
+        assert second is not None
+        second["market"] = "changed"
+
+        assert handler.get_market_data("BTC-EUR") == {"market": "BTC-EUR", "price": "1"}
+
+
 @pytest.mark.unit
 def test_main_success() -> None:
     """Test main function with successful market data retrieval."""
@@ -0,0 +1,72 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from src.agentic_crypto_influencer.config.app_constants import (
+    SIMHASH_MAX_DISTANCE,
+    SIMHASH_MAX_STORED,
+    SIMHASH_WINDOW,
+)
+from src.agentic_crypto_influencer.config.redis_constants import REDIS_KEY_PUBLISHED_SIMHASHES
+from src.agentic_crypto_influencer.tools.dup_check import (
+    DuplicateChecker,
+    hamming_distance,
+    simhash,
+)
+
+TWEET = "Bitcoin climbs above $70K as ETF inflows hit a record high this week. #Bitcoin #ETF"
+
+
+@pytest.fixture
+def checker() -> DuplicateChecker:
+    """DuplicateChecker with a mocked Redis handler."""
+    with patch("src.agentic_crypto_influencer.tools.dup_check.RedisHandler") as mock_redis:
+        mock_redis.return_value = Mock()
+        return DuplicateChecker()
+
+
+@pytest.mark.unit
+def test_simhash_near_duplicates_are_close() -> None:
+    """Test that punctuation and small rewording keep the SimHash within the threshold."""
+    assert simhash(TWEET) == simhash(TWEET.upper())
+    assert simhash(TWEET) == simhash(TWEET.replace("record high", "record-high"))
+    reworded = TWEET.replace("climbs", "rises")
+    other = "Ethereum developers schedule the next network upgrade for March. #Ethereum"
+    assert hamming_distance(simhash(TWEET), simhash(reworded)) <= SIMHASH_MAX_DISTANCE
+    assert hamming_distance(simhash(TWEET), simhash(other)) > SIMHASH_MAX_DISTANCE
+
+
+@pytest.mark.unit
+def test_is_duplicate(checker: DuplicateChecker) -> None:
+    """Test duplicate detection against hashes published within the window."""
+    stored = [str(simhash(TWEET)).encode()]
+    checker.redis_handler.members_since.return_value = stored  # type: ignore[attr-defined]
+
+    with patch("src.agentic_crypto_influencer.tools.dup_check.time.time", return_value=5e6):
+        assert checker.is_duplicate(TWEET) is True
+        assert checker.is_duplicate("Solana validators roll out a new client release.") is False
+    checker.redis_handler.members_since.assert_called_with(  # type: ignore[attr-defined]
+        REDIS_KEY_PUBLISHED_SIMHASHES, 5e6 - SIMHASH_WINDOW
+    )
+
+
+@pytest.mark.unit
+def test_is_duplicate_fails_open(checker: DuplicateChecker) -> None:
+    """Test that a Redis failure does not block publishing."""
+    checker.redis_handler.members_since.side_effect = RuntimeError("down")  # type: ignore[attr-defined]
+
+    assert checker.is_duplicate(TWEET) is False
+
+
+@pytest.mark.unit
+def test_record(checker: DuplicateChecker) -> None:
+    """Test that recording stores the tweet's SimHash scored by time and trims the window."""
+    with patch("src.agentic_crypto_influencer.tools.dup_check.time.time", return_value=5e6):
+        checker.record(TWEET)
+
+    checker.redis_handler.add_scored_capped.assert_called_once_with(  # type: ignore[attr-defined]
+        REDIS_KEY_PUBLISHED_SIMHASHES,
+        simhash(TWEET),
+        5e6,
+        5e6 - SIMHASH_WINDOW,
+        SIMHASH_MAX_STORED,
+    )
@@ -2,11 +2,13 @@
 Tests for ErrorManager using pytest best practices.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
-from src.agentic_crypto_influencer.error_management.error_manager import ErrorManager, main
+from src.agentic_crypto_influencer.error_management.error_manager import ErrorManager
+from src.agentic_crypto_influencer.error_management.error_manager_demo import main
 from src.agentic_crypto_influencer.error_management.exceptions import (
+    AgenticCryptoError,
     APIConnectionError,
     APITimeoutError,
     ConfigurationError,
@@ -23,18 +25,15 @@ def error_manager() -> ErrorManager:
 @pytest.mark.unit
 def test_handle_error(error_manager: ErrorManager) -> None:
     """Test error handling with ValueError."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ValueError("Test error")
         result = error_manager.handle_error(error)
 
         # Verify logging was called
         mock_logger.error.assert_called_once_with(
-            "Error handled: ValueError: Test error",
+            "Error handled: %s: %s",
+            "ValueError",
+            "Test error",
             exc_info=True,
             extra={"error_type": "ValueError", "error_message": "Test error"},
         )
@@ -46,18 +45,15 @@ def test_handle_error(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_error_with_different_exception(error_manager: ErrorManager) -> None:
     """Test error handling with RuntimeError."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = RuntimeError("Runtime test error")
         result = error_manager.handle_error(error)
 
         # Verify logging was called
         mock_logger.error.assert_called_once_with(
-            "Error handled: RuntimeError: Runtime test error",
+            "Error handled: %s: %s",
+            "RuntimeError",
+            "Runtime test error",
             exc_info=True,
             extra={"error_type": "RuntimeError", "error_message": "Runtime test error"},
         )
@@ -69,18 +65,15 @@ def test_handle_error_with_different_exception(error_manager: ErrorManager) -> N
 @pytest.mark.unit
 def test_handle_error_with_custom_exception(error_manager: ErrorManager) -> None:
     """Test error handling with ConnectionError."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ConnectionError("Connection failed")
         result = error_manager.handle_error(error)
 
         # Verify logging was called
         mock_logger.error.assert_called_once_with(
-            "Error handled: ConnectionError: Connection failed",
+            "Error handled: %s: %s",
+            "ConnectionError",
+            "Connection failed",
             exc_info=True,
             extra={"error_type": "ConnectionError", "error_message": "Connection failed"},
         )
@@ -92,11 +85,7 @@ def test_handle_error_with_custom_exception(error_manager: ErrorManager) -> None
 @pytest.mark.unit
 def test_handle_error_with_exception_chaining(error_manager: ErrorManager) -> None:
     """Test error handling with chained exceptions."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
+    with patch.object(ErrorManager, "logger") as mock_logger:
         try:
             raise ValueError("Original error")
         except ValueError as original_error:
@@ -106,7 +95,9 @@ def test_handle_error_with_exception_chaining(error_manager: ErrorManager) -> No
 
             # Verify logging was called
             mock_logger.error.assert_called_once_with(
-                "Error handled: RuntimeError: Chained error",
+                "Error handled: %s: %s",
+                "RuntimeError",
+                "Chained error",
                 exc_info=True,
                 extra={"error_type": "RuntimeError", "error_message": "Chained error"},
             )
@@ -118,18 +109,15 @@ def test_handle_error_with_exception_chaining(error_manager: ErrorManager) -> No
 @pytest.mark.unit
 def test_handle_error_with_empty_message(error_manager: ErrorManager) -> None:
     """Test error handling with empty exception message."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ValueError("")
         result = error_manager.handle_error(error)
 
         # Verify logging was called
         mock_logger.error.assert_called_once_with(
-            "Error handled: ValueError: ",
+            "Error handled: %s: %s",
+            "ValueError",
+            "",
             exc_info=True,
             extra={"error_type": "ValueError", "error_message": ""},
         )
@@ -141,18 +129,15 @@ def test_handle_error_with_empty_message(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_error_with_none_exception(error_manager: ErrorManager) -> None:
     """Test error handling with None as exception (edge case)."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         # This should not happen in practice, but testing edge case
         result = error_manager.handle_error(None)  # type: ignore[arg-type]
 
         # Verify logging was called
         mock_logger.error.assert_called_once_with(
-            "Error handled: NoneType: None",
+            "Error handled: %s: %s",
+            "NoneType",
+            "None",
             exc_info=True,
             extra={"error_type": "NoneType", "error_message": "None"},
         )
@@ -164,17 +149,14 @@ def test_handle_error_with_none_exception(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_main_function() -> None:
     """Test the main function that demonstrates error handling."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         main()
 
         # Verify that an error was logged
         mock_logger.error.assert_called_once_with(
-            "Error handled: ValueError: Sample error message",
+            "Error handled: %s: %s",
+            "ValueError",
+            "Sample error message",
             exc_info=True,
             extra={
                 "error_type": "ValueError",
@@ -192,18 +174,15 @@ def test_main_function() -> None:
 @pytest.mark.unit
 def test_handle_configuration_error(error_manager: ErrorManager) -> None:
     """Test handling of ConfigurationError."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ConfigurationError("Missing API key", missing_config="API_KEY")
         context = "API Setup"
         result = error_manager.handle_configuration_error(error, context)
 
         mock_logger.error.assert_called_once_with(
-            "Error handled: ConfigurationError: ConfigurationError: Missing API key",
+            "Error handled: %s: %s",
+            "ConfigurationError",
+            "ConfigurationError: Missing API key",
             exc_info=True,
             extra={
                 "error_type": "ConfigurationError",
@@ -219,17 +198,14 @@ def test_handle_configuration_error(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_validation_error(error_manager: ErrorManager) -> None:
     """Test handling of ValidationError."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ValidationError("Invalid input format", field="email", value="invalid-email")
         result = error_manager.handle_validation_error(error, field="email", value="invalid-email")
 
         mock_logger.error.assert_called_once_with(
-            "Error handled: ValidationError: ValidationError: Invalid input format",
+            "Error handled: %s: %s",
+            "ValidationError",
+            "ValidationError: Invalid input format",
             exc_info=True,
             extra={
                 "error_type": "ValidationError",
@@ -242,15 +218,42 @@ def test_handle_validation_error(error_manager: ErrorManager) -> None:
         assert result == "Invalid email. Please check your input and try again."
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("x" * 500, "x" * 100),
+        (b"y" * 500, "y" * 100),
+        (b"\xff", "\ufffd"),
+        (42, "42"),
+    ],
+)
+def test_handle_validation_error_truncates_value(
+    error_manager: ErrorManager, value: object, expected: str
+) -> None:
+    """Test that logged validation values are capped at 100 characters."""
+    with patch.object(ErrorManager, "logger") as mock_logger:
+        error_manager.handle_validation_error(ValueError("bad"), field="payload", value=value)
+
+        assert mock_logger.error.call_args.kwargs["extra"]["value"] == expected
+
+
+@pytest.mark.unit
+def test_handle_validation_error_bounds_large_containers(error_manager: ErrorManager) -> None:
+    """Test that large non-string values are rendered through the bounded repr."""
+    with patch.object(ErrorManager, "logger") as mock_logger:
+        value = {"items": list(range(100_000))}
+        error_manager.handle_validation_error(ValueError("bad"), field="payload", value=value)
+
+        logged = mock_logger.error.call_args.kwargs["extra"]["value"]
+        assert len(logged) <= 100
+        assert logged.startswith("{'items': [0, 1")
+
+
 @pytest.mark.unit
 def test_handle_api_error_connection(error_manager: ErrorManager) -> None:
     """Test handling of API connection errors."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = APIConnectionError(
             "Failed to connect to API", service="twitter", endpoint="/api/v2/tweets"
         )
@@ -259,7 +262,9 @@ def test_handle_api_error_connection(error_manager: ErrorManager) -> None:
         )
 
         mock_logger.error.assert_called_once_with(
-            "Error handled: APIConnectionError: APIConnectionError: Failed to connect to API",
+            "Error handled: %s: %s",
+            "APIConnectionError",
+            "APIConnectionError: Failed to connect to API",
             exc_info=True,
             extra={
                 "error_type": "APIConnectionError",
@@ -275,12 +280,7 @@ def test_handle_api_error_connection(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_api_error_timeout(error_manager: ErrorManager) -> None:
     """Test handling of API timeout errors."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = APITimeoutError(
             "Request timed out", service="twitter", endpoint="/api/v2/tweets", timeout=30.0
         )
@@ -289,7 +289,9 @@ def test_handle_api_error_timeout(error_manager: ErrorManager) -> None:
         )
 
         mock_logger.error.assert_called_once_with(
-            "Error handled: APITimeoutError: APITimeoutError: Request timed out",
+            "Error handled: %s: %s",
+            "APITimeoutError",
+            "APITimeoutError: Request timed out",
             exc_info=True,
             extra={
                 "error_type": "APITimeoutError",
@@ -305,18 +307,15 @@ def test_handle_api_error_timeout(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_error_with_context(error_manager: ErrorManager) -> None:
     """Test error handling with additional context."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ValueError("Test error with context")
         context = {"module": "test_module", "function": "test_function"}
         result = error_manager.handle_error(error, context)
 
         mock_logger.error.assert_called_once_with(
-            "Error handled: ValueError: Test error with context",
+            "Error handled: %s: %s",
+            "ValueError",
+            "Test error with context",
             exc_info=True,
             extra={
                 "error_type": "ValueError",
@@ -331,12 +330,7 @@ def test_handle_error_with_context(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_unknown_exception_type(error_manager: ErrorManager) -> None:
     """Test handling of unknown exception types."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         # Create a custom exception that's not in our known types
         class CustomError(Exception):
             pass
@@ -345,7 +339,9 @@ def test_handle_unknown_exception_type(error_manager: ErrorManager) -> None:
         result = error_manager.handle_error(error)
 
         mock_logger.error.assert_called_once_with(
-            "Error handled: CustomError: Unknown error type",
+            "Error handled: %s: %s",
+            "CustomError",
+            "Unknown error type",
             exc_info=True,
             extra={"error_type": "CustomError", "error_message": "Unknown error type"},
         )
@@ -355,12 +351,7 @@ def test_handle_unknown_exception_type(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_connection_error(error_manager: ErrorManager) -> None:
     """Test handling connection errors."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ConnectionError("Connection failed")
         result = error_manager.handle_connection_error(error, service="test_service")
 
@@ -371,12 +362,7 @@ def test_handle_connection_error(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_workflow_error(error_manager: ErrorManager) -> None:
     """Test handling workflow errors."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = RuntimeError("Workflow failed")
         result = error_manager.handle_workflow_error(error, workflow_step="test_step")
 
@@ -387,12 +373,7 @@ def test_handle_workflow_error(error_manager: ErrorManager) -> None:
 @pytest.mark.unit
 def test_handle_data_processing_error(error_manager: ErrorManager) -> None:
     """Test handling data processing errors."""
-    with patch(
-        "src.agentic_crypto_influencer.config.logging_config.get_logger"
-    ) as mock_get_logger:
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch.object(ErrorManager, "logger") as mock_logger:
         error = ValueError("Invalid data")
         result = error_manager.handle_data_processing_error(
             error, data_type="json", operation="parse"
@@ -402,6 +383,75 @@ def test_handle_data_processing_error(error_manager: ErrorManager) -> None:
         assert "data" in result.lower() or "processing" in result.lower()
 
 
+@pytest.mark.unit
+def test_handle_error_skips_logging_when_filtered(error_manager: ErrorManager) -> None:
+    """Test that no log record is built when ERROR is disabled."""
+    with patch.object(ErrorManager, "logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = False
+
+        result = error_manager.handle_error(ValueError("quiet"), user_message="Handled")
+
+        mock_logger.error.assert_not_called()
+        assert result == "Handled"
+
+
+@pytest.mark.unit
+def test_handle_error_formats_error_once(error_manager: ErrorManager) -> None:
+    """Test that the error is stringified once per handled error, including via handle()."""
+
+    class CountingError(Exception):
+        str_calls = 0
+
+        def __str__(self) -> str:
+            CountingError.str_calls += 1
+            return "counted"
+
+    with patch.object(ErrorManager, "logger") as mock_logger:
+        error_manager.handle_connection_error(CountingError(), service="redis")
+
+        assert CountingError.str_calls == 1
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.args[1:] == ("CountingError", "counted")
+
+
+@pytest.mark.unit
+def test_handle_dispatches_by_category(error_manager: ErrorManager) -> None:
+    """Test that handle() formats the category template and tags the log context."""
+    with patch.object(ErrorManager, "logger") as mock_logger:
+        error = RuntimeError("Step failed")
+        result = error_manager.handle(
+            "workflow", error, workflow_step="publish", step_data={"id": 1}
+        )
+
+        extra = mock_logger.error.call_args.kwargs["extra"]
+        assert extra["error_category"] == "workflow"
+        assert extra["step_data"] == {"id": 1}
+        assert result == "Workflow failed at step: publish. Please try again."
+
+
+@pytest.mark.unit
+def test_handle_requires_template_fields(error_manager: ErrorManager) -> None:
+    """Test that a context missing a template field fails loudly instead of misformatting."""
+    with (
+        patch.object(ErrorManager, "logger"),
+        pytest.raises(KeyError, match="service"),
+    ):
+        error_manager.handle("api", RuntimeError("down"), endpoint="/tweets")
+
+
+@pytest.mark.unit
+def test_handle_data_processing_error_includes_size(error_manager: ErrorManager) -> None:
+    """Test that the optional data size is only logged when provided."""
+    with patch.object(ErrorManager, "logger") as mock_logger:
+        error_manager.handle_data_processing_error(
+            ValueError("bad"), data_type="json", operation="parse", data_size=42
+        )
+
+        extra = mock_logger.error.call_args.kwargs["extra"]
+        assert extra["data_size"] == 42
+        assert extra["error_category"] == "data_processing"
+
+
 @pytest.mark.unit
 def test_create_specific_error(error_manager: ErrorManager) -> None:
     """Test creating specific error types."""
@@ -416,6 +466,43 @@ def test_create_specific_error(error_manager: ErrorManager) -> None:
     assert isinstance(validation_error, Exception)
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("error", "expected_type"),
+    [
+        (ConnectionError("refused"), APIConnectionError),
+        (TimeoutError("timed out"), APITimeoutError),
+        (ValueError("Validation failed"), ValidationError),
+        (KeyError("config missing"), ConfigurationError),
+        (ValueError("plain value error"), AgenticCryptoError),
+        (KeyError("other"), AgenticCryptoError),
+    ],
+)
+def test_create_specific_error_mapping(
+    error_manager: ErrorManager, error: Exception, expected_type: type[Exception]
+) -> None:
+    """Test that each builtin error maps to the matching application error."""
+    specific = error_manager.create_specific_error(error, service="x_api")
+
+    assert type(specific) is expected_type
+
+
+@pytest.mark.unit
+def test_error_manager_has_no_instance_dict(error_manager: ErrorManager) -> None:
+    """Test that ErrorManager instances are slotted."""
+    assert not hasattr(error_manager, "__dict__")
+
+
+@pytest.mark.unit
+def test_module_error_manager_is_shared() -> None:
+    """Test that callers share the module-level ErrorManager instance."""
+    from src.agentic_crypto_influencer.error_management import error_manager as module
+    from src.agentic_crypto_influencer.tools import x
+
+    assert isinstance(module.error_manager, ErrorManager)
+    assert x.error_manager is module.error_manager
+
+
 @pytest.mark.unit
 def test_get_circuit_breaker_status(error_manager: ErrorManager) -> None:
     """Test getting circuit breaker status."""
@@ -446,3 +533,46 @@ def test_call_with_circuit_breaker_failure(error_manager: ErrorManager) -> None:
 
     with pytest.raises(ValueError, match="Test failure"):
         error_manager.call_with_circuit_breaker("test_service_failure", failing_function)
+
+
+@pytest.mark.unit
+def test_call_with_circuit_breaker_failure_defers_status(error_manager: ErrorManager) -> None:
+    """Test that the circuit breaker snapshot is only taken when the context is rendered."""
+
+    def failing_function() -> None:
+        raise ValueError("Test failure")
+
+    with (
+        patch.object(ErrorManager, "logger") as mock_logger,
+        patch(
+            "src.agentic_crypto_influencer.error_management.error_manager.retry_manager"
+        ) as mock_retry_manager,
+    ):
+        mock_retry_manager.call_with_circuit_breaker.side_effect = ValueError("Test failure")
+        mock_retry_manager.get_service_status.return_value = {"svc": {"state": "open"}}
+
+        with pytest.raises(ValueError, match="Test failure"):
+            error_manager.call_with_circuit_breaker("svc", failing_function)
+
+        mock_retry_manager.get_service_status.assert_not_called()
+        status = mock_logger.error.call_args.kwargs["extra"]["circuit_breaker_status"]
+        assert repr(status) == "{'state': 'open'}"
+        mock_retry_manager.get_service_status.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_call_with_circuit_breaker_labels_unnamed_callables(error_manager: ErrorManager) -> None:
+    """Test that callables without __name__ are logged by their string form."""
+
+    class Failing:
+        def __call__(self) -> None:
+            raise ValueError("Test failure")
+
+        def __str__(self) -> str:
+            return "failing-callable"
+
+    with patch.object(ErrorManager, "logger") as mock_logger:
+        with pytest.raises(ValueError, match="Test failure"):
+            error_manager.call_with_circuit_breaker("test_service_unnamed", Failing())
+
+        assert mock_logger.error.call_args.kwargs["extra"]["function"] == "failing-callable"
@@ -2,14 +2,30 @@
 Tests for error_management.validator using pytest best practices.
 """
 
+import re
+
 import pytest
+from src.agentic_crypto_influencer.config.app_constants import PATTERN_EMAIL
 from src.agentic_crypto_influencer.error_management.exceptions import ValidationError
-from src.agentic_crypto_influencer.error_management.validator import Validator
+from src.agentic_crypto_influencer.error_management.validator import (
+    Validator,
+    _is_valid_email,
+    validate_string,
+)
+
+# Reference oracle for _is_valid_email, which implements PATTERN_EMAIL without regex
+EMAIL_RE = re.compile(PATTERN_EMAIL)
 
 
 class TestValidateString:
     """Test cases for validate_string method."""
 
+    @pytest.mark.unit
+    def test_validator_namespace_aliases_module_functions(self) -> None:
+        """Test that Validator and its instances expose the module-level functions."""
+        assert Validator.validate_string is validate_string
+        assert Validator().validate_string("  value  ", "test_field") == "value"
+
     @pytest.mark.unit
     def test_validate_string_valid(self) -> None:
         """Test validation with valid string."""
@@ -99,6 +115,17 @@ class TestValidateString:
         assert "does not match required format" in str(exc_info.value)
         assert exc_info.value.context["pattern"] == r"^[a-z]+\d+$"
 
+    @pytest.mark.unit
+    def test_validate_string_precompiled_pattern(self) -> None:
+        """Test validation with a precompiled pattern reports its source string."""
+        pattern = re.compile(r"^[a-z]+\d+$")
+        assert Validator.validate_string("test123", "test_field", pattern=pattern) == "test123"
+
+        with pytest.raises(ValidationError) as exc_info:
+            Validator.validate_string("TEST123", "test_field", pattern=pattern)
+
+        assert exc_info.value.context["pattern"] == r"^[a-z]+\d+$"
+
     @pytest.mark.unit
     def test_validate_string_invalid_regex(self) -> None:
         """Test validation with invalid regex pattern."""
@@ -285,6 +312,36 @@ class TestValidateUrl:
         assert "must include a valid domain" in str(exc_info.value)
         assert exc_info.value.context["validation_type"] == "missing_domain"
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("url", "error_fragment"),
+        [
+            ("http://[garbage]/x", "IPv4 or IPv6"),
+            ("http://\uff03x.com/", "NFKC normalization"),
+        ],
+    )
+    def test_validate_url_rejects_unsafe_netloc(self, url: str, error_fragment: str) -> None:
+        """Test that netlocs urlsplit rejects are reported as unparseable URLs."""
+        with pytest.raises(ValidationError) as exc_info:
+            Validator.validate_url(url, "test_field")
+
+        assert exc_info.value.context["validation_type"] == "url_parse"
+        assert error_fragment in exc_info.value.context["original_error"]
+
+    @pytest.mark.unit
+    def test_validate_url_ignores_embedded_tab(self) -> None:
+        """Test that tabs inside the URL are stripped before the scheme is read."""
+        url = "ht\ttp://example.com"
+        assert Validator.validate_url(url, "test_field") == url
+
+    @pytest.mark.unit
+    def test_validate_url_unbalanced_ipv6(self) -> None:
+        """Test validation fails for a netloc with an unclosed IPv6 bracket."""
+        with pytest.raises(ValidationError) as exc_info:
+            Validator.validate_url("https://[::1/path", "test_field")
+
+        assert exc_info.value.context["validation_type"] == "url_parse"
+
 
 class TestValidateEmail:
     """Test cases for validate_email method."""
@@ -309,6 +366,18 @@ class TestValidateEmail:
 
         assert "test_field is required" in str(exc_info.value)
 
+    @pytest.mark.unit
+    def test_required_errors_have_independent_context(self) -> None:
+        """Test that enriching one "required" error's context leaves the next untouched."""
+        with pytest.raises(ValidationError) as email_error:
+            Validator.validate_email(None, "email_field")
+        email_error.value.context["request_id"] = "abc"
+
+        with pytest.raises(ValidationError) as string_error:
+            Validator.validate_string("   ", "string_field")
+
+        assert string_error.value.context == {"validation_type": "required"}
+
     @pytest.mark.unit
     def test_validate_email_not_required_none(self) -> None:
         """Test validation passes for None when not required."""
@@ -343,6 +412,31 @@ class TestValidateEmail:
         assert "is too long" in str(exc_info.value)
         assert exc_info.value.context["validation_type"] == "email_too_long"
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "email",
+        [
+            "a@b.co",
+            "first.last+tag@sub.example.org",
+            "x_y%z-1@host-name.io",
+            "@example.com",
+            "user@",
+            "user@example",
+            "user@.com",
+            "user@example.c",
+            "user@example.c0m",
+            "us er@example.com",
+            "user@exa_mple.com",
+            "user@@example.com",
+            "user@a@example.com",
+            "user@example.com.",
+            "usér@example.com",
+        ],
+    )
+    def test_is_valid_email_matches_pattern(self, email: str) -> None:
+        """Test that the scalar email check agrees with PATTERN_EMAIL."""
+        assert _is_valid_email(email) is bool(EMAIL_RE.match(email))
+
 
 class TestValidateChoice:
     """Test cases for validate_choice method."""
@@ -369,6 +463,17 @@ class TestValidateChoice:
         )
         assert result == "option1"  # Returns original case from choices
 
+    @pytest.mark.unit
+    def test_validate_choice_case_insensitive_mixed_choices(self) -> None:
+        """Test case insensitive matching skips non-string and unhashable choices."""
+        choices: list[object] = [1, ["nested"], "Alpha", "ALPHA"]
+        result = Validator.validate_choice("alpha", "test_field", choices, case_sensitive=False)
+        assert result == "Alpha"
+
+        with pytest.raises(ValidationError) as exc_info:
+            Validator.validate_choice("beta", "test_field", choices, case_sensitive=False)
+        assert exc_info.value.context["validation_type"] == "invalid_choice"
+
     @pytest.mark.unit
     def test_validate_choice_required_none(self) -> None:
         """Test validation fails for None when required."""
@@ -445,6 +550,16 @@ class TestValidateDict:
         assert "is missing required keys: key2" in str(exc_info.value)
         assert exc_info.value.context["missing_keys"] == ["key2"]
 
+    @pytest.mark.unit
+    def test_validate_dict_missing_keys_keep_required_order(self) -> None:
+        """Test that missing keys are reported in the order they were required."""
+        with pytest.raises(ValidationError) as exc_info:
+            Validator.validate_dict(
+                {"b": 1}, "test_field", required_keys=["d", "b", "a", "c", "a"]
+            )
+
+        assert exc_info.value.context["missing_keys"] == ["d", "a", "c", "a"]
+
 
 class TestConvenienceFunctions:
     """Test cases for convenience validation functions."""
@@ -482,6 +597,67 @@ class TestConvenienceFunctions:
         with pytest.raises(ValidationError):
             validate_tweet_content(long_content)
 
+    @pytest.mark.unit
+    def test_validate_tweet_content_weighted_length(self) -> None:
+        """Test that non-Latin characters count double toward the tweet limit."""
+        from src.agentic_crypto_influencer.error_management.validator import validate_tweet_content
+
+        assert validate_tweet_content("é" * 280) == "é" * 280
+        assert validate_tweet_content("🚀" * 140) == "🚀" * 140
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_tweet_content("🚀" * 141)
+
+        assert exc_info.value.context["validation_type"] == "weighted_length"
+        assert exc_info.value.context["weighted_length"] == 282
+
+    @pytest.mark.unit
+    def test_tweet_weighted_length_matches_codepoint_ranges(self) -> None:
+        """Test the regex-based weighted count against a per-code-point reference."""
+        from src.agentic_crypto_influencer.config.app_constants import TWEET_LIGHT_CODEPOINT_RANGES
+        from src.agentic_crypto_influencer.error_management.validator import _tweet_weighted_length
+
+        content = "BTC → $100k 🚀 “moon” café 比特币 \u10ff\u1100 \u2000\u200e\u2032\u2038"
+        expected = sum(
+            1 if any(low <= ord(char) <= high for low, high in TWEET_LIGHT_CODEPOINT_RANGES) else 2
+            for char in content
+        )
+        assert _tweet_weighted_length(content) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("\U0001f44d\U0001f3fd", 2),  # thumbs up with skin tone modifier
+            ("\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466", 2),  # ZWJ family
+            ("\U0001f1f3\U0001f1f1", 2),  # regional indicator flag
+            ("1\ufe0f\u20e3", 2),  # keycap
+            ("\u2764\ufe0f", 2),  # variation selector
+            ("e\u0301", 1),  # decomposed é counts as the composed character
+        ],
+    )
+    def test_tweet_weighted_length_counts_sequences_once(
+        self, content: str, expected: int
+    ) -> None:
+        """Test NFC normalization and emoji sequences weigh like twitter-text."""
+        from src.agentic_crypto_influencer.error_management.validator import _tweet_weighted_length
+
+        assert _tweet_weighted_length(content) == expected
+
+    @pytest.mark.unit
+    def test_validate_tweet_content_allows_long_emoji_sequences(self) -> None:
+        """Test the limit applies to the weighted count, not to code points."""
+        from src.agentic_crypto_influencer.error_management.validator import validate_tweet_content
+
+        family = "\U0001f468\u200d\U0001f469\u200d\U0001f467\u200d\U0001f466"
+        assert validate_tweet_content(family * 140) == family * 140
+        assert validate_tweet_content("e\u0301" * 280) == "e\u0301" * 280
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_tweet_content(family * 141)
+
+        assert exc_info.value.context["weighted_length"] == 282
+
     @pytest.mark.unit
     def test_validate_user_id_valid(self) -> None:
         """Test user ID validation with valid ID."""
@@ -495,5 +671,9 @@ class TestConvenienceFunctions:
         """Test user ID validation fails for invalid characters."""
         from src.agentic_crypto_influencer.error_management.validator import validate_user_id
 
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError) as exc_info:
             validate_user_id("invalid@user", "twitter")
+
+        assert "twitter ID does not match required format" in str(exc_info.value)
+        assert exc_info.value.context["validation_type"] == "pattern"
+        assert exc_info.value.context["pattern"] == r"^[a-zA-Z0-9_-]+$"
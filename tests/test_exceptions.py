@@ -0,0 +1,114 @@
+"""
+Tests for the exception helpers in the exceptions module.
+"""
+
+import copy
+import pickle
+
+import pytest
+from src.agentic_crypto_influencer.error_management.exceptions import (
+    AgenticCryptoError,
+    APIAuthenticationError,
+    APIConnectionError,
+    APIRateLimitError,
+    ConfigurationError,
+    DataProcessingError,
+    RedisConnectionError,
+    RetryableError,
+    ValidationError,
+    get_retry_delay,
+    is_retryable_error,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (RetryableError("retry"), True),
+        (APIConnectionError("down", service="x", endpoint="/"), True),
+        (APIRateLimitError("slow down", service="x", endpoint="/"), True),
+        (RedisConnectionError("down", operation="get"), True),
+        (APIAuthenticationError("denied", service="x", endpoint="/"), False),
+        (ConfigurationError("missing"), False),
+        (ValidationError("bad", field="f", value=1), False),
+        (DataProcessingError("bad", data_type="json", operation="parse"), False),
+        (ValueError("plain"), False),
+    ],
+)
+def test_is_retryable_error(error: Exception, expected: bool) -> None:
+    """Test retryability of the known error types and unrelated exceptions."""
+    assert is_retryable_error(error) is expected
+
+
+@pytest.mark.unit
+def test_is_retryable_error_follows_class_attribute() -> None:
+    """Test that subclasses inherit retryability and can override it."""
+
+    class FlakyConnectionError(APIConnectionError):
+        pass
+
+    class PermanentConnectionError(APIConnectionError):
+        retryable = False
+
+    assert is_retryable_error(FlakyConnectionError("down", service="x", endpoint="/"))
+    assert not is_retryable_error(PermanentConnectionError("gone", service="x", endpoint="/"))
+
+
+@pytest.mark.unit
+def test_get_retry_delay_prefers_error_hints() -> None:
+    """Test that explicit retry hints on the error win over exponential backoff."""
+    rate_limited = APIRateLimitError("slow down", service="x", endpoint="/", retry_after=7)
+    assert get_retry_delay(rate_limited, attempt=3) == 7.0
+
+    delayed = ValueError("busy")
+    delayed.retry_delay = 2  # type: ignore[attr-defined]
+    assert get_retry_delay(delayed, attempt=3) == 2.0
+
+    unset = RetryableError("retry", retry_after=None)
+    assert 1.1 <= get_retry_delay(unset, attempt=0) <= 1.5
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("attempt", "low", "high"), [(0, 1.1, 1.5), (3, 8.1, 8.5), (40, 30.0, 30.0)]
+)
+def test_get_retry_delay_backoff_is_capped(attempt: int, low: float, high: float) -> None:
+    """Test exponential backoff with jitter, capped at the maximum delay."""
+    assert low <= get_retry_delay(ValueError("busy"), attempt) <= high
+
+
+@pytest.mark.unit
+def test_exception_attributes_live_in_slots() -> None:
+    """Test that error attributes are slotted and the instance dict stays empty."""
+    error = APIRateLimitError("slow down", service="x", endpoint="/", retry_after=5)
+
+    assert error.service == "x"
+    assert error.retry_after == 5
+    assert error.__dict__ == {}
+    assert error.__slots__ == ("retry_after",)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error",
+    [
+        ConfigurationError("missing", missing_config="X_CLIENT_ID", context={"a": 1}),
+        RetryableError("busy", retry_after=5, max_retries=2),
+        ValidationError("bad", field="market", value="BTC"),
+        APIRateLimitError("slow down", service="x", endpoint="/", retry_after=5),
+    ],
+)
+def test_exception_slots_survive_copy_and_pickle(error: AgenticCryptoError) -> None:
+    """Test that slotted attributes round-trip through copy and pickle."""
+    slots = {
+        name: getattr(error, name)
+        for cls in type(error).__mro__
+        for name in cls.__dict__.get("__slots__", ())
+    }
+
+    for clone in (copy.copy(error), copy.deepcopy(error), pickle.loads(pickle.dumps(error))):
+        assert type(clone) is type(error)
+        assert clone.args == error.args
+        assert str(clone) == str(error)
+        assert {name: getattr(clone, name) for name in slots} == slots
@@ -232,7 +232,11 @@ class TestFrontendServer:
             "type": "info",
             "timestamp": datetime.now().isoformat(),
         }
-        mock_redis.get.return_value = json.dumps(mock_activity).encode("utf-8")
+        second_activity = {**mock_activity, "message": "📊 Second activity"}
+        mock_redis.pop_all.return_value = [
+            json.dumps(mock_activity).encode("utf-8"),
+            json.dumps(second_activity).encode("utf-8"),
+        ]
 
         # Clear recent activities
         recent_activities.clear()
@@ -240,13 +244,31 @@ class TestFrontendServer:
         # Check for GraphFlow activity
         check_graphflow_activity()
 
-        # Verify activity was added
-        assert len(recent_activities) == 1
+        # Verify every queued activity was added, in order
+        assert len(recent_activities) == 2
         assert recent_activities[0]["agent"] == "GraphFlow"
         assert "🚀 Test GraphFlow activity" in recent_activities[0]["message"]
+        assert recent_activities[1]["message"] == "📊 Second activity"
+
+        # Popping the list clears it to prevent duplication
+        mock_redis.pop_all.assert_called_once_with("graphflow_activities")
+
+    def test_graphflow_activity_skips_malformed_payload(self, mock_redis: Any) -> None:
+        """Test one undecodable GraphFlow payload doesn't drop the rest."""
+        from src.agentic_crypto_influencer.tools.frontend_server import check_graphflow_activity
+
+        activity = {
+            "agent": "GraphFlow",
+            "message": "Valid activity",
+            "type": "info",
+            "timestamp": datetime.now().isoformat(),
+        }
+        mock_redis.pop_all.return_value = [b"{not json", json.dumps(activity).encode("utf-8")]
+
+        recent_activities.clear()
+        check_graphflow_activity()
 
-        # Verify Redis delete was called to prevent duplication
-        mock_redis.delete.assert_called_with("graphflow_activity")
+        assert [item["message"] for item in recent_activities] == ["Valid activity"]
 
     def test_get_recent_activities_api(self, client: Any) -> None:
         """Test the recent activities API endpoint."""
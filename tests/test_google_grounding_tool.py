@@ -184,12 +184,12 @@ class TestGoogleGroundingTool:
             assert "API connection failed" in str(exc_info.value)
 
     @patch("builtins.print")
-    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.ErrorManager")
+    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.error_manager")
     @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.GoogleGroundingTool")
     def test_main_success(
         self,
         mock_tool_class: MagicMock,
-        mock_error_manager_class: MagicMock,
+        mock_error_manager: MagicMock,
         mock_print: MagicMock,
     ) -> None:
         """Test main function with successful execution"""
@@ -198,9 +198,6 @@ class TestGoogleGroundingTool:
         mock_tool_class.return_value = mock_tool
         mock_tool.run_crypto_search.return_value = "Search results"
 
-        mock_error_manager = Mock()
-        mock_error_manager_class.return_value = mock_error_manager
-
         # Call main function
         main()
 
@@ -216,12 +213,12 @@ class TestGoogleGroundingTool:
         # The new implementation uses logger.info instead of print
 
     @patch("builtins.print")
-    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.ErrorManager")
+    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.error_manager")
     @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.GoogleGroundingTool")
     def test_main_value_error(
         self,
         mock_tool_class: MagicMock,
-        mock_error_manager_class: MagicMock,
+        mock_error_manager: MagicMock,
         mock_print: MagicMock,
     ) -> None:
         """Test main function with ValueError"""
@@ -230,8 +227,6 @@ class TestGoogleGroundingTool:
         mock_tool_class.return_value = mock_tool
         mock_tool.run_crypto_search.side_effect = ValueError("Invalid query")
 
-        mock_error_manager = Mock()
-        mock_error_manager_class.return_value = mock_error_manager
         mock_error_manager.handle_error.return_value = "Handled ValueError"
 
         # Call main function - it should re-raise the exception
@@ -242,12 +237,12 @@ class TestGoogleGroundingTool:
         assert mock_error_manager.handle_error.called
 
     @patch("builtins.print")
-    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.ErrorManager")
+    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.error_manager")
     @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.GoogleGroundingTool")
     def test_main_runtime_error(
         self,
         mock_tool_class: MagicMock,
-        mock_error_manager_class: MagicMock,
+        mock_error_manager: MagicMock,
         mock_print: MagicMock,
     ) -> None:
         """Test main function with RuntimeError"""
@@ -256,8 +251,6 @@ class TestGoogleGroundingTool:
         mock_tool_class.return_value = mock_tool
         mock_tool.run_crypto_search.side_effect = RuntimeError("API failed")
 
-        mock_error_manager = Mock()
-        mock_error_manager_class.return_value = mock_error_manager
         mock_error_manager.handle_error.return_value = "Handled RuntimeError"
 
         # Call main function - it should re-raise the exception
@@ -268,12 +261,12 @@ class TestGoogleGroundingTool:
         assert mock_error_manager.handle_error.called
 
     @patch("builtins.print")
-    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.ErrorManager")
+    @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.error_manager")
     @patch("src.agentic_crypto_influencer.tools.google_grounding_tool.GoogleGroundingTool")
     def test_main_unexpected_error(
         self,
         mock_tool_class: MagicMock,
-        mock_error_manager_class: MagicMock,
+        mock_error_manager: MagicMock,
         mock_print: MagicMock,
     ) -> None:
         """Test main function with unexpected Exception"""
@@ -282,8 +275,6 @@ class TestGoogleGroundingTool:
         mock_tool_class.return_value = mock_tool
         mock_tool.run_crypto_search.side_effect = Exception("Unexpected error")
 
-        mock_error_manager = Mock()
-        mock_error_manager_class.return_value = mock_error_manager
         mock_error_manager.handle_error.return_value = "Handled unexpected error"
 
         # Call main function - it should re-raise the exception
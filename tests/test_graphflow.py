@@ -1,10 +1,15 @@
 import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import suppress
-from unittest.mock import AsyncMock, Mock, patch
+from datetime import datetime
+import json
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
+import orjson
 import pytest
 from src.agentic_crypto_influencer.graphflow.graphflow import (
+    _broadcast_worker,
+    broadcast_to_frontend,
     check_for_twitter_success,
     format_agent_message,
     main,
@@ -26,12 +31,10 @@ class TestGraphflowMain:
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.DiGraphBuilder")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.GraphFlow")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.RedisHandler")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.json")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.error_manager")
     def test_main_success(
         self,
         mock_error_manager: Mock,
-        mock_json: Mock,
         mock_redis_handler: Mock,
         mock_graph_flow: Mock,
         mock_di_graph_builder: Mock,
@@ -75,10 +78,6 @@ class TestGraphflowMain:
             mock_redis_instance.get.return_value = None
             mock_redis_instance.set.return_value = None
 
-            # Mock json
-            mock_json.loads.return_value = {}
-            mock_json.dumps.return_value = "{}"
-
             # Mock error manager
             mock_error_manager.handle_error.return_value = "Handled Error"
 
@@ -95,23 +94,28 @@ class TestGraphflowMain:
             mock_builder_instance.build.assert_called_once()
             mock_flow_instance.run_stream.assert_called_once()
 
+            # Agents are built concurrently but share a single model client
+            model_clients = {
+                id(agent_cls.call_args.kwargs["model_client"])
+                for agent_cls in (mock_search_agent, mock_summary_agent, mock_publish_agent)
+            }
+            assert len(model_clients) == 1
+
             # Assert error manager was NOT called
             mock_error_manager.handle_error.assert_not_called()
 
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.TextMentionTermination")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.OpenAIChatCompletionClient")
+    @patch("autogen_ext.models.openai.OpenAIChatCompletionClient")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.SearchAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.SummaryAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.PublishAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.DiGraphBuilder")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.GraphFlow")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.RedisHandler")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.json")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.error_manager")
     def test_main_success_basic_flow(
         self,
         mock_error_manager: Mock,
-        mock_json: Mock,
         mock_redis_handler: Mock,
         mock_graph_flow: Mock,
         mock_di_graph_builder: Mock,
@@ -168,19 +172,17 @@ class TestGraphflowMain:
             assert isinstance(error_arg, TypeError)
 
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.TextMentionTermination")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.OpenAIChatCompletionClient")
+    @patch("autogen_ext.models.openai.OpenAIChatCompletionClient")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.SearchAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.SummaryAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.PublishAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.DiGraphBuilder")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.GraphFlow")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.RedisHandler")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.json")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.error_manager")
     def test_main_json_decode_error(
         self,
         mock_error_manager: Mock,
-        mock_json: Mock,
         mock_redis_handler: Mock,
         mock_graph_flow: Mock,
         mock_di_graph_builder: Mock,
@@ -217,39 +219,30 @@ class TestGraphflowMain:
             mock_redis_instance: Mock = mock_redis_handler.return_value
             mock_redis_instance.get.return_value = b"invalid json"
 
-            # Mock json to raise JSONDecodeError
-            mock_json.loads.side_effect = Exception("JSON decode error")
-            mock_json.dumps.return_value = "{}"
-
             # Mock error manager
             mock_error_manager.handle_error.return_value = "Handled Error"
 
             # Run the main function
             asyncio.run(main())
 
-            # Verify JSONDecodeError was handled
-            mock_json.loads.assert_called_once_with("invalid json")
-
             # Verify error was handled by error_manager (not that flow continued)
             mock_error_manager.handle_error.assert_called_once()
-            # The argument should be the JSONDecodeError
+            # The argument should be orjson's JSONDecodeError
             error_arg = mock_error_manager.handle_error.call_args[0][0]
-            assert isinstance(error_arg, Exception)
+            assert isinstance(error_arg, orjson.JSONDecodeError)
 
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.TextMentionTermination")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.OpenAIChatCompletionClient")
+    @patch("autogen_ext.models.openai.OpenAIChatCompletionClient")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.SearchAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.SummaryAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.PublishAgent")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.DiGraphBuilder")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.GraphFlow")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.RedisHandler")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.json")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.error_manager")
     def test_main_success_with_redis_state(
         self,
         mock_error_manager: Mock,
-        mock_json: Mock,
         mock_redis_handler: Mock,
         mock_graph_flow: Mock,
         mock_di_graph_builder: Mock,
@@ -287,10 +280,6 @@ class TestGraphflowMain:
             mock_redis_instance: Mock = mock_redis_handler.return_value
             mock_redis_instance.get.return_value = b'{"existing": "state"}'
 
-            # Mock json
-            mock_json.loads.return_value = {"existing": "state"}
-            mock_json.dumps.return_value = '{"state": "data"}'
-
             # Mock error manager
             mock_error_manager.handle_error.return_value = "Handled Error"
 
@@ -299,24 +288,17 @@ class TestGraphflowMain:
 
             # Verify Redis state was loaded
             mock_redis_instance.get.assert_called_once_with("team_state")
-            mock_json.loads.assert_called_once_with('{"existing": "state"}')
             mock_flow_instance.load_state.assert_called_once_with({"existing": "state"})
 
             # Verify state was saved back to Redis
             mock_flow_instance.save_state.assert_called_once()
-            # json.dumps is now called multiple times due to broadcast_to_frontend
-            # Check that it was called with the state data at least once
-            from unittest.mock import call
-
-            state_calls = [
+            # The shared handler also receives the broadcast worker's activity writes
+            team_state_sets = [
                 call_args
-                for call_args in mock_json.dumps.call_args_list
-                if call_args == call({"state": "data"})
+                for call_args in mock_redis_instance.set.call_args_list
+                if call_args.args[0] == "team_state"
             ]
-            assert len(state_calls) >= 1, (
-                "Expected json.dumps to be called with state data at least once"
-            )
-            mock_redis_instance.set.assert_called_once_with("team_state", '{"state": "data"}')
+            assert team_state_sets == [call("team_state", b'{"state":"data"}')]
 
     @patch("autogen_agentchat.conditions.TextMentionTermination")
     @patch("autogen_ext.models.openai.OpenAIChatCompletionClient")
@@ -326,12 +308,10 @@ class TestGraphflowMain:
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.DiGraphBuilder")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.GraphFlow")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.RedisHandler")
-    @patch("src.agentic_crypto_influencer.graphflow.graphflow.json")
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.error_manager")
     def test_main_success_with_async_stream_iteration(
         self,
         mock_error_manager: Mock,
-        mock_json: Mock,
         mock_redis_handler: Mock,
         mock_graph_flow: Mock,
         mock_di_graph_builder: Mock,
@@ -380,10 +360,6 @@ class TestGraphflowMain:
             mock_redis_instance.get.return_value = None
             mock_redis_instance.set.return_value = None
 
-            # Mock json
-            mock_json.loads.return_value = {}
-            mock_json.dumps.return_value = "{}"
-
             # Mock error manager
             mock_error_manager.handle_error.return_value = "Handled Error"
 
@@ -392,8 +368,135 @@ class TestGraphflowMain:
 
             # Verify the async for loop executed and logged events
             # Check that workflow events were logged correctly
-            mock_logger.info.assert_any_call("Workflow event 1 - Type: str")
-            mock_logger.info.assert_any_call("Workflow event 2 - Type: str")
+            mock_logger.info.assert_any_call("Workflow event %d - Type: %s", 1, "str")
+            mock_logger.info.assert_any_call("Workflow event %d - Type: %s", 2, "str")
+
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.TextMentionTermination")
+    @patch("autogen_ext.models.openai.OpenAIChatCompletionClient")
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.SearchAgent")
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.SummaryAgent")
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.PublishAgent")
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.DiGraphBuilder")
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.GraphFlow")
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.RedisHandler")
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.error_manager")
+    def test_main_skips_saving_unchanged_team_state(
+        self,
+        mock_error_manager: Mock,
+        mock_redis_handler: Mock,
+        mock_graph_flow: Mock,
+        mock_di_graph_builder: Mock,
+        mock_publish_agent: Mock,
+        mock_summary_agent: Mock,
+        mock_search_agent: Mock,
+        mock_openai_client: Mock,
+        mock_text_mention_termination: Mock,
+    ) -> None:
+        """Test that an unchanged team state is not written back to Redis."""
+        with patch(
+            "src.agentic_crypto_influencer.graphflow.graphflow.GOOGLE_GENAI_API_KEY", "test_key"
+        ):
+            mock_di_graph_builder.return_value.get_participants.return_value = []
+
+            async def async_generator() -> AsyncGenerator[str]:
+                yield "event1"
+
+            mock_flow_instance: Mock = mock_graph_flow.return_value
+            mock_flow_instance.run_stream.return_value = async_generator()
+            mock_flow_instance.load_state = AsyncMock()
+            mock_flow_instance.save_state = AsyncMock(return_value={"existing": "state"})
+
+            mock_redis_instance: Mock = mock_redis_handler.return_value
+            mock_redis_instance.get.return_value = b'{"existing":"state"}'
+
+            asyncio.run(main())
+
+            mock_error_manager.handle_error.assert_not_called()
+            mock_flow_instance.load_state.assert_awaited_once_with({"existing": "state"})
+            assert all(
+                call_args.args[0] != "team_state"
+                for call_args in mock_redis_instance.set.call_args_list
+            )
+
+
+class TestFrontendBroadcast:
+    """Test the queued frontend broadcast path."""
+
+    def test_broadcast_worker_writes_queued_activities(self) -> None:
+        """Test that broadcasts only enqueue and the worker writes them to Redis."""
+        redis_handler = Mock()
+
+        async def run() -> None:
+            queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+            with patch(
+                "src.agentic_crypto_influencer.graphflow.graphflow._broadcast_queue", queue
+            ):
+                broadcast_to_frontend("SearchAgent", "Found news", "chat")
+            redis_handler.push_capped.assert_not_called()
+
+            worker = asyncio.create_task(_broadcast_worker(queue, redis_handler))
+            await asyncio.wait_for(queue.join(), timeout=1)
+            worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+
+        asyncio.run(run())
+
+        key, payloads, max_length = redis_handler.push_capped.call_args.args
+        assert (key, max_length) == ("graphflow_activities", 200)
+        assert len(payloads) == 1
+        activity = json.loads(payloads[0])
+        assert (activity["agent"], activity["message"], activity["type"]) == (
+            "SearchAgent",
+            "Found news",
+            "chat",
+        )
+        # Same ISO wire format as the frontend server's own activities
+        datetime.fromisoformat(activity["timestamp"])
+
+    def test_broadcast_worker_batches_pending_activities(self) -> None:
+        """Test that activities queued together are written in one pipelined call."""
+        redis_handler = Mock()
+
+        async def run() -> None:
+            queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+            with patch(
+                "src.agentic_crypto_influencer.graphflow.graphflow._broadcast_queue", queue
+            ):
+                for index in range(3):
+                    broadcast_to_frontend("GraphFlow", f"event {index}", "info")
+
+            worker = asyncio.create_task(_broadcast_worker(queue, redis_handler))
+            await asyncio.wait_for(queue.join(), timeout=1)
+            worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+
+        asyncio.run(run())
+
+        redis_handler.push_capped.assert_called_once()
+        payloads = redis_handler.push_capped.call_args.args[1]
+        assert [json.loads(payload)["message"] for payload in payloads] == [
+            "event 0",
+            "event 1",
+            "event 2",
+        ]
+
+    def test_broadcast_skips_repeated_activity(self) -> None:
+        """Test that only back-to-back identical activities are collapsed."""
+        queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+        module = "src.agentic_crypto_influencer.graphflow.graphflow"
+        with patch(f"{module}._broadcast_queue", queue), patch(f"{module}._last_broadcast", None):
+            broadcast_to_frontend("Communication", "A → B", "info")
+            broadcast_to_frontend("Communication", "A → B", "info")
+            broadcast_to_frontend("Communication", "A → B", "success")
+            broadcast_to_frontend("Communication", "A → B", "info")
+
+        assert [queue.get_nowait()["type"] for _ in range(queue.qsize())] == [
+            "info",
+            "success",
+            "info",
+        ]
 
 
 class TestAgentConversationProcessing:
@@ -441,6 +544,18 @@ class TestAgentConversationProcessing:
         assert result["type"] == "error"
         assert "Error:" in result["content"]
 
+    def test_format_agent_message_tool_call(self) -> None:
+        """Test that tool calls are detected case-insensitively from the message repr."""
+        mock_message = MagicMock()
+        mock_message.name = "SearchAgent"
+        mock_message.content = "Looking up the latest market data"
+        mock_message.__str__.return_value = "ToolCallRequestEvent(content=...)"
+
+        result = format_agent_message(mock_message, 4, 0)
+
+        assert result is not None
+        assert result["type"] == "info"
+
     def test_format_agent_message_short_content(self) -> None:
         """Test that short messages are filtered out."""
         mock_message = Mock()
@@ -488,6 +603,23 @@ class TestAgentConversationProcessing:
 
         asyncio.run(run_test())
 
+    @patch("src.agentic_crypto_influencer.graphflow.graphflow.format_agent_message")
+    def test_process_agent_conversations_formats_last_three_messages(
+        self, mock_format: Mock
+    ) -> None:
+        """Test that only the last three messages are formatted, numbered from zero."""
+        mock_format.return_value = None
+        mock_event = Mock()
+        mock_event.messages = ["m1", "m2", "m3", "m4", "m5"]
+
+        asyncio.run(process_agent_conversations(mock_event, 7))
+
+        assert mock_format.call_args_list == [
+            call("m3", 7, 0),
+            call("m4", 7, 1),
+            call("m5", 7, 2),
+        ]
+
     @patch("src.agentic_crypto_influencer.graphflow.graphflow.broadcast_to_frontend")
     def test_process_agent_conversations_with_content(self, mock_broadcast: Mock) -> None:
         """Test processing event with content."""
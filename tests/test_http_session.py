@@ -0,0 +1,16 @@
+from requests.adapters import HTTPAdapter
+from src.agentic_crypto_influencer.config.app_constants import HTTP_POOL_MAXSIZE
+from src.agentic_crypto_influencer.tools.http_session import get_http_session
+
+
+def test_get_http_session_returns_pooled_shared_session() -> None:
+    """Test that the HTTP session is shared and mounts a pooled adapter."""
+    get_http_session.cache_clear()
+    try:
+        session = get_http_session()
+        assert session is get_http_session()
+        adapter = session.get_adapter("https://api.twitter.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+    finally:
+        get_http_session.cache_clear()
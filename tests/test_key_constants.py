@@ -2,10 +2,18 @@
 Tests for key_constants module.
 """
 
+import dataclasses
 import os
 from unittest.mock import patch
 
+import pytest
 from src.agentic_crypto_influencer.config.key_constants import (
+    DEFAULT_X_SCOPES,
+    KEYS,
+    X_SCOPES,
+    KeyConfig,
+    _api_key_status,
+    _load_key_config,
     get_api_key_status,
     get_configuration_value,
     validate_required_keys,
@@ -52,28 +60,34 @@ class TestKeyConstants:
             assert result == {"KEY1": False, "KEY2": False}
 
     def test_get_api_key_status(self) -> None:
-        """Test getting API key status."""
-        with patch.dict(
-            os.environ,
-            {
-                "GOOGLE_GENAI_API_KEY": "key1",
-                "GOOGLE_API_KEY": "key2",
-                "X_CLIENT_ID": "key3",
-                "X_CLIENT_SECRET": "key4",
-                "BITVAVO_API_KEY": "key5",
-                "BITVAVO_API_SECRET": "key6",
-            },
-        ):
-            result = get_api_key_status()
-            expected = {
-                "GOOGLE_GENAI_API_KEY": True,
-                "GOOGLE_API_KEY": True,
-                "X_CLIENT_ID": True,
-                "X_CLIENT_SECRET": True,
-                "BITVAVO_API_KEY": True,
-                "BITVAVO_API_SECRET": True,
-            }
-            assert result == expected
+        """Test that the API key status reflects the loaded key snapshot."""
+        # The status reports KEYS, which is read once at import, so patch the
+        # snapshot rather than os.environ
+        keys = dataclasses.replace(
+            KEYS,
+            google_genai_api_key="key1",
+            google_api_key="key2",
+            x_client_id="key3",
+            x_client_secret="key4",
+            bitvavo_api_key="key5",
+            bitvavo_api_secret=None,
+        )
+        _api_key_status.cache_clear()
+        try:
+            with patch("src.agentic_crypto_influencer.config.key_constants.KEYS", keys):
+                result = get_api_key_status()
+                assert get_api_key_status() is not result
+        finally:
+            _api_key_status.cache_clear()
+
+        assert result == {
+            "GOOGLE_GENAI_API_KEY": True,
+            "GOOGLE_API_KEY": True,
+            "X_CLIENT_ID": True,
+            "X_CLIENT_SECRET": True,
+            "BITVAVO_API_KEY": True,
+            "BITVAVO_API_SECRET": False,
+        }
 
     def test_get_api_key_status_missing_keys(self) -> None:
         """Test getting API key status when some keys are missing."""
@@ -92,3 +106,22 @@ class TestKeyConstants:
         }
         assert set(result.keys()) == expected_keys
         assert all(isinstance(value, bool) for value in result.values())
+
+    def test_load_key_config_reads_environment(self) -> None:
+        """Test that the key config snapshot reads values and defaults from the environment."""
+        with patch.dict(
+            os.environ, {"X_CLIENT_ID": "client", "CALLBACK_SERVER_PORT": "8080"}, clear=True
+        ):
+            config = _load_key_config()
+        assert config.x_client_id == "client"
+        assert config.callback_server_port == 8080
+        assert config.redis_url is None
+        assert config.x_scopes == DEFAULT_X_SCOPES
+
+    def test_key_config_is_frozen(self) -> None:
+        """Test that the key config snapshot cannot be mutated."""
+        assert isinstance(KEYS, KeyConfig)
+        assert KEYS.x_scopes == X_SCOPES
+        assert not hasattr(KEYS, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            KEYS.redis_url = "redis://example"  # type: ignore[misc]
@@ -0,0 +1,156 @@
+"""
+Tests for logging_config module.
+"""
+
+import json
+import logging
+from logging.handlers import QueueHandler, RotatingFileHandler
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+import pytest
+from src.agentic_crypto_influencer.config import logging_config
+from src.agentic_crypto_influencer.config.app_constants import LOG_FORMAT_CONSOLE, LOG_FORMAT_JSON
+
+
+@pytest.fixture
+def configured_logging(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> logging.Logger:
+    """Run setup_logging() inside a temporary working directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logging_config, "_logging_configured", False)
+    logging_config.setup_logging()
+    return logging.getLogger("agentic_crypto_influencer")
+
+
+@pytest.mark.unit
+def test_file_handlers_run_behind_queue(configured_logging: logging.Logger) -> None:
+    """Test that the app logger only enqueues records for the rotating file handlers."""
+    handlers = configured_logging.handlers
+    assert not any(isinstance(handler, RotatingFileHandler) for handler in handlers)
+
+    queue_handler = next(handler for handler in handlers if isinstance(handler, QueueHandler))
+    assert queue_handler.listener is logging_config._queue_listener
+    assert all(
+        isinstance(handler, RotatingFileHandler) for handler in queue_handler.listener.handlers
+    )
+
+
+@pytest.mark.unit
+def test_queue_listener_writes_records(configured_logging: logging.Logger) -> None:
+    """Test that queued records reach the log file once the listener is drained."""
+    logging_config.get_logger("tests.logging").info("queued record")
+    logging_config._stop_queue_listener()
+
+    assert "queued record" in Path("logs/app.log").read_text()
+    assert logging_config._queue_listener is None
+
+
+@pytest.mark.unit
+def test_queued_records_keep_exception_field(configured_logging: logging.Logger) -> None:
+    """Test that records passing through the file queue still report their traceback."""
+    queue_handler = next(
+        handler for handler in configured_logging.handlers if isinstance(handler, QueueHandler)
+    )
+    assert isinstance(queue_handler, logging_config.StructuredQueueHandler)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = configured_logging.makeRecord(
+            configured_logging.name,
+            logging.ERROR,
+            __file__,
+            1,
+            "failed %s",
+            ("task",),
+            sys.exc_info(),
+        )
+
+    queued = queue_handler.prepare(record)
+    payload = json.loads(logging_config.StructuredFormatter(output=LOG_FORMAT_JSON).format(queued))
+
+    assert queued.exc_info is None
+    assert payload["message"] == "failed task"
+    assert "ValueError: boom" in payload["exception"]
+
+
+@pytest.mark.unit
+def test_setup_logging_runs_once(configured_logging: logging.Logger) -> None:
+    """Test that repeat setup_logging() calls skip reconfiguration."""
+    handlers = list(configured_logging.handlers)
+    listener = logging_config._queue_listener
+
+    with patch("logging.config.dictConfig") as mock_dict_config:
+        logging_config.setup_logging()
+
+    mock_dict_config.assert_not_called()
+    assert configured_logging.handlers == handlers
+    assert logging_config._queue_listener is listener
+
+
+@pytest.mark.unit
+def test_setup_logging_applies_level_without_mutating_template(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that the configured level is merged in while the shared template stays intact."""
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    template_handlers = set(logging_config._LOGGING_CONFIG_TEMPLATE["handlers"])
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logging_config, "_logging_configured", False)
+
+    logging_config.setup_logging()
+
+    assert logging.getLogger("agentic_crypto_influencer").level == logging.DEBUG
+    assert set(logging_config._LOGGING_CONFIG_TEMPLATE["handlers"]) == template_handlers
+    assert "console" not in logging_config._LOGGING_CONFIG_TEMPLATE["handlers"]
+
+
+@pytest.mark.unit
+def test_json_output_is_valid_json() -> None:
+    """Test that JSON output escapes quotes and newlines in messages."""
+    formatter = logging_config.StructuredFormatter(output=LOG_FORMAT_JSON)
+    record = logging.LogRecord(
+        "agentic_crypto_influencer.test", logging.INFO, __file__, 1, 'say "hi"\nbye', None, None
+    )
+
+    payload = json.loads(formatter.format(record))
+
+    assert payload["message"] == 'say "hi"\nbye'
+    assert payload["level"] == "INFO"
+    assert payload["service"] is None
+
+
+@pytest.mark.unit
+def test_get_log_output_by_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only the development environment logs as plain text."""
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    assert logging_config.get_log_output() == LOG_FORMAT_CONSOLE
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    assert logging_config.get_log_output() == LOG_FORMAT_JSON
+
+
+@pytest.mark.unit
+def test_log_api_call_skips_filtered_levels() -> None:
+    """Test that log_api_call returns before building the record when INFO is filtered."""
+    with patch.object(logging_config, "_api_calls_logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = False
+        logging_config.log_api_call("x_api", "/2/tweets", 201, 12.345)
+        mock_logger.log.assert_not_called()
+
+        mock_logger.isEnabledFor.return_value = True
+        logging_config.log_api_call("x_api", "/2/tweets", 500, 12.345)
+        mock_logger.log.assert_called_once()
+        assert mock_logger.log.call_args.args == (logging.ERROR, "API call to %s", "x_api")
+        assert mock_logger.log.call_args.kwargs["extra"]["duration_ms"] == 12.35
+
+
+@pytest.mark.unit
+def test_logger_mixin_binds_logger_per_class() -> None:
+    """Test that LoggerMixin subclasses get a class-level logger named after the class."""
+
+    class Widget(logging_config.LoggerMixin):
+        pass
+
+    assert Widget.logger is Widget().logger
+    assert Widget.logger.name == f"agentic_crypto_influencer.{__name__}.Widget"
+    assert "logger" in vars(Widget)
@@ -13,7 +13,7 @@ class TestPostHandler:
         assert handler.access_token == access_token
         assert "tweets" in handler.endpoint
 
-    @patch("src.agentic_crypto_influencer.tools.post_handler.requests.post")
+    @patch("requests.Session.post")
     @patch("src.agentic_crypto_influencer.tools.post_handler.logging.info")
     def test_post_message_success(self, mock_logging_info: Mock, mock_requests_post: Mock) -> None:
         """Test successful message posting"""
@@ -39,7 +39,7 @@ class TestPostHandler:
         # Verify return value
         assert result == {"id": "123", "text": "Test post"}
 
-    @patch("src.agentic_crypto_influencer.tools.post_handler.requests.post")
+    @patch("requests.Session.post")
     @patch("src.agentic_crypto_influencer.tools.post_handler.logging.error")
     def test_post_message_empty_post(
         self, mock_logging_error: Mock, mock_requests_post: Mock
@@ -55,7 +55,7 @@ class TestPostHandler:
         assert "between 1 and 280 characters" in str(exc_info.value)
         mock_requests_post.assert_not_called()
 
-    @patch("src.agentic_crypto_influencer.tools.post_handler.requests.post")
+    @patch("requests.Session.post")
     @patch("src.agentic_crypto_influencer.tools.post_handler.logging.error")
     def test_post_message_too_long(
         self, mock_logging_error: Mock, mock_requests_post: Mock
@@ -72,7 +72,7 @@ class TestPostHandler:
         assert "between 1 and 280 characters" in str(exc_info.value)
         mock_requests_post.assert_not_called()
 
-    @patch("src.agentic_crypto_influencer.tools.post_handler.requests.post")
+    @patch("requests.Session.post")
     @patch("src.agentic_crypto_influencer.tools.post_handler.logging.error")
     def test_post_message_request_error(
         self, mock_logging_error: Mock, mock_requests_post: Mock
@@ -95,7 +95,7 @@ class TestPostHandler:
         )
         assert "Request returned an error: 400" in str(exc_info.value)
 
-    @patch("src.agentic_crypto_influencer.tools.post_handler.requests.post")
+    @patch("requests.Session.post")
     @patch("src.agentic_crypto_influencer.tools.post_handler.logging.error")
     def test_post_message_network_error(
         self, mock_logging_error: Mock, mock_requests_post: Mock
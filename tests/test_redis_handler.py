@@ -2,7 +2,7 @@
 Tests for RedisHandler using pytest best practices.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from src.agentic_crypto_influencer.tools.redis_handler import RedisHandler
@@ -31,6 +31,71 @@ def test_set(redis_handler: RedisHandler) -> None:
     redis_handler.redis_client.set.assert_called_with("key", "value", ex=None)  # type: ignore[union-attr]
 
 
+@pytest.mark.unit
+def test_add_scored_capped_pipelines_add_and_trims(redis_handler: RedisHandler) -> None:
+    """Test add_scored_capped adds the member and trims by score and rank in one pipeline."""
+    pipeline = redis_handler.redis_client.pipeline  # type: ignore[union-attr]
+    pipeline.return_value = MagicMock()
+    pipe = pipeline.return_value.__enter__.return_value
+
+    redis_handler.add_scored_capped("key", 42, 100.0, 40.0, 10)
+
+    pipeline.assert_called_once_with(transaction=False)
+    pipe.zadd.assert_called_once_with("key", {42: 100.0})
+    pipe.zremrangebyscore.assert_called_once_with("key", "-inf", "(40.0")
+    pipe.zremrangebyrank.assert_called_once_with("key", 0, -11)
+    pipe.execute.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_members_since_reads_score_window(redis_handler: RedisHandler) -> None:
+    """Test members_since returns the members scored at or above the minimum."""
+    redis_handler.redis_client.zrangebyscore.return_value = [b"1"]  # type: ignore[union-attr]
+
+    assert redis_handler.members_since("key", 40.0) == [b"1"]
+    redis_handler.redis_client.zrangebyscore.assert_called_once_with(  # type: ignore[union-attr]
+        "key", 40.0, "+inf"
+    )
+
+
+@pytest.mark.unit
+def test_push_capped_pipelines_push_and_trim(redis_handler: RedisHandler) -> None:
+    """Test push_capped appends and trims the list in one non-transactional pipeline."""
+    pipeline = redis_handler.redis_client.pipeline  # type: ignore[union-attr]
+    pipeline.return_value = MagicMock()
+    pipe = pipeline.return_value.__enter__.return_value
+
+    redis_handler.push_capped("key", [b"a", b"b"], 10)
+
+    pipeline.assert_called_once_with(transaction=False)
+    pipe.rpush.assert_called_once_with("key", b"a", b"b")
+    pipe.ltrim.assert_called_once_with("key", -10, -1)
+    pipe.execute.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_pop_all_reads_and_deletes_atomically(redis_handler: RedisHandler) -> None:
+    """Test pop_all returns the list items and deletes the key in one transaction."""
+    pipeline = redis_handler.redis_client.pipeline  # type: ignore[union-attr]
+    pipeline.return_value = MagicMock()
+    pipe = pipeline.return_value.__enter__.return_value
+    pipe.execute.return_value = [[b"a", b"b"], 1]
+
+    assert redis_handler.pop_all("key") == [b"a", b"b"]
+    pipeline.assert_called_once_with(transaction=True)
+    pipe.lrange.assert_called_once_with("key", 0, -1)
+    pipe.delete.assert_called_once_with("key")
+
+
+@pytest.mark.unit
+def test_pop_all_redis_error(redis_handler: RedisHandler) -> None:
+    """Test pop_all wraps Redis errors in RuntimeError."""
+    redis_handler.redis_client.pipeline.side_effect = Exception("boom")  # type: ignore[union-attr]
+
+    with pytest.raises(RuntimeError, match="Error popping list 'key' from Redis: boom"):
+        redis_handler.pop_all("key")
+
+
 @pytest.mark.unit
 def test_get_redis_error(redis_handler: RedisHandler) -> None:
     """Test get method with Redis error."""
@@ -2,8 +2,11 @@
 Tests for error_management.retry using pytest best practices.
 """
 
+import asyncio
 from datetime import UTC, datetime
+import threading
 import time
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from src.agentic_crypto_influencer.error_management.exceptions import (
@@ -40,6 +43,61 @@ class TestCircuitBreaker:
         assert cb.failure_count == 0
         assert cb.success_count == 0
 
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_circuit_breaker_counts_concurrent_failures(self) -> None:
+        """Test that failures recorded from many threads are all counted."""
+        cb = CircuitBreaker(failure_threshold=10_000)
+
+        def record_failures() -> None:
+            for _ in range(500):
+                cb._record_failure()
+
+        threads = [threading.Thread(target=record_failures) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cb.failure_count == 4000
+        assert cb.state == CircuitState.CLOSED
+
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_circuit_breaker_success_does_not_clear_concurrent_open(self) -> None:
+        """Test that a success racing a failure that opens the circuit keeps it resettable."""
+        cb = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_success() -> str:
+            started.set()
+            release.wait(timeout=5)
+            return "success"
+
+        def failing_func() -> None:
+            raise APIConnectionError("Test error", service="test", endpoint="/test")
+
+        thread = threading.Thread(target=cb.call, args=(slow_success,))
+        thread.start()
+        assert started.wait(timeout=5)
+        with pytest.raises(APIConnectionError):
+            cb.call(failing_func)
+        assert cb.state == CircuitState.OPEN
+        release.set()
+        thread.join()
+
+        assert cb.last_failure_time is not None
+        assert cb.call(lambda: "recovered") == "recovered"
+        assert cb.state == CircuitState.HALF_OPEN
+
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_circuit_breakers_share_service_logger(self) -> None:
+        """Test that breakers for the same service reuse one logger."""
+        first = CircuitBreaker(service_name="shared_logger_service")
+        second = CircuitBreaker(service_name="shared_logger_service")
+
+        assert first.logger is second.logger
+        assert first.logger.name.endswith("circuit_breaker.shared_logger_service")
+
     @pytest.mark.unit  # type: ignore[misc]
     def test_circuit_breaker_successful_call(self) -> None:
         """Test successful call through circuit breaker."""
@@ -142,6 +200,30 @@ class TestCircuitBreaker:
         assert result == "success"
         assert cb.state == CircuitState.HALF_OPEN  # type: ignore[comparison-overlap]
 
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_circuit_breaker_reset_uses_monotonic_clock(self) -> None:
+        """Test that the reset timeout is measured on the monotonic clock."""
+        cb = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+
+        def failing_func() -> None:
+            raise APIConnectionError("Test error", service="test", endpoint="/test")
+
+        with patch(
+            "src.agentic_crypto_influencer.error_management.retry.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            with pytest.raises(APIConnectionError):
+                cb.call(failing_func)
+            assert cb.last_failure_time == 100.0
+
+            mock_monotonic.return_value = 159.0
+            with pytest.raises(APIConnectionError, match="Circuit breaker is open"):
+                cb.call(lambda: "success")
+
+            mock_monotonic.return_value = 160.0
+            assert cb.call(lambda: "success") == "success"
+            assert cb.state == CircuitState.HALF_OPEN
+
     @pytest.mark.unit  # type: ignore[misc]
     def test_circuit_breaker_closes_after_success_threshold(self) -> None:
         """Test circuit breaker closes after success threshold in half-open."""
@@ -261,6 +343,28 @@ class TestRetryDecorator:
         with pytest.raises(APIConnectionError):
             mixed_errors()
 
+    @pytest.mark.unit  # type: ignore[misc]
+    @pytest.mark.parametrize(
+        "exceptions",
+        [APIConnectionError, (APIConnectionError,), (APITimeoutError, APIConnectionError)],
+    )
+    def test_retry_accepts_class_or_tuple(
+        self, exceptions: type[Exception] | tuple[type[Exception], ...]
+    ) -> None:
+        """Test that single classes, one-element tuples and tuples are all retried."""
+        calls: list[int] = []
+
+        @retry(max_attempts=2, exceptions=exceptions)
+        def flaky_func() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise APIConnectionError("Test error", service="test", endpoint="/test")
+            return "success"
+
+        with patch("src.agentic_crypto_influencer.error_management.retry.time.sleep"):
+            assert flaky_func() == "success"
+        assert len(calls) == 2
+
     @pytest.mark.unit  # type: ignore[misc]
     def test_retry_with_callback(self) -> None:
         """Test retry decorator with on_retry callback."""
@@ -281,6 +385,41 @@ class TestRetryDecorator:
         assert retry_calls[0] == ("APIConnectionError", 1)
         assert retry_calls[1] == ("APIConnectionError", 2)
 
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_retry_skips_info_log_when_filtered(self) -> None:
+        """Test that the retry log record is not built when INFO is filtered out."""
+        calls: list[int] = []
+
+        @retry(max_attempts=2)
+        def flaky_func() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise APIConnectionError("Test error", service="test", endpoint="/test")
+            return "success"
+
+        with (
+            patch("src.agentic_crypto_influencer.error_management.retry.logger") as mock_logger,
+            patch("src.agentic_crypto_influencer.error_management.retry.time.sleep"),
+        ):
+            mock_logger.isEnabledFor.return_value = False
+            assert flaky_func() == "success"
+
+        mock_logger.info.assert_not_called()
+
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_retry_preserves_function_metadata(self) -> None:
+        """Test that the wrapper keeps the wrapped function's name, docstring and signature."""
+
+        def fetch(market: str) -> str:
+            """Fetch a market."""
+            return market
+
+        wrapped = retry(max_attempts=2)(fetch)
+
+        assert wrapped.__name__ == "fetch"
+        assert wrapped.__doc__ == "Fetch a market."
+        assert wrapped.__wrapped__ is fetch  # type: ignore[attr-defined]
+
     @pytest.mark.unit  # type: ignore[misc]
     def test_retry_backoff_delay(self) -> None:
         """Test retry decorator applies backoff delay."""
@@ -308,6 +447,36 @@ class TestAsyncRetry:
 
         assert async_retry is not None
 
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_async_retry_retries_then_raises_non_retryable(self) -> None:
+        """Test that async_retry shares the sync retry decisions."""
+        from src.agentic_crypto_influencer.error_management.retry import async_retry
+
+        calls: list[int] = []
+        retry_calls: list[int] = []
+
+        @async_retry(max_attempts=3, on_retry=lambda e, attempt: retry_calls.append(attempt))
+        async def flaky_func() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise APIConnectionError("Test error", service="test", endpoint="/test")
+            if len(calls) == 2:
+                raise ValidationError("Bad input", field="f", value=1)
+            return "unreachable"
+
+        with (
+            patch(
+                "src.agentic_crypto_influencer.error_management.retry.asyncio.sleep",
+                new=AsyncMock(),
+            ) as mock_sleep,
+            pytest.raises(ValidationError),
+        ):
+            asyncio.run(flaky_func())
+
+        assert len(calls) == 2
+        assert retry_calls == [1]
+        mock_sleep.assert_awaited_once()
+
 
 class TestRetryManager:
     """Test cases for retry manager."""
@@ -344,6 +513,30 @@ class TestRetryManager:
         result = retry_manager.call_with_circuit_breaker("unique_test_service", test_func)
         assert result == "success"
 
+    @pytest.mark.unit  # type: ignore[misc]
+    def test_retry_manager_forwards_positional_and_keyword_args(self) -> None:
+        """Test that positional-only calls and keyword calls both reach the function."""
+
+        def join(a: str, b: str, sep: str = "-") -> str:
+            return f"{a}{sep}{b}"
+
+        cb = retry_manager.get_circuit_breaker("unique_forwarding_service")
+        with patch.object(cb, "call", wraps=cb.call) as mock_call:
+            assert (
+                retry_manager.call_with_circuit_breaker(
+                    "unique_forwarding_service", join, "x", "y"
+                )
+                == "x-y"
+            )
+            mock_call.assert_not_called()
+            assert (
+                retry_manager.call_with_circuit_breaker(
+                    "unique_forwarding_service", join, "x", "y", sep="+"
+                )
+                == "x+y"
+            )
+            mock_call.assert_called_once()
+
     @pytest.mark.unit  # type: ignore[misc]
     def test_retry_manager_reset_circuit_breaker(self) -> None:
         """Test retry manager can reset circuit breaker."""
@@ -3,6 +3,9 @@ Unit tests for scheduler constants module.
 Tests constant definitions and configuration values.
 """
 
+from collections.abc import Mapping
+
+import pytest
 from src.agentic_crypto_influencer.config.scheduler_constants import (
     CRON_PRESETS,
     GRAPHFLOW_STATUS_RUNNING,
@@ -17,7 +20,9 @@ from src.agentic_crypto_influencer.config.scheduler_constants import (
     REDIS_KEY_GRAPHFLOW_STATUS,
     REDIS_KEY_JOBS,
     SCHEDULER_TIMEZONE,
+    TIMEZONE_CODES,
     TIMEZONE_OPTIONS,
+    resolve_timezone,
 )
 
 
@@ -71,7 +76,7 @@ class TestSchedulerConstants:
 
     def test_cron_presets_structure(self) -> None:
         """Test that cron presets have correct structure."""
-        assert isinstance(CRON_PRESETS, dict)
+        assert isinstance(CRON_PRESETS, Mapping)
         assert len(CRON_PRESETS) > 0
 
         for name, expression in CRON_PRESETS.items():
@@ -81,7 +86,7 @@ class TestSchedulerConstants:
 
     def test_timezone_options_structure(self) -> None:
         """Test that timezone options have correct structure."""
-        assert isinstance(TIMEZONE_OPTIONS, list)
+        assert isinstance(TIMEZONE_OPTIONS, tuple)
         assert len(TIMEZONE_OPTIONS) > 0
 
         for timezone_tuple in TIMEZONE_OPTIONS:
@@ -90,6 +95,23 @@ class TestSchedulerConstants:
             assert isinstance(timezone_tuple[0], str)
             assert isinstance(timezone_tuple[1], str)
 
+    def test_timezone_codes_match_options(self) -> None:
+        """Test that the timezone code set mirrors the UI options."""
+        assert frozenset(code for code, _ in TIMEZONE_OPTIONS) == TIMEZONE_CODES
+        assert SCHEDULER_TIMEZONE in TIMEZONE_CODES
+
+    def test_resolve_timezone(self) -> None:
+        """Test that timezone codes and display labels both resolve to the code."""
+        assert resolve_timezone("Europe/London") == "Europe/London"
+        assert resolve_timezone("London (GMT/BST)") == "Europe/London"
+        with pytest.raises(ValueError, match="Unknown timezone"):
+            resolve_timezone("Mars/Olympus_Mons")
+
+    def test_cron_presets_are_read_only(self) -> None:
+        """Test that cron presets cannot be modified at runtime."""
+        with pytest.raises(TypeError):
+            CRON_PRESETS["every_minute"] = "* * * * *"  # type: ignore[index]
+
     def test_default_timezone_is_valid(self) -> None:
         """Test that default timezone is valid."""
         assert isinstance(SCHEDULER_TIMEZONE, str)
@@ -8,7 +8,10 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-from src.agentic_crypto_influencer.tools.scheduler_manager import SchedulerManager
+from src.agentic_crypto_influencer.tools.scheduler_manager import (
+    SchedulerManager,
+    get_cron_trigger,
+)
 
 
 @pytest.fixture
@@ -245,6 +248,39 @@ class TestSchedulerManagerSimple:
 
         assert result is True
 
+    def test_get_cron_trigger_is_cached_per_preset(self) -> None:
+        """Test that preset cron triggers are parsed once per (preset, timezone)."""
+        trigger = get_cron_trigger("daily_9am")
+
+        assert trigger is get_cron_trigger("daily_9am")
+        assert str(trigger.timezone) == "Europe/Amsterdam"
+        assert get_cron_trigger("daily_9am", "UTC") is not trigger
+
+    @patch("src.agentic_crypto_influencer.tools.scheduler_manager.BackgroundScheduler")
+    @patch("src.agentic_crypto_influencer.tools.scheduler_manager.RedisHandler")
+    def test_parse_schedule_preset_uses_cached_trigger(
+        self, mock_redis_class: MagicMock, mock_scheduler_class: MagicMock
+    ) -> None:
+        """Test that preset schedules reuse the cached trigger."""
+        scheduler_manager = SchedulerManager()
+
+        result = scheduler_manager._parse_schedule("preset", "every_hour")  # type: ignore[attr-defined]
+
+        assert result is get_cron_trigger("every_hour")
+        assert scheduler_manager._parse_schedule("preset", "unknown") is None  # type: ignore[attr-defined]
+
+    @patch("src.agentic_crypto_influencer.tools.scheduler_manager.BackgroundScheduler")
+    @patch("src.agentic_crypto_influencer.tools.scheduler_manager.RedisHandler")
+    def test_parse_schedule_custom_cron_uses_scheduler_timezone(
+        self, mock_redis_class: MagicMock, mock_scheduler_class: MagicMock
+    ) -> None:
+        """Test that custom cron expressions run in the scheduler timezone, like presets."""
+        scheduler_manager = SchedulerManager()
+
+        result = scheduler_manager._parse_schedule("cron", "30 8 * * 1-5")  # type: ignore[attr-defined]
+
+        assert str(result.timezone) == "Europe/Amsterdam"
+
     @patch("src.agentic_crypto_influencer.tools.scheduler_manager.BackgroundScheduler")
     @patch("src.agentic_crypto_influencer.tools.scheduler_manager.RedisHandler")
     def test_get_job_function_recurring(
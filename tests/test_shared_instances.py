@@ -0,0 +1,67 @@
+"""
+Tests for the lru_cached factories that hand out process-wide instances.
+"""
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from src.agentic_crypto_influencer.graphflow.graphflow import _get_fallback_redis_handler
+from src.agentic_crypto_influencer.tools.agent_tools import get_length_validation_tool
+from src.agentic_crypto_influencer.tools.bitvavo_handler import get_bitvavo_handler
+from src.agentic_crypto_influencer.tools.dup_check import get_duplicate_checker
+from src.agentic_crypto_influencer.tools.google_grounding_tool import get_google_grounding_tool
+from src.agentic_crypto_influencer.tools.x import get_x
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("factory", "target", "expected_kwargs"),
+    [
+        pytest.param(get_x, "src.agentic_crypto_influencer.tools.x.X", {}, id="x"),
+        pytest.param(
+            get_bitvavo_handler,
+            "src.agentic_crypto_influencer.tools.bitvavo_handler.BitvavoHandler",
+            {},
+            id="bitvavo_handler",
+        ),
+        pytest.param(
+            get_duplicate_checker,
+            "src.agentic_crypto_influencer.tools.dup_check.DuplicateChecker",
+            {},
+            id="duplicate_checker",
+        ),
+        pytest.param(
+            get_google_grounding_tool,
+            "src.agentic_crypto_influencer.tools.google_grounding_tool.GoogleGroundingTool",
+            {},
+            id="google_grounding_tool",
+        ),
+        pytest.param(
+            get_length_validation_tool,
+            "src.agentic_crypto_influencer.tools.agent_tools.FunctionTool",
+            {"name": "validate_length_batch"},
+            id="length_validation_tool",
+        ),
+        pytest.param(
+            _get_fallback_redis_handler,
+            "src.agentic_crypto_influencer.graphflow.graphflow.RedisHandler",
+            {"lazy_connect": True},
+            id="graphflow_fallback_redis_handler",
+        ),
+    ],
+)
+def test_factory_returns_shared_instance(
+    factory: Callable[[], Any], target: str, expected_kwargs: dict[str, Any]
+) -> None:
+    """Test that each factory builds its instance once and reuses it."""
+    factory.cache_clear()  # type: ignore[attr-defined]
+    try:
+        with patch(target) as mock_class:
+            assert factory() is factory()
+
+        mock_class.assert_called_once()
+        assert mock_class.call_args.kwargs.items() >= expected_kwargs.items()
+    finally:
+        factory.cache_clear()  # type: ignore[attr-defined]
@@ -0,0 +1,30 @@
+import asyncio
+import threading
+
+from src.agentic_crypto_influencer.config.app_constants import TOOL_EXECUTOR_THREAD_PREFIX
+from src.agentic_crypto_influencer.tools.tool_executor import run_in_tool_executor
+
+
+def blocking_tool(value: str, repeat: int = 1) -> str:
+    """Return the value repeated along with the executing thread name."""
+    return f"{value * repeat}@{threading.current_thread().name}"
+
+
+def test_run_in_tool_executor_uses_shared_pool() -> None:
+    """Test that wrapped callables run on the named tool executor threads."""
+    wrapped = run_in_tool_executor(blocking_tool)
+
+    result = asyncio.run(wrapped("ab", repeat=2))
+
+    value, thread_name = result.split("@")
+    assert value == "abab"
+    assert thread_name.startswith(TOOL_EXECUTOR_THREAD_PREFIX)
+
+
+def test_run_in_tool_executor_preserves_signature() -> None:
+    """Test that the wrapper keeps the name, docstring and coroutine-ness."""
+    wrapped = run_in_tool_executor(blocking_tool)
+
+    assert wrapped.__name__ == "blocking_tool"
+    assert wrapped.__doc__ == blocking_tool.__doc__
+    assert asyncio.iscoroutinefunction(wrapped)
@@ -12,7 +12,7 @@ class TestTrendsHandler:
         handler = TrendsHandler(access_token)
         assert handler.access_token == access_token
 
-    @patch("src.agentic_crypto_influencer.tools.trends_handler.requests.get")
+    @patch("requests.Session.get")
     @patch("src.agentic_crypto_influencer.tools.trends_handler.logging.info")
     def test_get_personalized_trends_success(
         self, mock_logging_info: Mock, mock_requests_get: Mock
@@ -40,7 +40,7 @@ class TestTrendsHandler:
         # Verify return value
         assert result == {"trends": ["trend1", "trend2"]}
 
-    @patch("src.agentic_crypto_influencer.tools.trends_handler.requests.get")
+    @patch("requests.Session.get")
     @patch("src.agentic_crypto_influencer.tools.trends_handler.logging.error")
     def test_get_personalized_trends_request_error(
         self, mock_logging_error: Mock, mock_requests_get: Mock
@@ -64,7 +64,7 @@ class TestTrendsHandler:
         )
         assert "Trends request returned an error: 401" in str(exc_info.value)
 
-    @patch("src.agentic_crypto_influencer.tools.trends_handler.requests.get")
+    @patch("requests.Session.get")
     @patch("src.agentic_crypto_influencer.tools.trends_handler.logging.error")
     def test_get_personalized_trends_network_error(
         self, mock_logging_error: Mock, mock_requests_get: Mock
@@ -83,7 +83,7 @@ class TestTrendsHandler:
         )
         assert "Error fetching personalized trends" in str(exc_info.value)
 
-    @patch("src.agentic_crypto_influencer.tools.trends_handler.requests.get")
+    @patch("requests.Session.get")
     @patch("src.agentic_crypto_influencer.tools.trends_handler.logging.info")
     def test_get_personalized_trends_with_parameters(
         self, mock_logging_info: Mock, mock_requests_get: Mock
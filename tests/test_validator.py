@@ -64,3 +64,17 @@ def test_validate_length_empty_string_default_min() -> None:
     """Test validation with empty string and default minimum."""
     result = LengthValidator.validate_length("")
     assert result is False
+
+
+@pytest.mark.unit  # type: ignore[misc]
+def test_validate_length_batch_preserves_order() -> None:
+    """Test batch validation returns one result per input, in order."""
+    result = LengthValidator.validate_length_batch(["ok", "", "a" * 281, "a" * 280])
+    assert result == [True, False, False, True]
+
+
+@pytest.mark.unit  # type: ignore[misc]
+def test_validate_length_batch_custom_bounds() -> None:
+    """Test batch validation with custom bounds and empty input."""
+    assert LengthValidator.validate_length_batch(["Hi", "Hello"], min_length=3) == [False, True]
+    assert LengthValidator.validate_length_batch([]) == []
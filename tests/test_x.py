@@ -146,11 +146,9 @@ class TestXComprehensive:
         assert result == expected_trends
         self.mock_trends.get_personalized_trends.assert_called_once_with("user123", 10, None)
 
-    @patch("src.agentic_crypto_influencer.tools.x.ErrorManager")
+    @patch("src.agentic_crypto_influencer.tools.x.error_manager")
     @patch("src.agentic_crypto_influencer.tools.x.X")
-    def test_main_success(
-        self, mock_x_class: MagicMock, mock_error_manager_class: MagicMock
-    ) -> None:
+    def test_main_success(self, mock_x_class: MagicMock, mock_error_manager: MagicMock) -> None:
         """Test main function success path"""
         # Mock the X instance and error manager
         mock_x = Mock()
@@ -158,9 +156,6 @@ class TestXComprehensive:
         mock_x.get_personalized_trends.return_value = {"trends": ["#Bitcoin"]}
         mock_x_class.return_value = mock_x
 
-        mock_error_manager = Mock()
-        mock_error_manager_class.return_value = mock_error_manager
-
         with (
             patch("src.agentic_crypto_influencer.tools.x.X_USER_ID", "test_user_id"),
             patch("src.agentic_crypto_influencer.tools.x.get_logger") as mock_get_logger,
@@ -182,20 +177,15 @@ class TestXComprehensive:
             "Personalized Trends", extra={"trends": {"trends": ["#Bitcoin"]}}
         )
 
-    @patch("src.agentic_crypto_influencer.tools.x.ErrorManager")
+    @patch("src.agentic_crypto_influencer.tools.x.error_manager")
     @patch("src.agentic_crypto_influencer.tools.x.X")
-    def test_main_no_user_id(
-        self, mock_x_class: MagicMock, mock_error_manager_class: MagicMock
-    ) -> None:
+    def test_main_no_user_id(self, mock_x_class: MagicMock, mock_error_manager: MagicMock) -> None:
         """Test main function without user ID"""
         # Mock the X instance and error manager
         mock_x = Mock()
         mock_x.post.return_value = {"id": "123", "text": "Test post"}
         mock_x_class.return_value = mock_x
 
-        mock_error_manager = Mock()
-        mock_error_manager_class.return_value = mock_error_manager
-
         with (
             patch("src.agentic_crypto_influencer.tools.x.X_USER_ID", None),
             patch("src.agentic_crypto_influencer.tools.x.get_logger") as mock_get_logger,
@@ -215,20 +205,16 @@ class TestXComprehensive:
         )
         mock_logger.info.assert_any_call("X_USER_ID not set; skipping personalized trends fetch")
 
-    @patch("src.agentic_crypto_influencer.tools.x.ErrorManager")
+    @patch("src.agentic_crypto_influencer.tools.x.error_manager")
     @patch("src.agentic_crypto_influencer.tools.x.X")
-    def test_main_post_error(
-        self, mock_x_class: MagicMock, mock_error_manager_class: MagicMock
-    ) -> None:
+    def test_main_post_error(self, mock_x_class: MagicMock, mock_error_manager: MagicMock) -> None:
         """Test main function with post error"""
         # Mock the X instance to raise error
         mock_x = Mock()
         mock_x.post.side_effect = ValueError("Invalid post")
         mock_x_class.return_value = mock_x
 
-        mock_error_manager = Mock()
         mock_error_manager.handle_error.return_value = "Handled error message"
-        mock_error_manager_class.return_value = mock_error_manager
 
         with (
             patch("src.agentic_crypto_influencer.tools.x.X_USER_ID", ""),
@@ -249,16 +235,14 @@ class TestXComprehensive:
 
 # Additional tests to improve coverage
 @patch("src.agentic_crypto_influencer.tools.x.get_logger")
-@patch("src.agentic_crypto_influencer.tools.x.ErrorManager")
+@patch("src.agentic_crypto_influencer.tools.x.error_manager")
 @patch("src.agentic_crypto_influencer.tools.x.X")
 def test_main_critical_error(
-    mock_x_class: Mock, mock_error_manager_class: Mock, mock_get_logger: Mock
+    mock_x_class: Mock, mock_error_manager: Mock, mock_get_logger: Mock
 ) -> None:
     """Test main function handles critical errors."""
     # Setup mocks
-    mock_error_manager = Mock()
     mock_error_manager.handle_error.return_value = "Critical error handled"
-    mock_error_manager_class.return_value = mock_error_manager
 
     mock_x = Mock()
     mock_x.post.side_effect = Exception("Critical system error")
@@ -279,16 +263,14 @@ def test_main_critical_error(
 
 @patch("src.agentic_crypto_influencer.tools.x.X_USER_ID", "test_user_123")
 @patch("src.agentic_crypto_influencer.tools.x.get_logger")
-@patch("src.agentic_crypto_influencer.tools.x.ErrorManager")
+@patch("src.agentic_crypto_influencer.tools.x.error_manager")
 @patch("src.agentic_crypto_influencer.tools.x.X")
 def test_main_with_user_id_trends_error(
-    mock_x_class: Mock, mock_error_manager_class: Mock, mock_get_logger: Mock
+    mock_x_class: Mock, mock_error_manager: Mock, mock_get_logger: Mock
 ) -> None:
     """Test main function when trends fetching fails but posting succeeds."""
     # Setup mocks
-    mock_error_manager = Mock()
     mock_error_manager.handle_error.return_value = "Trends error handled"
-    mock_error_manager_class.return_value = mock_error_manager
 
     mock_x = Mock()
     mock_x.post.return_value = {"id": "123", "text": "Post"}
@@ -314,15 +296,13 @@ def test_main_with_user_id_trends_error(
 
 @patch("src.agentic_crypto_influencer.tools.x.X_USER_ID", "")
 @patch("src.agentic_crypto_influencer.tools.x.get_logger")
-@patch("src.agentic_crypto_influencer.tools.x.ErrorManager")
+@patch("src.agentic_crypto_influencer.tools.x.error_manager")
 @patch("src.agentic_crypto_influencer.tools.x.X")
 def test_main_no_user_id(
-    mock_x_class: Mock, mock_error_manager_class: Mock, mock_get_logger: Mock
+    mock_x_class: Mock, mock_error_manager: Mock, mock_get_logger: Mock
 ) -> None:
     """Test main function when X_USER_ID is not set."""
     # Setup mocks
-    mock_error_manager = Mock()
-    mock_error_manager_class.return_value = mock_error_manager
 
     mock_x = Mock()
     mock_x.post.return_value = {"id": "123", "text": "Post"}
@@ -344,15 +324,13 @@ def test_main_no_user_id(
 
 @patch("src.agentic_crypto_influencer.tools.x.X_USER_ID", "test_user_123")
 @patch("src.agentic_crypto_influencer.tools.x.get_logger")
-@patch("src.agentic_crypto_influencer.tools.x.ErrorManager")
+@patch("src.agentic_crypto_influencer.tools.x.error_manager")
 @patch("src.agentic_crypto_influencer.tools.x.X")
 def test_main_successful_with_trends(
-    mock_x_class: Mock, mock_error_manager_class: Mock, mock_get_logger: Mock
+    mock_x_class: Mock, mock_error_manager: Mock, mock_get_logger: Mock
 ) -> None:
     """Test main function successful execution with trends."""
     # Setup mocks
-    mock_error_manager = Mock()
-    mock_error_manager_class.return_value = mock_error_manager
 
     mock_x = Mock()
     mock_x.post.return_value = {"id": "123", "text": "Post"}